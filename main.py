@@ -1,3 +1,4 @@
+import logging
 from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
@@ -5,7 +6,7 @@ from zoneinfo import ZoneInfo
 import discord
 
 from src.base import register_base_events
-from src.client import MyClient
+from src.client import create_client
 from src.config_loading import load_config
 from src.dashboard import register_dashboard_commands
 from src.event import register_event_commands
@@ -13,11 +14,14 @@ from src.category import register_category_commands
 from src.memo import register_memo_commands
 from src.multimedia import register_multimedia_commands
 from src.reminder import register_reminder_commands
+from src.settings import register_settings_commands
+from src.telemetry import configure_logging
 
 
 
 def main():
     config = load_config()
+    configure_logging(config.get("logging"))
     token = config["discord"]["token"]
     mode = (config.get("app", {}).get("mode") or "test").lower()
 
@@ -33,7 +37,7 @@ def main():
 
     project_root = Path(__file__).resolve().parent
 
-    client = MyClient(
+    client = create_client(
         intents=intents,
         mode=mode,
         project_root=project_root,
@@ -53,18 +57,21 @@ def main():
     register_memo_commands(client.tree, client)
     # Dashboard Commands
     register_dashboard_commands(client.tree, client)
+    # Settings Commands
+    register_settings_commands(client.tree, client)
     # Base Components
     register_base_events(client, config)
 
     @client.event
     async def on_ready():
-        from src.memo.reminder_loop import MemoReminderLoop
-        MemoReminderLoop(client).start()
-        print(
-            f"Logged in as {client.user} (id: {client.user.id}) | MODE={mode} | TZ={default_tz_name}"
+        logging.getLogger("main").info(
+            "logged in as %s",
+            client.user,
+            extra={"user_id": client.user.id, "mode": mode, "tz": default_tz_name},
         )
 
-    client.run(token)
+    # logging is already configured above
+    client.run(token, log_handler=None)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from src.event_storage import EventStore
+from src.telemetry.timing import record_store
+from src.write_queue import GroupCommitQueue
+
+
+@dataclass
+class StoreQueueMetrics:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    # back-pressure: callers that had to wait for a free slot
+    backpressure_waits: int = 0
+    backpressure_wait_seconds: float = 0.0
+
+    # executor queue time (submit -> worker picks it up) and run time
+    queue_wait_seconds_total: float = 0.0
+    queue_wait_seconds_max: float = 0.0
+    run_seconds_total: float = 0.0
+
+    def as_dict(self) -> dict:
+        done = self.completed + self.failed
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "backpressure_waits": self.backpressure_waits,
+            "backpressure_wait_ms": round(self.backpressure_wait_seconds * 1000, 3),
+            "queue_wait_ms_avg": round(self.queue_wait_seconds_total / done * 1000, 3) if done else 0.0,
+            "queue_wait_ms_max": round(self.queue_wait_seconds_max * 1000, 3),
+            "run_ms_avg": round(self.run_seconds_total / done * 1000, 3) if done else 0.0,
+        }
+
+
+class AsyncEventStore:
+    """
+    Awaitable facade over EventStore.
+
+    Every public EventStore method is exposed under the same name as a coroutine
+    that runs on a dedicated thread pool, so sqlite never blocks the event loop.
+    At most `max_pending` calls are queued/running at once; extra callers wait
+    (back-pressure) instead of piling up in the executor.
+
+    Once `writes` is set and started, the EventStore.GROUP_COMMIT methods go
+    through that GroupCommitQueue instead of one transaction per call.
+    """
+
+    def __init__(self, store: EventStore, *, workers: int = 4, max_pending: int = 64):
+        self.sync = store
+        self.max_pending = max(1, int(max_pending))
+        self.metrics = StoreQueueMetrics()
+
+        self._executor = ThreadPoolExecutor(max_workers=max(1, int(workers)), thread_name_prefix="store")
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self.writes: GroupCommitQueue | None = None
+
+    def __getattr__(self, name: str):
+        # only reached for names not defined on the facade itself
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        target = getattr(self.sync, name)
+        if not callable(target):
+            return target
+
+        if name in EventStore.GROUP_COMMIT:
+            @functools.wraps(target)
+            async def call(*args, **kwargs):
+                if self.writes is not None and self.writes.running and not args:
+                    return await self.writes.submit(name, **kwargs)
+                return await self.run(target, *args, **kwargs)
+
+            setattr(self, name, call)
+            return call
+
+        @functools.wraps(target)
+        async def call(*args, **kwargs):
+            return await self.run(target, *args, **kwargs)
+
+        setattr(self, name, call)
+        return call
+
+    async def run(self, fn, /, *args, **kwargs):
+        """
+        Run fn(*args, **kwargs) on the store executor.
+        """
+        m = self.metrics
+        m.submitted += 1
+
+        if self._slots.locked():
+            m.backpressure_waits += 1
+            t_wait = time.perf_counter()
+            await self._slots.acquire()
+            m.backpressure_wait_seconds += time.perf_counter() - t_wait
+        else:
+            await self._slots.acquire()
+
+        m.in_flight += 1
+        m.max_in_flight = max(m.max_in_flight, m.in_flight)
+        t_submit = time.perf_counter()
+        method = getattr(fn, "__name__", "call")
+
+        def job():
+            t_start = time.perf_counter()
+            queued = t_start - t_submit
+            m.queue_wait_seconds_total += queued
+            m.queue_wait_seconds_max = max(m.queue_wait_seconds_max, queued)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                m.run_seconds_total += time.perf_counter() - t_start
+
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor, job)
+        except BaseException:
+            m.failed += 1
+            record_store(method, time.perf_counter() - t_submit, ok=False)
+            raise
+        else:
+            m.completed += 1
+            record_store(method, time.perf_counter() - t_submit, result)
+            return result
+        finally:
+            m.in_flight -= 1
+            self._slots.release()
+
+    def stats(self) -> dict:
+        out = {
+            "queue": self.metrics.as_dict(),
+            "connections": self.sync.pool_stats(),
+        }
+        if self.writes is not None:
+            out["group_commit"] = self.writes.metrics.as_dict()
+        return out
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        self.sync.close()
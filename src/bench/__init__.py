@@ -0,0 +1,14 @@
+from src.bench.data import SCALES, Dataset, Scale, generate
+from src.bench.loops import FakeClient, SimClock, bench_loops
+from src.bench.queries import bench_store
+
+__all__ = [
+    "SCALES",
+    "Dataset",
+    "Scale",
+    "generate",
+    "FakeClient",
+    "SimClock",
+    "bench_loops",
+    "bench_store",
+]
@@ -0,0 +1,122 @@
+"""
+Benchmarks for EventStore and the background loops, on synthetic data.
+
+    python -m src.bench [--scale small|medium|full] [--out result.json] [--compare baseline.json]
+
+Generates guilds/events/catalog/memos into a temporary SQLite file, times the
+hot store queries, then drives the reminder and expiry engines over simulated
+time with a fake Discord client. Prints one JSON document; with --compare it
+also lists the timings whose p95 regressed past --threshold and exits 1.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.bench.data import SCALES, generate
+from src.bench.loops import bench_loops
+from src.bench.queries import bench_store
+
+# p95 differences below this are noise on any machine
+_NOISE_MS = 0.5
+
+
+def _p95s(result: dict) -> dict[str, float]:
+    out = {f"store.{name}": r["p95_ms"] for name, r in result.get("store", {}).items()}
+    for loop, r in result.get("loops", {}).items():
+        out[f"loops.{loop}.tick"] = r["tick"]["p95_ms"]
+    return out
+
+
+def compare(result: dict, baseline: dict, threshold: float) -> list[dict]:
+    now, before = _p95s(result), _p95s(baseline)
+    regressions = []
+    for key, p95 in sorted(now.items()):
+        old = before.get(key)
+        if old is None:
+            continue
+        if p95 > old * threshold and p95 - old > _NOISE_MS:
+            regressions.append({"name": key, "baseline_p95_ms": old, "p95_ms": p95, "ratio": round(p95 / old, 2) if old else None})
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--guilds", type=int)
+    parser.add_argument("--events", type=int)
+    parser.add_argument("--views", type=int)
+    parser.add_argument("--memos", type=int)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--iterations", type=int, default=200, help="calls per store query")
+    parser.add_argument("--sim-hours", type=float, default=24.0, help="simulated time for the loop driver")
+    parser.add_argument("--send-latency-ms", type=float, default=0.0, help="fake Discord send latency")
+    parser.add_argument("--skip-loops", action="store_true")
+    parser.add_argument("--keep-db", type=Path, help="also copy the generated database here")
+    parser.add_argument("--out", type=Path, help="write the JSON here instead of stdout")
+    parser.add_argument("--compare", type=Path, help="baseline JSON from an earlier run")
+    parser.add_argument("--threshold", type=float, default=1.5, help="p95 ratio counted as a regression")
+    args = parser.parse_args(argv)
+
+    scale = SCALES[args.scale]
+    overrides = {k: getattr(args, k) for k in ("guilds", "events", "views", "memos") if getattr(args, k)}
+    scale = replace(scale, **overrides)
+
+    result: dict = {
+        "meta": {
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "scale": args.scale,
+            "seed": args.seed,
+            "iterations": args.iterations,
+            "sim_hours": args.sim_hours,
+            "send_latency_ms": args.send_latency_ms,
+        },
+        "dataset": scale.as_dict(),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp) / "bench.db"
+        t0 = time.perf_counter()
+        ds, counts = generate(base, scale, seed=args.seed)
+        result["generate"] = {"seconds": round(time.perf_counter() - t0, 3), "rows": counts}
+        if args.keep_db:
+            shutil.copyfile(base, args.keep_db)
+
+        # every phase writes (deletes, marks reminded): each gets its own copy
+        store_db = Path(tmp) / "store.db"
+        shutil.copyfile(base, store_db)
+        result["store"] = bench_store(replace(ds, path=store_db), iterations=args.iterations, seed=args.seed)
+
+        if not args.skip_loops:
+            loops_db = Path(tmp) / "loops.db"
+            shutil.copyfile(base, loops_db)
+            result["loops"] = bench_loops(loops_db, sim_hours=args.sim_hours, send_latency_ms=args.send_latency_ms)
+
+    status = 0
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        result["regressions"] = compare(result, baseline, args.threshold)
+        status = 1 if result["regressions"] else 0
+
+    text = json.dumps(result, indent=2)
+    if args.out:
+        args.out.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
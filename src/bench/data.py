@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import random
+import sqlite3
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from src.event_storage import EventStore, title_key
+
+# simulated "now" of every benchmark run (fixed, so runs are comparable)
+T0 = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+_WORDS = [
+    "blue", "night", "river", "iron", "summer", "ghost", "paper", "silent", "red", "garden",
+    "star", "winter", "city", "dragon", "glass", "last", "lost", "golden", "wild", "hidden",
+]
+_MEDIA_TYPES = ["movie", "anime", "book", "game", "series"]
+_MEMO_TYPES = ["task", "movie", "anime", "book", "game"]
+
+CHUNK = 20_000
+
+
+@dataclass(frozen=True)
+class Scale:
+    guilds: int
+    events: int
+    views: int
+    memos: int
+    channels_per_guild: int = 20
+    users_per_guild: int = 200
+    categories_per_guild: int = 40
+    # catalog items per guild = views / guilds / views_per_item
+    views_per_item: int = 8
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+SCALES: dict[str, Scale] = {
+    "small": Scale(guilds=50, events=20_000, views=100_000, memos=10_000),
+    "medium": Scale(guilds=200, events=200_000, views=1_000_000, memos=100_000),
+    "full": Scale(guilds=1_000, events=1_000_000, views=5_000_000, memos=500_000),
+}
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """
+    Ids of the generated rows, used to pick realistic arguments.
+    """
+
+    path: Path
+    scale: Scale
+    seed: int
+    guild_ids: list[int]
+
+    def channel_id(self, guild_index: int, n: int) -> int:
+        return self.guild_ids[guild_index] + 1 + n
+
+    def user_id(self, guild_index: int, n: int) -> int:
+        # users are shared between neighbouring guilds, as on real servers
+        return 10**15 + guild_index // 4 * 1000 + n
+
+
+def _iso(dt: datetime) -> str:
+    return dt.isoformat()
+
+
+def _ts(dt: datetime | None) -> int | None:
+    return int(dt.timestamp()) if dt else None
+
+
+def _title(rng: random.Random) -> str:
+    return f"{rng.choice(_WORDS)} {rng.choice(_WORDS)} {rng.randrange(10_000)}"
+
+
+def _insert(conn: sqlite3.Connection, sql: str, rows) -> int:
+    n = 0
+    chunk: list[tuple] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= CHUNK:
+            conn.executemany(sql, chunk)
+            conn.commit()
+            n += len(chunk)
+            chunk.clear()
+    if chunk:
+        conn.executemany(sql, chunk)
+        conn.commit()
+        n += len(chunk)
+    return n
+
+
+def _events(ds: Dataset, rng: random.Random):
+    s = ds.scale
+    for _ in range(s.events):
+        gi = rng.randrange(s.guilds)
+        # starts from 30 days ago to 30 days ahead; expires 2h-3d after the start
+        start = T0 + timedelta(seconds=rng.randrange(-30 * 86400, 30 * 86400))
+        expires = start + timedelta(seconds=rng.randrange(2 * 3600, 3 * 86400))
+        remind_at = reminded = None
+        if rng.random() < 0.3:
+            remind_at = start - timedelta(minutes=rng.choice([10, 15, 30, 60]))
+            reminded = int(remind_at < T0)
+        yield (
+            ds.guild_ids[gi],
+            ds.channel_id(gi, rng.randrange(s.channels_per_guild)),
+            _title(rng),
+            _iso(start),
+            _iso(start + timedelta(hours=2)),
+            None,
+            ds.user_id(gi, rng.randrange(s.users_per_guild)),
+            _iso(expires),
+            f"event-{rng.randrange(1000)}",
+            rng.choice([None, 4, 8, 20]),
+            _iso(remind_at) if remind_at else None,
+            reminded or 0,
+            1,
+            _ts(start),
+            _ts(start + timedelta(hours=2)),
+            _ts(expires),
+            _ts(remind_at),
+        )
+
+
+def _items(ds: Dataset, rng: random.Random, per_guild: int):
+    created = T0 - timedelta(days=365)
+    for gi in range(ds.scale.guilds):
+        for n in range(per_guild):
+            title = f"{_title(rng)} #{n}"
+            yield (
+                ds.guild_ids[gi],
+                rng.choice(_MEDIA_TYPES),
+                title,
+                title_key(title),
+                ds.user_id(gi, rng.randrange(ds.scale.users_per_guild)),
+                _iso(created + timedelta(seconds=rng.randrange(365 * 86400))),
+            )
+
+
+def _views(ds: Dataset, rng: random.Random, items: list[tuple[int, int]], per_guild: int):
+    s = ds.scale
+    by_guild: dict[int, list[int]] = {}
+    for item_id, guild_id in items:
+        by_guild.setdefault(guild_id, []).append(item_id)
+
+    for gi in range(s.guilds):
+        guild_id = ds.guild_ids[gi]
+        guild_items = by_guild.get(guild_id) or []
+        if not guild_items:
+            continue
+        seen: set[tuple[int, int]] = set()
+        # each (item, viewer) pair once; capped by the pairs that exist
+        want = min(per_guild, len(guild_items) * s.users_per_guild)
+        while len(seen) < want:
+            pair = (rng.choice(guild_items), ds.user_id(gi, rng.randrange(s.users_per_guild)))
+            if pair in seen:
+                continue
+            seen.add(pair)
+            watched = int(rng.random() < 0.6)
+            at = T0 - timedelta(seconds=rng.randrange(365 * 86400))
+            yield (
+                guild_id,
+                pair[0],
+                pair[1],
+                watched,
+                _iso(at) if watched else None,
+                "good" if watched and rng.random() < 0.2 else None,
+                _iso(at),
+            )
+
+
+def _memos(ds: Dataset, rng: random.Random):
+    s = ds.scale
+    for _ in range(s.memos):
+        gi = rng.randrange(s.guilds)
+        created = T0 - timedelta(seconds=rng.randrange(90 * 86400))
+        status = rng.choices(["open", "done", "canceled"], weights=[6, 3, 1])[0]
+        due = created + timedelta(days=rng.randrange(1, 60)) if rng.random() < 0.5 else None
+        remind_at = due - timedelta(hours=1) if due and rng.random() < 0.5 else None
+        done_at = created + timedelta(days=rng.randrange(1, 30)) if status == "done" else None
+        yield (
+            ds.guild_ids[gi],
+            ds.user_id(gi, rng.randrange(s.users_per_guild)),
+            rng.choice(_MEMO_TYPES),
+            _title(rng),
+            None,
+            status,
+            _iso(due) if due else None,
+            _iso(remind_at) if remind_at else None,
+            int(bool(remind_at and remind_at < T0)),
+            _iso(created),
+            _iso(done_at or created),
+            _iso(done_at) if done_at else None,
+            int((done_at - created).total_seconds()) if done_at else None,
+            None,
+            _ts(due),
+            _ts(remind_at),
+        )
+
+
+def generate(path: Path, scale: Scale, *, seed: int = 1) -> tuple[Dataset, dict]:
+    """
+    Create the schema at `path` and fill it with synthetic guilds.
+    Returns the dataset and the row counts written.
+    """
+    rng = random.Random(seed)
+    # snowflake-like ids spread over shards
+    guild_ids = [(900_000_000 + i * 7919) << 22 for i in range(scale.guilds)]
+    ds = Dataset(path=path, scale=scale, seed=seed, guild_ids=guild_ids)
+
+    EventStore(path, readers=1).close()  # schema + migrations
+
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA synchronous=OFF;")
+    counts: dict[str, int] = {}
+    try:
+        counts["category_options"] = _insert(
+            conn,
+            "INSERT OR IGNORE INTO event_category_options(guild_id, name) VALUES (?, ?);",
+            ((g, f"{rng.choice(_WORDS)}-{n}") for g in guild_ids for n in range(scale.categories_per_guild)),
+        )
+        counts["events"] = _insert(
+            conn,
+            """
+            INSERT INTO events(
+                guild_id, channel_id, title, start_iso, end_iso, description, created_by,
+                expires_at, channel_name, member_limit, remind_at_iso, reminded, remind_in_channel,
+                start_ts, end_ts, expires_ts, remind_ts
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+            """,
+            _events(ds, rng),
+        )
+
+        per_guild_views = max(1, scale.views // scale.guilds)
+        per_guild_items = max(1, per_guild_views // scale.views_per_item)
+        counts["multimedia_items"] = _insert(
+            conn,
+            """
+            INSERT OR IGNORE INTO multimedia_items(guild_id, media_type, title, title_key, provider_user_id, created_at)
+            VALUES (?, ?, ?, ?, ?, ?);
+            """,
+            _items(ds, rng, per_guild_items),
+        )
+        items = conn.execute("SELECT id, guild_id FROM multimedia_items;").fetchall()
+        counts["multimedia_views"] = _insert(
+            conn,
+            """
+            INSERT INTO multimedia_views(guild_id, item_id, viewer_user_id, watched, watched_at, review, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?);
+            """,
+            _views(ds, rng, items, per_guild_views),
+        )
+        counts["memo_items"] = _insert(
+            conn,
+            """
+            INSERT INTO memo_items(
+                guild_id, owner_user_id, item_type, title, note, status, due_at_iso, remind_at_iso,
+                reminded, created_at, updated_at, done_at_iso, duration_seconds, thoughts, due_ts, remind_ts
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+            """,
+            _memos(ds, rng),
+        )
+    finally:
+        conn.close()
+    return ds, counts
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from src.async_store import AsyncEventStore
+from src.bench.data import T0
+from src.bench.queries import summarize
+from src.event.expiry import ExpiryEngine
+from src.event_storage import EventStore
+from src.memo.reminder_loop import MemoReminderLoop
+from src.reminder.delivery import ReminderDelivery
+from src.reminder.scheduler import ReminderScheduler
+from src.reminder.timer import ReminderTimer, iso_to_ts
+from src.sharding import ShardScope
+
+
+class SimClock:
+    def __init__(self, start: datetime):
+        self.now = start
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def set_ts(self, ts: float) -> None:
+        self.now = datetime.fromtimestamp(ts, tz=timezone.utc)
+
+
+class _FakeMessageable:
+    def __init__(self, client: "FakeClient", id: int):
+        self.client = client
+        self.id = id
+
+    async def send(self, content: str):
+        self.client.sent += 1
+        if self.client.send_latency:
+            await asyncio.sleep(self.client.send_latency)
+
+
+class _FakeTeardown:
+    def __init__(self):
+        self.submitted = 0
+
+    async def submit(self, *, guild_id, kind, channels, reason, **_):
+        self.submitted += len(channels)
+
+
+class FakeClient:
+    """
+    The parts of MyClient the background loops use, with a simulated clock and
+    Discord sends that only count (optionally sleeping `send_latency` seconds).
+    """
+
+    def __init__(self, path: Path, clock: SimClock, *, send_latency: float = 0.0):
+        self.now_time = clock
+        self.config: dict = {}
+        self.shard_scope = ShardScope()
+        self.store = AsyncEventStore(EventStore(path, readers=2), workers=3)
+        self.teardown = _FakeTeardown()
+        self.send_latency = send_latency
+        self.sent = 0
+
+    def get_user(self, user_id: int):
+        return _FakeMessageable(self, int(user_id))
+
+    async def fetch_user(self, user_id: int):
+        return _FakeMessageable(self, int(user_id))
+
+    def get_channel(self, channel_id: int):
+        return _FakeMessageable(self, int(channel_id))
+
+    async def wait_until_ready(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self.store.close()
+
+
+async def _drive_reminders(client: FakeClient, clock: SimClock, end_ts: float, concurrency: int) -> dict:
+    timer = ReminderTimer(client)
+    delivery = ReminderDelivery(client, concurrency=concurrency)
+    timer.register("event", ReminderScheduler(client, delivery=delivery).run_due)
+    timer.register("memo", MemoReminderLoop(client, delivery=delivery).run_due)
+
+    t0 = time.perf_counter()
+    await timer.hydrate()
+    hydrate_s = time.perf_counter() - t0
+    pending = timer.pending()
+    # every reminder is sent at most once, so no more can go out than are due by end_ts
+    times = await client.store.list_pending_reminder_times() + await client.store.list_pending_memo_reminder_times()
+    due = sum(1 for _, remind_at_iso in times if iso_to_ts(remind_at_iso) <= end_ts)
+
+    # ReminderTimer._run, with the sleep replaced by a jump to the next deadline
+    ticks: list[float] = []
+    sent_before = client.sent
+    while True:
+        head = timer.next_due_ts()
+        if head is None or head > end_ts:
+            break
+        clock.set_ts(max(head, clock().timestamp()))
+        t = time.perf_counter()
+        if await timer.step(clock().timestamp()):
+            ticks.append(time.perf_counter() - t)
+
+    sent = client.sent - sent_before
+    if sent > due:
+        raise RuntimeError(f"reminder bench sent {sent} reminders, but only {due} were due in the window")
+
+    return {
+        "hydrate_ms": round(hydrate_s * 1000, 3),
+        "pending_at_start": pending,
+        "due_in_window": due,
+        "wakeups": len(ticks),
+        "sent": sent,
+        "tick": summarize(ticks, sent),
+    }
+
+
+async def _drive_expiry(client: FakeClient, clock: SimClock, end_ts: float, batch_size: int, horizon_seconds: int) -> dict:
+    engine = ExpiryEngine(client, batch_size=batch_size, horizon_seconds=horizon_seconds)
+
+    # the overdue backlog first (a bot coming back after downtime)
+    t0 = time.perf_counter()
+    backlog = await engine.run_due()
+    backlog_s = time.perf_counter() - t0
+
+    # ExpiryEngine._run, with the sleep replaced by a jump to the next wake-up;
+    # a wake-up that only reloaded the horizon is timed as a load
+    ticks: list[float] = []
+    loads: list[float] = []
+    deleted = 0
+    while True:
+        loads_before = engine.metrics.horizon_loads
+        t = time.perf_counter()
+        n = await engine.step(clock().timestamp())
+        elapsed = time.perf_counter() - t
+        if n:
+            deleted += n
+            ticks.append(elapsed)
+        elif engine.metrics.horizon_loads > loads_before:
+            loads.append(elapsed)
+
+        target = engine.next_wakeup_ts()
+        if target > end_ts:
+            break
+        clock.set_ts(max(target, clock().timestamp()))
+
+    return {
+        "backlog_deleted": backlog,
+        "backlog_ms": round(backlog_s * 1000, 3),
+        "horizon_loads": summarize(loads, engine.metrics.horizon_loads),
+        "wakeups": len(ticks),
+        "deleted": deleted,
+        "queries": engine.metrics.queries,
+        "channels_submitted": client.teardown.submitted,
+        "tick": summarize(ticks, deleted),
+    }
+
+
+def bench_loops(
+    path: Path,
+    *,
+    sim_hours: float = 24.0,
+    send_latency_ms: float = 0.0,
+    concurrency: int = 8,
+    batch_size: int = 50,
+    horizon_hours: float = 6.0,
+) -> dict[str, dict]:
+    """
+    Run the reminder and expiry engines over `sim_hours` of simulated time from T0.
+    Wall-clock numbers are the real cost of each wakeup; no time is slept.
+    """
+
+    async def run() -> dict[str, dict]:
+        end_ts = (T0 + timedelta(hours=sim_hours)).timestamp()
+        out: dict[str, dict] = {}
+
+        clock = SimClock(T0)
+        client = FakeClient(path, clock, send_latency=send_latency_ms / 1000)
+        try:
+            out["reminders"] = await _drive_reminders(client, clock, end_ts, concurrency)
+        finally:
+            client.close()
+
+        clock = SimClock(T0)
+        client = FakeClient(path, clock)
+        try:
+            out["expiry"] = await _drive_expiry(client, clock, end_ts, batch_size, int(horizon_hours * 3600))
+        finally:
+            client.close()
+        return out
+
+    return asyncio.run(run())
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from datetime import timedelta
+from typing import Callable
+
+from src.bench.data import _WORDS, T0, Dataset
+from src.category.cache import CategoryOptionCache
+from src.event_storage import EventStore, Page
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * (len(sorted_values) - 1)))))
+    return sorted_values[k]
+
+
+def _rows(result) -> int:
+    if isinstance(result, Page):
+        return len(result.items)
+    if isinstance(result, int):
+        return result
+    try:
+        return len(result)
+    except TypeError:
+        return 1
+
+
+def summarize(samples: list[float], rows: int) -> dict:
+    ms = sorted(s * 1000 for s in samples)
+    return {
+        "calls": len(ms),
+        "rows": rows,
+        "mean_ms": round(sum(ms) / len(ms), 4) if ms else 0.0,
+        "p50_ms": round(_percentile(ms, 50), 4),
+        "p95_ms": round(_percentile(ms, 95), 4),
+        "p99_ms": round(_percentile(ms, 99), 4),
+        "max_ms": round(ms[-1], 4) if ms else 0.0,
+    }
+
+
+def _measure(iterations: int, call: Callable[[int], object]) -> dict:
+    samples: list[float] = []
+    rows = 0
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        result = call(i)
+        samples.append(time.perf_counter() - t0)
+        rows += _rows(result)
+    return summarize(samples, rows)
+
+
+class _DirectStore:
+    """
+    The async store surface CategoryOptionCache loads from, calling EventStore inline.
+    """
+
+    def __init__(self, store: EventStore):
+        self.store = store
+
+    async def list_all_category_options(self, **kwargs):
+        return self.store.list_all_category_options(**kwargs)
+
+
+def bench_store(ds: Dataset, *, iterations: int = 200, seed: int = 1) -> dict[str, dict]:
+    """
+    Time the hot EventStore paths with arguments drawn from the dataset.
+    Calls go straight to EventStore (no executor), so these are query + mapping times.
+    """
+    rng = random.Random(seed)
+    s = ds.scale
+    now = T0.isoformat()
+
+    def guild() -> tuple[int, int]:
+        gi = rng.randrange(s.guilds)
+        return gi, ds.guild_ids[gi]
+
+    def user_in(gi: int) -> int:
+        return ds.user_id(gi, rng.randrange(s.users_per_guild))
+
+    def prefix() -> str:
+        return rng.choice(_WORDS)[: rng.randrange(1, 4)]
+
+    store = EventStore(ds.path, readers=2)
+    results: dict[str, dict] = {}
+    loop = asyncio.new_event_loop()
+    try:
+        def list_active_events(_i):
+            gi, g = guild()
+            return store.list_active_events(
+                guild_id=g, channel_id=ds.channel_id(gi, rng.randrange(s.channels_per_guild)), now_iso=now,
+            )
+
+        def list_events_for_day(_i):
+            _, g = guild()
+            day = T0.replace(hour=0, minute=0) + timedelta(days=rng.randrange(-3, 4))
+            return store.list_events_for_day(
+                guild_id=g, day_start_iso=day.isoformat(), day_end_iso=(day + timedelta(days=1)).isoformat(),
+                now_iso=now,
+            )
+
+        def list_events_for_day_multi(_i):
+            day = T0.replace(hour=0, minute=0)
+            return store.list_events_for_day_multi(
+                guild_ids=ds.guild_ids, day_start_iso=day.isoformat(),
+                day_end_iso=(day + timedelta(days=1)).isoformat(), now_iso=now,
+            )
+
+        def dashboard_me(_i):
+            gi, g = guild()
+            return store.dashboard_me(guild_id=g, user_id=user_in(gi), now_iso=now)
+
+        def dashboard_server(_i):
+            _, g = guild()
+            return store.dashboard_server(guild_id=g, now_iso=now)
+
+        def list_my_multimedia(_i):
+            gi, g = guild()
+            return store.list_my_multimedia(guild_id=g, viewer_user_id=user_in(gi))
+
+        def list_my_multimedia_page2(_i):
+            gi, g = guild()
+            u = user_in(gi)
+            first = store.list_my_multimedia(guild_id=g, viewer_user_id=u, limit=10)
+            if first.next_cursor is None:
+                return first
+            return store.list_my_multimedia(guild_id=g, viewer_user_id=u, limit=10, cursor=first.next_cursor)
+
+        def list_multimedia_items(_i):
+            _, g = guild()
+            return store.list_multimedia_items(guild_id=g)
+
+        # autocomplete paths
+        def autocomplete_item_empty(_i):
+            _, g = guild()
+            return store.search_multimedia_items(guild_id=g, query="", limit=25)
+
+        def autocomplete_item_prefix(_i):
+            _, g = guild()
+            return store.search_multimedia_items(guild_id=g, query=prefix(), limit=25)
+
+        def autocomplete_item_id(_i):
+            _, g = guild()
+            return store.search_multimedia_items(guild_id=g, query=str(rng.randrange(1, 10_000)), limit=25)
+
+        # /event create category autocomplete: served from client.category_cache;
+        # the store query only runs on a cache miss (list_all_category_options)
+        category_cache = CategoryOptionCache(_DirectStore(store))
+
+        def autocomplete_category(_i):
+            _, g = guild()
+            return loop.run_until_complete(category_cache.search(g, prefix()))
+
+        def list_all_category_options(_i):
+            _, g = guild()
+            return store.list_all_category_options(guild_id=g)
+
+        def fetch_due_reminders(_i):
+            return store.fetch_due_reminders(now_iso=now, limit=50)
+
+        def fetch_expired_events(_i):
+            return store.fetch_expired_events(now, limit=50)
+
+        def list_expiry_times(_i):
+            return store.list_expiry_times(until_iso=(T0 + timedelta(hours=6)).isoformat())
+
+        def list_pending_reminder_times(_i):
+            return store.list_pending_reminder_times()
+
+        cases = [
+            list_active_events,
+            list_events_for_day,
+            dashboard_me,
+            dashboard_server,
+            list_my_multimedia,
+            list_my_multimedia_page2,
+            list_multimedia_items,
+            autocomplete_item_empty,
+            autocomplete_item_prefix,
+            autocomplete_item_id,
+            list_all_category_options,
+            fetch_due_reminders,
+            fetch_expired_events,
+        ]
+        for case in cases:
+            results[case.__name__] = _measure(iterations, case)
+
+        # warm cache, as after the first keystroke in each guild
+        for g in ds.guild_ids:
+            loop.run_until_complete(category_cache.get(g))
+        results["autocomplete_category"] = _measure(iterations, autocomplete_category)
+
+        # whole-table background reads: a few calls are enough
+        for case in (list_events_for_day_multi, list_expiry_times, list_pending_reminder_times):
+            results[case.__name__] = _measure(max(1, iterations // 20), case)
+
+        # writes last: the backlog up to T0 once, then each call expires the next minute
+        results["delete_expired_backlog"] = _measure(1, lambda _i: store.delete_expired(now))
+        results["delete_expired"] = _measure(
+            iterations, lambda i: store.delete_expired((T0 + timedelta(minutes=i + 1)).isoformat()),
+        )
+    finally:
+        loop.close()
+        store.close()
+    return results
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+
+def _key(name: str) -> str:
+    return name.casefold()
+
+
+def _grams(s: str, n: int) -> set[str]:
+    return {s[i:i + n] for i in range(len(s) - n + 1)}
+
+
+@dataclass
+class CategoryIndex:
+    """
+    Immutable search index over one guild's category options.
+
+    - `keys` is sorted, so prefix matches are one bisect + a contiguous slice
+    - `grams` maps every 1/2/3-gram of a key to the positions containing it;
+      substring queries intersect the posting sets of the query's n-grams
+      (n = min(3, len(query))) and only verify the survivors
+    """
+
+    names: list[str]
+    keys: list[str] = field(init=False)
+    grams: dict[str, set[int]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        pairs = sorted((_key(n), n) for n in self.names)
+        self.keys = [k for k, _ in pairs]
+        self.names = [n for _, n in pairs]
+
+        self.grams = {}
+        for pos, k in enumerate(self.keys):
+            for n in (1, 2, 3):
+                for g in _grams(k, n):
+                    self.grams.setdefault(g, set()).add(pos)
+
+    def prefix(self, q: str, limit: int) -> list[int]:
+        out: list[int] = []
+        i = bisect_left(self.keys, q)
+        while i < len(self.keys) and len(out) < limit and self.keys[i].startswith(q):
+            out.append(i)
+            i += 1
+        return out
+
+    def substring(self, q: str) -> list[int]:
+        n = min(3, len(q))
+        postings = sorted((self.grams.get(g, set()) for g in _grams(q, n)), key=len)
+        if not postings or not postings[0]:
+            return []
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return sorted(pos for pos in candidates if q in self.keys[pos])
+
+    def search(self, current: str, limit: int = 25) -> list[str]:
+        q = _key((current or "").strip())
+        if not q:
+            return self.names[:limit]
+
+        # prefix matches first, then other substring matches, each in name order
+        hits = self.prefix(q, limit)
+        if len(hits) < limit:
+            seen = set(hits)
+            hits.extend(p for p in self.substring(q) if p not in seen)
+        return [self.names[p] for p in hits[:limit]]
+
+
+class CategoryOptionCache:
+    """
+    Per-guild in-memory copy of event_category_options for autocomplete.
+
+    Loaded lazily on first use and dropped by invalidate() whenever a command
+    adds or deletes an option, so keystrokes never touch SQLite once warm.
+    Concurrent misses for the same guild share one load, and a load that races
+    with an invalidation is not cached.
+    """
+
+    def __init__(self, store, *, max_options: int = 5000):
+        self.store = store
+        self.max_options = max(1, int(max_options))
+
+        self._indexes: dict[int, CategoryIndex] = {}
+        self._loading: dict[int, asyncio.Task] = {}
+        self._generation: dict[int, int] = {}
+
+    def invalidate(self, guild_id: int) -> None:
+        gid = int(guild_id)
+        self._indexes.pop(gid, None)
+        self._loading.pop(gid, None)
+        self._generation[gid] = self._generation.get(gid, 0) + 1
+
+    async def get(self, guild_id: int) -> CategoryIndex:
+        gid = int(guild_id)
+        idx = self._indexes.get(gid)
+        if idx is not None:
+            return idx
+
+        task = self._loading.get(gid)
+        if task is None:
+            task = asyncio.create_task(self._load(gid, self._generation.get(gid, 0)))
+            self._loading[gid] = task
+        return await asyncio.shield(task)
+
+    async def search(self, guild_id: int, current: str, limit: int = 25) -> list[str]:
+        return (await self.get(guild_id)).search(current, limit)
+
+    async def _load(self, gid: int, generation: int) -> CategoryIndex:
+        try:
+            names = await self.store.list_all_category_options(guild_id=gid, limit=self.max_options)
+            idx = CategoryIndex(list(names))
+            if self._generation.get(gid, 0) == generation:
+                self._indexes[gid] = idx
+            return idx
+        finally:
+            if self._generation.get(gid, 0) == generation:
+                self._loading.pop(gid, None)
@@ -21,7 +21,7 @@ def register_category_create(group: app_commands.Group, client) -> None:
             await interaction.response.send_message("Category name cannot be empty.", ephemeral=True)
             return
 
-        if hasattr(client.store, "has_category_option") and client.store.has_category_option(
+        if hasattr(client.store, "has_category_option") and await client.store.has_category_option(
             guild_id=interaction.guild.id,
             name=name,
         ):
@@ -40,5 +40,6 @@ def register_category_create(group: app_commands.Group, client) -> None:
             await interaction.response.send_message(f"Failed to create/find category: {e}", ephemeral=True)
             return
 
-        client.store.add_category_option(guild_id=interaction.guild.id, name=name)
+        await client.store.add_category_option(guild_id=interaction.guild.id, name=name)
+        client.category_cache.invalidate(interaction.guild.id)
         await interaction.response.send_message(f"✅ Category created: **{name}**", ephemeral=True)
@@ -10,12 +10,8 @@ def register_category_delete(group: app_commands.Group, client) -> None:
     async def category_autocomplete(interaction: discord.Interaction, current: str):
         if interaction.guild is None:
             return []
-        if not hasattr(client.store, "list_all_category_options"):
-            return []
 
-        names = client.store.list_all_category_options(guild_id=interaction.guild.id, limit=200)
-        cur = (current or "").lower()
-        matched = [n for n in names if cur in n.lower()][:25]
+        matched = await client.category_cache.search(interaction.guild.id, current)
         return [app_commands.Choice(name=n, value=n) for n in matched]
 
     @group.command(name="delete", description="Delete a category option from DB")
@@ -36,7 +32,8 @@ def register_category_delete(group: app_commands.Group, client) -> None:
             await interaction.response.send_message("Store method `delete_category_option` is missing.", ephemeral=True)
             return
 
-        deleted = client.store.delete_category_option(guild_id=interaction.guild.id, name=name)
+        deleted = await client.store.delete_category_option(guild_id=interaction.guild.id, name=name)
+        client.category_cache.invalidate(interaction.guild.id)
         if deleted:
             await interaction.response.send_message(f"🗑️ Deleted category option: **{name}**", ephemeral=True)
         else:
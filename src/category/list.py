@@ -18,7 +18,7 @@ def register_category_list(group: app_commands.Group, client) -> None:
             await interaction.response.send_message("Store method `list_all_category_options` is missing.", ephemeral=True)
             return
 
-        names = client.store.list_all_category_options(guild_id=interaction.guild.id, limit=200)
+        names = await client.store.list_all_category_options(guild_id=interaction.guild.id, limit=200)
         if not names:
             await interaction.response.send_message(
                 "No categories yet. Create one with `/category create`.",
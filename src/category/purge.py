@@ -6,10 +6,10 @@ from discord import app_commands
 from src.restrictions import only_in_event_create_channel
 
 
-def _is_allowed_purge(interaction: discord.Interaction, client) -> bool:
-    cfg = (getattr(client, "config", {}) or {}).get("category", {}).get("purge", {})
-    allowed_role_ids = set(cfg.get("allowed_role_ids") or [])
-    allowed_user_ids = set(cfg.get("allowed_user_ids") or [])
+async def _is_allowed_purge(interaction: discord.Interaction, client) -> bool:
+    settings = await client.settings.get(interaction.guild.id)
+    allowed_role_ids = settings.purge_role_ids
+    allowed_user_ids = settings.purge_user_ids
 
     if interaction.user is None:
         return False
@@ -36,11 +36,8 @@ def register_category_purge(group: app_commands.Group, client) -> None:
     async def category_autocomplete(interaction: discord.Interaction, current: str):
         if interaction.guild is None:
             return []
-        if not hasattr(client.store, "list_all_category_options"):
-            return []
-        names = client.store.list_all_category_options(guild_id=interaction.guild.id, limit=200)
-        cur = (current or "").lower()
-        matched = [n for n in names if cur in n.lower()][:25]
+
+        matched = await client.category_cache.search(interaction.guild.id, current)
         return [app_commands.Choice(name=n, value=n) for n in matched]
 
     @group.command(
@@ -59,7 +56,7 @@ def register_category_purge(group: app_commands.Group, client) -> None:
             await interaction.response.send_message("Please use this in a server channel.", ephemeral=True)
             return
 
-        if not _is_allowed_purge(interaction, client):
+        if not await _is_allowed_purge(interaction, client):
             await interaction.response.send_message(
                 "⛔ You are not allowed to use `/category purge`.",
                 ephemeral=True,
@@ -74,7 +71,7 @@ def register_category_purge(group: app_commands.Group, client) -> None:
         await interaction.response.defer(ephemeral=True)
 
         if hasattr(client.store, "has_category_option"):
-            if not client.store.has_category_option(guild_id=interaction.guild.id, name=name):
+            if not await client.store.has_category_option(guild_id=interaction.guild.id, name=name):
                 await interaction.followup.send(f"Category option not found in DB: **{name}**", ephemeral=True)
                 return
 
@@ -97,21 +94,44 @@ def register_category_purge(group: app_commands.Group, client) -> None:
             return
 
         if children and force:
-            failed = []
-            for ch in children:
-                try:
-                    await ch.delete(reason=f"Purged by {interaction.user} via /category purge force=true")
-                except Exception:
-                    failed.append(ch.name)
-
-            if failed:
-                await interaction.followup.send(
-                    "⚠️ Deleted some channels but failed on:\n"
-                    + "\n".join([f"- {n}" for n in failed])
-                    + "\nAbort deleting the category itself to avoid half-broken state.",
-                    ephemeral=True,
-                )
-                return
+            # children + the category itself are deleted by the background teardown worker
+            msg = await interaction.followup.send(
+                f"🧹 Purging **{name}**: 0/{len(children)} channels deleted…",
+                ephemeral=True,
+                wait=True,
+            )
+
+            async def on_progress(p: dict, status: str | None):
+                if status is None:
+                    text = f"🧹 Purging **{name}**: {p['done']}/{p['total']} channels deleted…"
+                    if p["failed"]:
+                        text += f" ({p['failed']} failed)"
+                elif status == "done":
+                    text = (
+                        f"🔥 Purged category **{name}**.\n"
+                        f"- Channels deleted: {p['done']}/{p['total']}\n"
+                        f"- Discord category deleted: ✅\n"
+                        f"- DB option deleted: ✅"
+                    )
+                elif p["failed"]:
+                    text = (
+                        f"⚠️ Purge of **{name}** incomplete: {p['failed']} of {p['total']} channels could not be deleted.\n"
+                        f"The category itself was kept to avoid a half-broken state."
+                    )
+                else:
+                    text = f"⚠️ Deleted all {p['total']} channels under **{name}**, but failed to delete the category itself."
+                await msg.edit(content=text)
+
+            await client.teardown.submit(
+                guild_id=interaction.guild.id,
+                kind="purge",
+                channels=[(ch.id, ch.name) for ch in children],
+                reason=f"Purged by {interaction.user} via /category purge force=true",
+                category_id=cat.id,
+                category_name=name,
+                on_progress=on_progress,
+            )
+            return
 
         try:
             await cat.delete(reason=f"Purged by {interaction.user} via /category purge")
@@ -121,7 +141,8 @@ def register_category_purge(group: app_commands.Group, client) -> None:
 
         deleted_db = 0
         if hasattr(client.store, "delete_category_option"):
-            deleted_db = client.store.delete_category_option(guild_id=interaction.guild.id, name=name)
+            deleted_db = await client.store.delete_category_option(guild_id=interaction.guild.id, name=name)
+            client.category_cache.invalidate(interaction.guild.id)
 
         await interaction.followup.send(
             f"🔥 Purged category **{name}**.\n"
@@ -14,7 +14,8 @@ def register_category_sync(group: app_commands.Group, client) -> None:
 
         count = 0
         for c in interaction.guild.categories:
-            client.store.add_category_option(guild_id=interaction.guild.id, name=c.name)
+            await client.store.add_category_option(guild_id=interaction.guild.id, name=c.name)
             count += 1
+        client.category_cache.invalidate(interaction.guild.id)
 
         await interaction.response.send_message(f"✅ Synced {count} Discord categories into DB options.", ephemeral=True)
@@ -1,11 +1,13 @@
 from src.channel.create import create_text_channel
-from src.channel.delete import delete_channel_by_name
+from src.channel.delete import delete_channel, delete_channel_by_name, resolve_channel
 from src.channel.category import get_or_create_category
 from src.channel.voice import create_voice_channel
 
 __all__ = [
     "create_text_channel",
+    "delete_channel",
     "delete_channel_by_name",
+    "resolve_channel",
     "get_or_create_category",
     "create_voice_channel",
 ]
\ No newline at end of file
@@ -1,23 +1,36 @@
 import discord
 
-async def delete_channel_by_name(
+
+def resolve_channel(
     *,
     guild: discord.Guild,
-    channel_name: str,
-    reason: str,
-) -> bool:
-    if not channel_name:
-        return False
+    channel_id: int | None,
+    channel_name: str | None = None,
+) -> discord.abc.GuildChannel | None:
+    """
+    O(1) lookup by snowflake; the name scan is only used when no id was stored
+    (rows written before channel ids were recorded).
+    """
+    if channel_id:
+        return guild.get_channel(int(channel_id))
 
-    channel_name = channel_name.strip()
+    channel_name = (channel_name or "").strip()
     if not channel_name:
-        return False
-
-    channel = (
+        return None
+    return (
         discord.utils.get(guild.text_channels, name=channel_name)
         or discord.utils.get(guild.voice_channels, name=channel_name)
     )
 
+
+async def delete_channel(
+    *,
+    guild: discord.Guild,
+    channel_id: int | None,
+    channel_name: str | None,
+    reason: str,
+) -> bool:
+    channel = resolve_channel(guild=guild, channel_id=channel_id, channel_name=channel_name)
     if channel is None:
         return False
 
@@ -28,5 +41,17 @@ async def delete_channel_by_name(
     if not channel.permissions_for(me).manage_channels:
         raise PermissionError("Bot lacks permission to delete this channel")
 
-    await channel.delete(reason=reason)
+    try:
+        await channel.delete(reason=reason)
+    except discord.NotFound:
+        return False
     return True
+
+
+async def delete_channel_by_name(
+    *,
+    guild: discord.Guild,
+    channel_name: str,
+    reason: str,
+) -> bool:
+    return await delete_channel(guild=guild, channel_id=None, channel_name=channel_name, reason=reason)
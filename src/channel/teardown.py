@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
+
+import discord
+
+from src.channel.delete import delete_channel
+from src.reminder.timer import iso_to_ts
+from src.telemetry.timing import loop_tick
+
+logger = logging.getLogger(__name__)
+
+# on_progress(progress, status): progress = {"total", "done", "failed", "pending"};
+# status is None while running, then "done"/"failed" once the batch is closed
+ProgressCallback = Callable[[dict, str | None], Awaitable[None]]
+
+
+def _utc_iso(dt: datetime | None = None) -> str:
+    return (dt or datetime.now(timezone.utc)).isoformat(timespec="milliseconds")
+
+
+def _is_transient(e: BaseException) -> bool:
+    # PermissionError is an OSError, but a missing permission or guild will not fix itself
+    if isinstance(e, (PermissionError, discord.Forbidden)):
+        return False
+    if isinstance(e, (asyncio.TimeoutError, OSError)):
+        return True
+    if isinstance(e, discord.HTTPException):
+        return e.status == 429 or e.status >= 500
+    return False
+
+
+class ChannelTeardownWorker:
+    """
+    Background channel deletion queue (expired events, /category purge force=true).
+
+    - jobs are persisted in teardown_jobs, so a restart resumes half-finished batches
+    - at most `concurrency` deletions in flight, and `per_guild` per guild, so one
+      big purge cannot monopolise the guild's channel-route rate limits; a guild's
+      jobs only get a task while it has a free slot, so it cannot hold the global
+      slots either
+    - transient failures (5xx, 429, network) retry with exponential backoff and
+      jitter, up to `max_attempts`; a failed job does not stop the rest of its batch
+    - a purge batch deletes its category (and DB option) once every job is done
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        concurrency: int = 4,
+        per_guild: int = 2,
+        max_attempts: int = 6,
+        base_delay_seconds: float = 2.0,
+        max_delay_seconds: float = 300.0,
+        progress_interval_seconds: float = 1.5,
+    ):
+        self.client = client
+        self.per_guild = max(1, int(per_guild))
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay_seconds = max(0.1, float(base_delay_seconds))
+        self.max_delay_seconds = max(self.base_delay_seconds, float(max_delay_seconds))
+        self.progress_interval_seconds = float(progress_interval_seconds)
+
+        self._slots = asyncio.Semaphore(max(1, int(concurrency)))
+        # jobs started per guild; a guild at `per_guild` gets no new task (and its
+        # jobs are left out of the fetch), so it cannot hold the global slots
+        self._guild_running: dict[int, int] = {}
+        self._inflight: set[int] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._finalizing: set[str] = set()
+
+        self._progress: dict[str, ProgressCallback] = {}
+        self._progress_sent: dict[str, float] = {}
+
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for t in list(self._tasks):
+            t.cancel()
+
+    async def submit(
+        self,
+        *,
+        guild_id: int,
+        kind: str,
+        channels: list[tuple[int | None, str | None]],
+        reason: str,
+        category_id: int | None = None,
+        category_name: str | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> str:
+        batch = f"{kind}:{int(guild_id)}:{uuid.uuid4().hex[:12]}"
+        if on_progress is not None:
+            self._progress[batch] = on_progress
+        await self.client.store.enqueue_teardown(
+            batch=batch,
+            guild_id=int(guild_id),
+            kind=kind,
+            channels=channels,
+            reason=reason,
+            category_id=category_id,
+            category_name=category_name,
+        )
+        if not channels:
+            await self._finalize(batch)
+        self._wake.set()
+        return batch
+
+    def _backoff(self, attempts: int, e: BaseException) -> float:
+        retry_after = getattr(e, "retry_after", None)
+        if retry_after:
+            return float(retry_after)
+        delay = min(self.max_delay_seconds, self.base_delay_seconds * (2 ** attempts))
+        return delay * (0.5 + random.random() / 2)
+
+    async def _run(self) -> None:
+        await self.client.wait_until_ready()
+        store = self.client.store
+
+        # resume: batches whose jobs all finished before a restart still need closing
+        for b in await store.list_running_teardown_batches():
+            if (await store.teardown_progress(batch=b.batch))["pending"] == 0:
+                await self._finalize(b.batch)
+
+        while True:
+            try:
+                busy = [g for g, n in self._guild_running.items() if n >= self.per_guild]
+                jobs = await store.fetch_due_teardown_jobs(now_iso=_utc_iso(), limit=50, exclude_guild_ids=busy)
+                for job in jobs:
+                    guild_id = int(job.guild_id)
+                    if job.id in self._inflight or self._guild_running.get(guild_id, 0) >= self.per_guild:
+                        # refetched once one of the guild's jobs finishes (it sets _wake)
+                        continue
+                    self._inflight.add(job.id)
+                    self._guild_running[guild_id] = self._guild_running.get(guild_id, 0) + 1
+                    task = asyncio.create_task(self._run_job(job))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+
+                await self._sleep_until_next()
+
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("ChannelTeardownWorker error")
+                await asyncio.sleep(5)
+
+    async def _sleep_until_next(self) -> None:
+        if self._inflight:
+            # a finishing job wakes us; its retry time may now be the earliest
+            timeout = 60.0
+        else:
+            nxt = await self.client.store.next_teardown_attempt_at()
+            timeout = 3600.0 if nxt is None else iso_to_ts(nxt) - time.time()
+        if timeout <= 0:
+            return
+        self._wake.clear()
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run_job(self, job) -> None:
+        store = self.client.store
+        try:
+            async with self._slots:
+                try:
+                    with loop_tick("teardown"):
+                        deleted = await self._delete(job)
+                    await store.finish_teardown_job(job_id=job.id, ok=True, error=None if deleted else "not found")
+                except Exception as e:
+                    attempts = job.attempts + 1
+                    if _is_transient(e) and attempts < self.max_attempts:
+                        delay = self._backoff(job.attempts, e)
+                        await store.retry_teardown_job(
+                            job_id=job.id,
+                            next_attempt_at=_utc_iso(datetime.now(timezone.utc) + timedelta(seconds=delay)),
+                            error=f"{type(e).__name__}: {e}",
+                        )
+                        logger.info("teardown job %s retry %s in %.1fs: %s", job.id, attempts, delay, e)
+                    else:
+                        await store.finish_teardown_job(job_id=job.id, ok=False, error=f"{type(e).__name__}: {e}")
+                        logger.warning("teardown job %s failed: %s", job.id, e)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("teardown job %s bookkeeping failed", job.id)
+        finally:
+            self._inflight.discard(job.id)
+            guild_id = int(job.guild_id)
+            if self._guild_running.get(guild_id, 0) > 1:
+                self._guild_running[guild_id] -= 1
+            else:
+                self._guild_running.pop(guild_id, None)
+            self._wake.set()
+
+        try:
+            await self._report(job.batch)
+        except Exception:
+            logger.exception("teardown batch %s progress failed", job.batch)
+
+    async def _delete(self, job) -> bool:
+        guild = self.client.get_guild(int(job.guild_id))
+        if guild is None:
+            raise PermissionError("guild not available")
+
+        return await delete_channel(
+            guild=guild,
+            channel_id=job.channel_id,
+            channel_name=job.channel_name,
+            reason=job.reason,
+        )
+
+    async def _report(self, batch: str) -> None:
+        progress = await self.client.store.teardown_progress(batch=batch)
+        if progress["pending"] == 0:
+            await self._finalize(batch)
+            return
+
+        cb = self._progress.get(batch)
+        now = time.monotonic()
+        if cb is not None and now - self._progress_sent.get(batch, 0.0) >= self.progress_interval_seconds:
+            self._progress_sent[batch] = now
+            await self._notify(batch, progress, None)
+
+    async def _notify(self, batch: str, progress: dict, status: str | None) -> None:
+        cb = self._progress.get(batch)
+        if cb is None:
+            return
+        try:
+            await cb(progress, status)
+        except Exception as e:
+            logger.info("teardown progress callback for %s failed: %s", batch, e)
+
+    async def _finalize(self, batch: str) -> None:
+        if batch in self._finalizing:
+            return
+        self._finalizing.add(batch)
+        store = self.client.store
+        try:
+            b = next((x for x in await store.list_running_teardown_batches() if x.batch == batch), None)
+            if b is None:
+                return
+            progress = await store.teardown_progress(batch=batch)
+            status = "done" if progress["failed"] == 0 else "failed"
+
+            if b.kind == "purge" and status == "done":
+                status = await self._delete_category(b)
+
+            await store.close_teardown_batch(batch=batch, status=status)
+            logger.info("teardown batch %s %s (%s)", batch, status, progress)
+            await self._notify(batch, progress, status)
+        finally:
+            self._finalizing.discard(batch)
+            self._progress.pop(batch, None)
+            self._progress_sent.pop(batch, None)
+
+    async def _delete_category(self, b) -> str:
+        guild = self.client.get_guild(int(b.guild_id))
+        if guild is None:
+            return "failed"
+
+        cat = guild.get_channel(int(b.category_id)) if b.category_id else None
+        if cat is not None:
+            try:
+                await cat.delete(reason=f"Purged via /category purge ({b.batch})")
+            except discord.NotFound:
+                pass
+            except Exception as e:
+                logger.warning("failed to delete category %s: %s", b.category_name, e)
+                return "failed"
+
+        if b.category_name:
+            await self.client.store.delete_category_option(guild_id=int(b.guild_id), name=b.category_name)
+            self.client.category_cache.invalidate(int(b.guild_id))
+        return "done"
@@ -1,79 +1,232 @@
 import asyncio
+import logging
 from datetime import datetime
 from pathlib import Path
 
 import discord
-from discord import app_commands
 
-from src.channel import delete_channel_by_name
+from src.async_store import AsyncEventStore
+from src.category.cache import CategoryOptionCache
+from src.channel.teardown import ChannelTeardownWorker
+from src.command_sync import CommandSyncer
+from src.digest import DailyDigest
+from src.event.expiry import ExpiryEngine
 from src.event_storage import EventStore
+from src.memo.reminder_loop import MemoReminderLoop
+from src.reminder.delivery import ReminderDelivery
+from src.reminder.scheduler import ReminderScheduler
+from src.reminder.timer import ReminderTimer
+from src.restrictions import AllowedChannelIndex
+from src.settings.cache import GuildSettingsCache
+from src.sharding import ShardScope
+from src.telemetry import InstrumentedCommandTree, MetricsServer, finish_command, install_http_timing
+from src.write_queue import GroupCommitQueue
+
+logger = logging.getLogger(__name__)
 
 
 class MyClient(discord.Client):
-    def __init__(self, *, intents: discord.Intents, mode: str, project_root: Path, time_now_func, config: dict):
-        super().__init__(intents=intents)
-        self.tree = app_commands.CommandTree(self)
+    def __init__(
+        self,
+        *,
+        intents: discord.Intents,
+        mode: str,
+        project_root: Path,
+        time_now_func,
+        config: dict,
+        **client_options,
+    ):
+        super().__init__(intents=intents, **client_options)
+        self.tree = InstrumentedCommandTree(self)
 
         self.mode = mode
         self.now_time = time_now_func
         self.config = config 
-
-        self.store = EventStore(project_root / "events.db")
-        self._cleanup_task: asyncio.Task | None = None
+        self.shard_scope = ShardScope.from_config(config.get("shard", {}) or {})
+
+        db_cfg = config.get("db", {}) or {}
+        readers = int(db_cfg.get("readers", 4))
+        self.store = AsyncEventStore(
+            EventStore(project_root / "events.db", readers=readers, shard_scope=self.shard_scope),
+            workers=readers + 1,
+            max_pending=int(db_cfg.get("max_pending", 64)),
+        )
+        self.store.writes = GroupCommitQueue(
+            self.store,
+            window_seconds=float(db_cfg.get("group_commit_ms", 5)) / 1000,
+            max_batch=int(db_cfg.get("group_commit_max_batch", 256)),
+            max_pending=int(db_cfg.get("write_queue_size", 1024)),
+        )
+        self.category_cache = CategoryOptionCache(self.store)
+        gs_cfg = config.get("guild_settings", {}) or {}
+        self.settings = GuildSettingsCache(
+            self.store,
+            config,
+            refresh_seconds=float(gs_cfg.get("refresh_seconds", 30)),
+        )
+        self.allowed_channels = AllowedChannelIndex(self)
+        self._backfill_task: asyncio.Task | None = None
+
+        # event + memo reminders share one next-due timer
+        rem_cfg = config.get("reminder", {}) or {}
+        delivery = ReminderDelivery(self, concurrency=int(rem_cfg.get("send_concurrency", 8)))
+        self.reminders = ReminderTimer(self)
+        self.reminders.register(
+            "event",
+            ReminderScheduler(self, delivery=delivery, max_attempts=int(rem_cfg.get("max_attempts", 5))).run_due,
+        )
+        self.reminders.register("memo", MemoReminderLoop(self, delivery=delivery).run_due)
+
+        td_cfg = config.get("teardown", {}) or {}
+        self.teardown = ChannelTeardownWorker(
+            self,
+            concurrency=int(td_cfg.get("concurrency", 4)),
+            per_guild=int(td_cfg.get("per_guild", 2)),
+            max_attempts=int(td_cfg.get("max_attempts", 6)),
+        )
+
+        # ads.enabled / channel are the defaults; guilds can change them with /settings
+        ads_cfg = config.get("ads", {}) or {}
+        self.digest = DailyDigest(
+            self,
+            hour=int(ads_cfg.get("hour", 9)),
+            minute=int(ads_cfg.get("minute", 0)),
+            blessing=ads_cfg.get("blessing") or "",
+            concurrency=int(ads_cfg.get("send_concurrency", 8)),
+            prebuild_seconds=float(ads_cfg.get("prebuild_minutes", 5)) * 60,
+            catch_up_seconds=float(ads_cfg.get("catch_up_hours", 12)) * 3600,
+            retry_seconds=float(ads_cfg.get("retry_minutes", 5)) * 60,
+            max_retries=int(ads_cfg.get("max_retries", 5)),
+        )
+
+        cmd_cfg = config.get("commands", {}) or {}
+        self.command_syncer = CommandSyncer(
+            self,
+            policy=str(cmd_cfg.get("sync", "auto")),
+            dev_guild_ids=cmd_cfg.get("dev_guild_ids") or [],
+        )
+
+        exp_cfg = config.get("expiry", {}) or {}
+        self.expiry = ExpiryEngine(
+            self,
+            batch_size=int(exp_cfg.get("batch_size", 50)),
+            horizon_seconds=int(float(exp_cfg.get("horizon_hours", 6)) * 3600),
+        )
+
+        metrics_cfg = config.get("metrics", {}) or {}
+        self.metrics_server = (
+            MetricsServer(host=str(metrics_cfg.get("host", "127.0.0.1")), port=int(metrics_cfg.get("port", 9108)))
+            if metrics_cfg.get("enabled")
+            else None
+        )
 
     async def setup_hook(self):
-        synced = await self.tree.sync()
-        print(f"[sync] synced {len(synced)} commands: {[c.name for c in synced]}")
-        self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+        install_http_timing(self)
+        self.store.writes.start()
+        if self.metrics_server is not None:
+            await self.metrics_server.start()
+
+        # with several processes, the one running shard 0 owns the (global) command sync
+        if self.shard_scope.runs_shard(0):
+            for r in await self.command_syncer.sync():
+                state = "synced" if r.synced else "unchanged, skipped sync"
+                logger.info(
+                    "command sync %s: %s",
+                    r.scope,
+                    state,
+                    extra={"scope": r.scope, "commands": r.commands, "synced": r.synced, "digest": r.digest[:12]},
+                )
+        self.settings.start()
+        self.teardown.start()
+        self.expiry.start()
+        self._backfill_task = asyncio.create_task(self._backfill_loop())
+        self.reminders.start()
+        self.digest.start()
+        logger.info("daily digest scheduled at %02d:%02d", self.digest.hour, self.digest.minute)
+
+    async def on_app_command_completion(self, interaction: discord.Interaction, command):
+        finish_command(interaction)
+
+    async def on_guild_channel_create(self, channel):
+        self.allowed_channels.on_channel_create(channel)
+
+    async def on_guild_channel_update(self, before, after):
+        self.allowed_channels.on_channel_update(before, after)
+
+    async def on_guild_channel_delete(self, channel):
+        self.allowed_channels.on_channel_delete(channel)
 
     async def close(self):
-        if self._cleanup_task:
-            self._cleanup_task.cancel()
+        self.digest.stop()
+        self.settings.stop()
+        self.expiry.stop()
+        self.teardown.stop()
+        if self._backfill_task:
+            self._backfill_task.cancel()
+        self.reminders.stop()
+        if self.metrics_server is not None:
+            await self.metrics_server.stop()
         await super().close()
-
-    async def _cleanup_loop(self):
-        interval = 10 if self.mode == "test" else 60
-
-        protected_names = set()
-        welcome_name = self.config.get("welcome", {}).get("channel_name")
-        if welcome_name:
-            protected_names.add(welcome_name)
-
-        while True:
+        # commit the writes still queued before the store goes away
+        await self.store.writes.close()
+        await asyncio.to_thread(self.store.close)
+
+    async def _backfill_loop(self):
+        # schema backfills run in small chunks so commands keep getting the writer between them
+        db_cfg = self.config.get("db", {}) or {}
+        batch_size = int(db_cfg.get("backfill_batch_size", 500))
+        pause = float(db_cfg.get("backfill_pause_seconds", 0.05))
+
+        steps = 0
+        try:
+            while await self.store.run_backfill_step(batch_size=batch_size):
+                steps += 1
+                await asyncio.sleep(pause)
+        except asyncio.CancelledError:
+            return
+        except Exception:
+            logger.exception("schema backfill failed")
+            return
+
+        if steps:
+            logger.info("schema backfills finished", extra={"chunks": steps})
+            # rows the backfill reached were invisible to the range queries until now
+            self.expiry.reload()
             try:
-                now_iso = self.now_time().isoformat()
-                expired = self.store.fetch_expired_events(now_iso)
-
-                for ev in expired:
-                    if not ev.channel_name:
-                        continue
-                    if ev.channel_name in protected_names:
-                        print(f"[cleanup] skip protected channel #{ev.channel_name}")
-                        continue
-
-                    guild = self.get_guild(int(ev.guild_id))
-                    if guild is None:
-                        continue
-
-                    try:
-                        deleted = await delete_channel_by_name(
-                            guild=guild,
-                            channel_name=ev.channel_name,
-                            reason=f"Event expired (id={ev.id})",
-                        )
-                        if deleted:
-                            print(f"[cleanup] deleted channel #{ev.channel_name} for event {ev.id}")
-                    except Exception as e:
-                        print(f"[cleanup] failed to delete channel #{ev.channel_name} for event {ev.id}: {e}")
-
-                deleted_rows = self.store.delete_expired(now_iso)
-                if deleted_rows:
-                    print(f"[cleanup] deleted {deleted_rows} expired events from db")
-
-                await asyncio.sleep(interval)
-
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                print(f"[cleanup] error: {e}")
-                await asyncio.sleep(interval)
+                await self.reminders.hydrate()
+            except Exception:
+                logger.exception("reminder re-hydrate after backfill failed")
+
+
+class ShardedClient(MyClient, discord.AutoShardedClient):
+    """
+    MyClient over AutoShardedClient: one process runs several gateway shards
+    (shard.ids of shard.count, or every shard Discord recommends).
+    """
+
+
+def create_client(*, intents: discord.Intents, mode: str, project_root: Path, time_now_func, config: dict) -> MyClient:
+    shard_cfg = config.get("shard", {}) or {}
+    if not shard_cfg.get("enabled"):
+        return MyClient(
+            intents=intents,
+            mode=mode,
+            project_root=project_root,
+            time_now_func=time_now_func,
+            config=config,
+        )
+
+    scope = ShardScope.from_config(shard_cfg)
+    options = {}
+    if scope.shard_count:
+        options["shard_count"] = scope.shard_count
+    if scope.shard_ids is not None:
+        options["shard_ids"] = list(scope.shard_ids)
+    return ShardedClient(
+        intents=intents,
+        mode=mode,
+        project_root=project_root,
+        time_now_func=time_now_func,
+        config=config,
+        **options,
+    )
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+
+import discord
+from discord import app_commands
+
+logger = logging.getLogger(__name__)
+
+
+def _command_dict(cmd, tree: app_commands.CommandTree) -> dict:
+    # discord.py >= 2.4 takes the tree (for localisation); older versions take nothing
+    try:
+        return cmd.to_dict(tree)
+    except TypeError:
+        return cmd.to_dict()
+
+
+def command_tree_payload(tree: app_commands.CommandTree, *, guild: discord.abc.Snowflake | None = None) -> list[dict]:
+    """
+    The payload tree.sync() would upload for `guild` (None: global), in a stable order.
+    """
+    payload = [_command_dict(cmd, tree) for cmd in tree.get_commands(guild=guild)]
+    payload.sort(key=lambda d: (int(d.get("type", 1)), str(d.get("name", ""))))
+    return payload
+
+
+def command_tree_hash(tree: app_commands.CommandTree, *, guild: discord.abc.Snowflake | None = None) -> str:
+    canonical = json.dumps(
+        command_tree_payload(tree, guild=guild),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class SyncResult:
+    scope: str
+    synced: bool
+    commands: int
+    digest: str
+
+
+class CommandSyncer:
+    """
+    Uploads the command tree only when it changed since the last successful sync.
+
+    The sha256 of the canonical payload is stored per scope (application + global
+    or guild) in app_state; a matching hash skips the API call, so restarts with
+    unchanged commands do not wait on (or burn rate limit for) a global sync.
+
+    policy: "auto" (hash-gated), "always", "never".
+    dev_guild_ids: copy the global commands to these guilds and sync only there
+    (guild commands update instantly; meant for development).
+    """
+
+    def __init__(self, client, *, policy: str = "auto", dev_guild_ids: list[int] | None = None):
+        self.client = client
+        self.policy = (policy or "auto").lower()
+        self.dev_guild_ids = [int(g) for g in (dev_guild_ids or [])]
+
+    def _key(self, scope: str) -> str:
+        return f"command_sync:{self.client.application_id}:{scope}"
+
+    async def sync(self) -> list[SyncResult]:
+        tree = self.client.tree
+        if not self.dev_guild_ids:
+            return [await self._sync_scope(tree, None)]
+
+        results = []
+        for guild_id in self.dev_guild_ids:
+            guild = discord.Object(id=guild_id)
+            tree.copy_global_to(guild=guild)
+            results.append(await self._sync_scope(tree, guild))
+        return results
+
+    async def _sync_scope(self, tree: app_commands.CommandTree, guild: discord.Object | None) -> SyncResult:
+        scope = "global" if guild is None else f"guild:{guild.id}"
+        digest = command_tree_hash(tree, guild=guild)
+        count = len(tree.get_commands(guild=guild))
+        key = self._key(scope)
+
+        if self.policy == "never":
+            return SyncResult(scope, False, count, digest)
+        if self.policy != "always" and await self.client.store.get_app_state(key=key) == digest:
+            return SyncResult(scope, False, count, digest)
+
+        synced = await tree.sync(guild=guild)
+        # only remembered once Discord accepted it; a failed sync is retried next start
+        await self.client.store.set_app_state(key=key, value=digest)
+        logger.info("synced %s commands (%s): %s", len(synced), scope, [c.name for c in synced])
+        return SyncResult(scope, True, len(synced), digest)
@@ -26,7 +26,7 @@ def register_me(group: app_commands.Group, client) -> None:
             return
 
         now_iso = client.now_time().isoformat()
-        data = client.store.dashboard_me(
+        data = await client.store.dashboard_me(
             guild_id=interaction.guild.id,
             user_id=interaction.user.id,
             now_iso=now_iso,
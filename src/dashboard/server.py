@@ -12,7 +12,7 @@ def register_server(group: app_commands.Group, client) -> None:
             return
 
         now_iso = client.now_time().isoformat()
-        data = client.store.dashboard_server(guild_id=interaction.guild.id, now_iso=now_iso)
+        data = await client.store.dashboard_server(guild_id=interaction.guild.id, now_iso=now_iso)
 
         e = data["events"]
         m = data["memo"]
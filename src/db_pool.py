@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator
+
+# page cache in KiB (negative value => KiB for PRAGMA cache_size)
+DEFAULT_CACHE_KIB = 16 * 1024
+DEFAULT_MMAP_BYTES = 256 * 1024 * 1024
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+
+
+@dataclass
+class ConnectionStats:
+    name: str
+    open_seconds: float = 0.0
+    checkouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    busy_seconds_total: float = 0.0
+    errors: int = 0
+
+    def as_dict(self) -> dict:
+        avg_wait = self.wait_seconds_total / self.checkouts if self.checkouts else 0.0
+        avg_busy = self.busy_seconds_total / self.checkouts if self.checkouts else 0.0
+        return {
+            "name": self.name,
+            "open_ms": round(self.open_seconds * 1000, 3),
+            "checkouts": self.checkouts,
+            "wait_ms_avg": round(avg_wait * 1000, 3),
+            "wait_ms_max": round(self.wait_seconds_max * 1000, 3),
+            "busy_ms_avg": round(avg_busy * 1000, 3),
+            "errors": self.errors,
+        }
+
+
+@dataclass
+class _PooledConnection:
+    conn: sqlite3.Connection
+    stats: ConnectionStats = field(repr=False)
+
+
+class ConnectionPool:
+    """
+    Long-lived SQLite connections: one writer (serialized by a lock) and a small
+    pool of readers. WAL lets readers run while the writer commits.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        readers: int = 4,
+        cache_kib: int = DEFAULT_CACHE_KIB,
+        mmap_bytes: int = DEFAULT_MMAP_BYTES,
+        busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+        on_connect: Callable[[sqlite3.Connection], None] | None = None,
+    ):
+        self.db_path = db_path
+        self.cache_kib = int(cache_kib)
+        self.mmap_bytes = int(mmap_bytes)
+        self.busy_timeout_ms = int(busy_timeout_ms)
+        self.on_connect = on_connect
+
+        self._closed = False
+        self._writer_lock = threading.Lock()
+        self._writer = self._open("writer")
+
+        self._readers: queue.LifoQueue[_PooledConnection] = queue.LifoQueue()
+        self._all: list[_PooledConnection] = [self._writer]
+        for i in range(max(1, int(readers))):
+            pc = self._open(f"reader-{i}")
+            self._readers.put(pc)
+            self._all.append(pc)
+
+    def _open(self, name: str) -> _PooledConnection:
+        t0 = time.perf_counter()
+        # connections move between executor threads; access is serialized by the pool
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout_ms / 1000, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL;")
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        conn.execute(f"PRAGMA cache_size=-{self.cache_kib};")
+        conn.execute(f"PRAGMA mmap_size={self.mmap_bytes};")
+        conn.execute("PRAGMA temp_store=MEMORY;")
+        conn.execute(f"PRAGMA busy_timeout={self.busy_timeout_ms};")
+        if self.on_connect is not None:
+            self.on_connect(conn)
+        stats = ConnectionStats(name=name, open_seconds=time.perf_counter() - t0)
+        return _PooledConnection(conn=conn, stats=stats)
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """
+        Exclusive access to the writer connection.
+        Commits on success, rolls back on error.
+        """
+        if self._closed:
+            raise RuntimeError("ConnectionPool is closed")
+        t0 = time.perf_counter()
+        with self._writer_lock:
+            pc = self._writer
+            yield from _checkout(pc, t0, commit=True)
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        if self._closed:
+            raise RuntimeError("ConnectionPool is closed")
+        t0 = time.perf_counter()
+        pc = self._readers.get()
+        try:
+            yield from _checkout(pc, t0, commit=False)
+        finally:
+            self._readers.put(pc)
+
+    def stats(self) -> list[dict]:
+        return [pc.stats.as_dict() for pc in self._all]
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        with self._writer_lock:
+            for pc in self._all:
+                try:
+                    pc.conn.close()
+                except sqlite3.Error:
+                    pass
+
+
+def _checkout(pc: _PooledConnection, t0: float, *, commit: bool):
+    """
+    Generator body shared by writer()/reader(): records wait/busy time and
+    finishes the transaction.
+    """
+    waited = time.perf_counter() - t0
+    st = pc.stats
+    st.checkouts += 1
+    st.wait_seconds_total += waited
+    st.wait_seconds_max = max(st.wait_seconds_max, waited)
+
+    t1 = time.perf_counter()
+    try:
+        yield pc.conn
+        if commit:
+            pc.conn.commit()
+        elif pc.conn.in_transaction:
+            pc.conn.rollback()
+    except BaseException:
+        st.errors += 1
+        if pc.conn.in_transaction:
+            pc.conn.rollback()
+        raise
+    finally:
+        st.busy_seconds_total += time.perf_counter() - t1
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+import discord
+
+from src.reminder.delivery import ReminderDelivery
+from src.telemetry.timing import loop_tick
+
+logger = logging.getLogger(__name__)
+
+
+def _channel_url(guild_id: int, channel_id: int) -> str:
+    return f"https://discord.com/channels/{guild_id}/{channel_id}"
+
+
+def _parse_iso(dt_str: str, default_tz) -> datetime:
+    d = datetime.fromisoformat(dt_str)
+    if d.tzinfo is None:
+        d = d.replace(tzinfo=default_tz)
+    return d
+
+
+def _get_ads_channel(
+    guild: discord.Guild,
+    *,
+    channel_id: Optional[int],
+    channel_name: Optional[str],
+) -> Optional[discord.TextChannel]:
+    if channel_id:
+        ch = guild.get_channel(int(channel_id))
+        return ch if isinstance(ch, discord.TextChannel) else None
+
+    if channel_name:
+        ch = discord.utils.get(guild.text_channels, name=channel_name)
+        return ch
+
+    return None
+
+
+def build_digest_message(guild_id: int, day: date, tz, events, blessing: str = "") -> str:
+    lines = [f"📣 **{day.isoformat()} 今日活动**"]
+
+    if not events:
+        lines.append("- 今天暂无已发布活动 🤖")
+    else:
+        for e in events:
+            try:
+                start_dt = _parse_iso(e.start_iso, tz)
+                ts = int(start_dt.timestamp())
+                ch_mention = f"<#{e.channel_id}>"
+                ch_url = _channel_url(guild_id, e.channel_id)
+
+                extras = []
+                if getattr(e, "channel_name", None):
+                    extras.append(f"频道：{e.channel_name}")
+                if getattr(e, "member_limit", None) is not None:
+                    extras.append(f"人数上限：{e.member_limit}")
+
+                extra_part = f"（{'，'.join(extras)}）" if extras else ""
+
+                lines.append(
+                    f"- **{e.title}** • <t:{ts}:t> • {ch_mention} • {ch_url} {extra_part}".rstrip()
+                )
+            except Exception:
+                lines.append("- （有一条活动信息格式不对，被我吞了）")
+
+    if blessing:
+        lines.append("")
+        lines.append(f"✨ {blessing}")
+
+    return "\n".join(lines)
+
+
+@dataclass
+class DigestJob:
+    guild_id: int
+    channel_id: int
+    content: str
+
+
+class DailyDigest:
+    """
+    Posts each guild's "today's events" digest at ads.hour:ads.minute (time.default_tz),
+    to guilds whose settings have ads_enabled, in their ads channel.
+
+    - messages are built `prebuild_seconds` before the send time with one
+      multi-guild query (list_events_for_day_multi), so the send itself is only
+      Discord calls
+    - the send time is computed from the wall clock in the configured zone, so it
+      stays at the same local time across DST changes
+    - guilds are sent to concurrently (at most `concurrency` in flight)
+    - every delivery is recorded in digest_deliveries; a digest that was due
+      within the last `catch_up_seconds` and has guilds without a 'sent' record
+      (after a restart, or a failed send) is sent late, every `retry_seconds`,
+      at most `max_retries` times a day
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        hour: int = 9,
+        minute: int = 0,
+        blessing: str = "",
+        concurrency: int = 8,
+        prebuild_seconds: float = 300.0,
+        catch_up_seconds: float = 12 * 3600,
+        retry_seconds: float = 300.0,
+        max_retries: int = 5,
+    ):
+        self.client = client
+        self.hour = int(hour)
+        self.minute = int(minute)
+        self.blessing = (blessing or "").strip()
+        self.prebuild_seconds = max(0.0, float(prebuild_seconds))
+        self.catch_up_seconds = max(0.0, float(catch_up_seconds))
+        self.retry_seconds = max(1.0, float(retry_seconds))
+        self.max_retries = max(0, int(max_retries))
+        self.delivery = ReminderDelivery(client, concurrency=concurrency)
+
+        self._caught_up: date | None = None
+        self._retries: tuple[date | None, int] = (None, 0)
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _tz(self):
+        return self.client.now_time().tzinfo
+
+    def send_time(self, day: date) -> datetime:
+        # wall-clock time in the zone: the UTC offset of that day is applied by zoneinfo
+        return datetime(day.year, day.month, day.day, self.hour, self.minute, tzinfo=self._tz())
+
+    async def _sleep_until(self, ts: float) -> None:
+        # short steps, so a suspended host or a clock change does not oversleep
+        while True:
+            remaining = ts - time.time()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(remaining, 300.0))
+
+    async def prebuild(self, day: date, at: datetime) -> list[DigestJob]:
+        guilds: dict[int, discord.TextChannel] = {}
+        for guild in self.client.guilds:
+            # other bot processes post for the guilds on their shards
+            if not self.client.shard_scope.owns(guild.id):
+                continue
+            settings = await self.client.settings.get(guild.id)
+            if not settings.ads_enabled:
+                continue
+            channel = _get_ads_channel(
+                guild,
+                channel_id=settings.ads_channel_id,
+                channel_name=settings.ads_channel_name,
+            )
+            if channel is None:
+                logger.info("ads channel not found in guild=%s", guild.name)
+                continue
+            if not channel.permissions_for(guild.me).send_messages:
+                logger.info("no permission in #%s (guild=%s)", channel.name, guild.name)
+                continue
+            guilds[guild.id] = channel
+
+        sent = await self.client.store.list_sent_digests(digest_date=day.isoformat())
+        todo = [g for g in guilds if g not in sent]
+        if not todo:
+            return []
+
+        tz = self._tz()
+        day_start = datetime(day.year, day.month, day.day, tzinfo=tz)
+        next_day = day + timedelta(days=1)
+        day_end = datetime(next_day.year, next_day.month, next_day.day, tzinfo=tz)
+
+        events = await self.client.store.list_events_for_day_multi(
+            guild_ids=todo,
+            day_start_iso=day_start.isoformat(),
+            day_end_iso=day_end.isoformat(),
+            now_iso=at.isoformat(),
+            limit=50,
+        )
+        return [
+            DigestJob(
+                guild_id=g,
+                channel_id=guilds[g].id,
+                content=build_digest_message(g, day, tz, events.get(g, []), self.blessing),
+            )
+            for g in todo
+        ]
+
+    async def deliver(self, day: date, jobs: list[DigestJob]) -> int:
+        message_ids: dict[int, int] = {}
+
+        async def send_one(job: DigestJob) -> bool:
+            ch = self.client.get_channel(job.channel_id)
+            if ch is None:
+                return False
+            async with self.delivery.route(f"channel:{job.channel_id}"):
+                msg = await ch.send(job.content)
+            message_ids[job.guild_id] = msg.id
+            return True
+
+        result = await self.delivery.run_batch("digest", jobs, send_one)
+        await self.client.store.record_digest_deliveries(
+            digest_date=day.isoformat(),
+            rows=[(j.guild_id, j.channel_id, message_ids.get(j.guild_id), None) for j in result.sent]
+            + [(j.guild_id, j.channel_id, None, "send failed") for j in result.failed],
+        )
+        logger.info("daily digest %s: sent=%s failed=%s", day.isoformat(), len(result.sent), len(result.failed))
+        return len(result.sent)
+
+    async def run_for(self, day: date) -> int:
+        at = self.send_time(day)
+        jobs = await self.prebuild(day, max(at, self.client.now_time()))
+        return await self.deliver(day, jobs) if jobs else 0
+
+    async def _catch_up(self, day: date) -> bool:
+        """
+        Send `day`'s digest to the guilds that have no 'sent' record yet.
+        True when some were still missing, i.e. check again after `retry_seconds`.
+        """
+        jobs = await self.prebuild(day, max(self.send_time(day), self.client.now_time()))
+        if not jobs:
+            self._caught_up = day
+            return False
+
+        retry_day, retries = self._retries
+        if retry_day != day:
+            retries = 0
+        if retries >= self.max_retries:
+            logger.warning("daily digest %s: giving up on %s guilds", day.isoformat(), len(jobs))
+            self._caught_up = day
+            return False
+        self._retries = (day, retries + 1)
+
+        with loop_tick("digest:deliver"):
+            await self.deliver(day, jobs)
+        return True
+
+    async def _run(self) -> None:
+        await self.client.wait_until_ready()
+
+        while True:
+            try:
+                now = self.client.now_time()
+                today = now.date()
+                at = self.send_time(today)
+                if at <= now:
+                    # today's send time has passed (restart, or some guilds were not sent):
+                    # the day is caught up once every target guild has a 'sent' record
+                    if self._caught_up != today and (now - at).total_seconds() <= self.catch_up_seconds:
+                        if await self._catch_up(today):
+                            await asyncio.sleep(self.retry_seconds)
+                            continue
+                    at = self.send_time(today + timedelta(days=1))
+
+                await self._sleep_until(at.timestamp() - self.prebuild_seconds)
+                with loop_tick("digest:prebuild"):
+                    jobs = await self.prebuild(at.date(), at)
+
+                await self._sleep_until(at.timestamp())
+                if jobs:
+                    with loop_tick("digest:deliver"):
+                        sent = await self.deliver(at.date(), jobs)
+                    if sent < len(jobs):
+                        await asyncio.sleep(self.retry_seconds)
+                # the next pass checks list_sent_digests and retries the guilds not sent
+
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("daily digest error")
+                await asyncio.sleep(60)
@@ -18,13 +18,7 @@ def register_create(group: app_commands.Group, client):
         if interaction.guild is None:
             return []
 
-        if not hasattr(client.store, "list_all_category_options"):
-            names = client.store.list_category_options(guild_id=interaction.guild.id, limit=200)
-        else:
-            names = client.store.list_all_category_options(guild_id=interaction.guild.id, limit=200)
-
-        cur = (current or "").lower()
-        matched = [n for n in names if cur in n.lower()][:25]
+        matched = await client.category_cache.search(interaction.guild.id, current)
         return [app_commands.Choice(name=n, value=n) for n in matched]
 
     async def channel_type_autocomplete(interaction: discord.Interaction, current: str):
@@ -113,12 +107,12 @@ def register_create(group: app_commands.Group, client):
                 return
 
             if hasattr(client.store, "has_category_option"):
-                ok = client.store.has_category_option(guild_id=interaction.guild.id, name=category)
+                ok = await client.store.has_category_option(guild_id=interaction.guild.id, name=category)
             else:
                 if hasattr(client.store, "list_all_category_options"):
-                    names = client.store.list_all_category_options(guild_id=interaction.guild.id, limit=500)
+                    names = await client.store.list_all_category_options(guild_id=interaction.guild.id, limit=500)
                 else:
-                    names = client.store.list_category_options(guild_id=interaction.guild.id, limit=500)
+                    names = await client.store.list_category_options(guild_id=interaction.guild.id, limit=500)
                 ok = category in set(names)
 
             if not ok:
@@ -175,7 +169,7 @@ def register_create(group: app_commands.Group, client):
                 return
 
         display_channel = created_channel or interaction.channel
-        ev = client.store.create_event(
+        ev = await client.store.create_event(
             guild_id=interaction.guild.id,
             channel_id=display_channel.id,  # ✅ created_channel.id 或当前频道 id
             title=title,
@@ -184,9 +178,13 @@ def register_create(group: app_commands.Group, client):
             description=description,
             created_by=interaction.user.id,
             expires_at=expires_dt.isoformat(),
-            channel_name=(display_channel.name if isinstance(display_channel, discord.abc.GuildChannel) else None),
+            # only a channel the bot created is torn down on expiry; never the invoking one
+            channel_name=created_channel.name if created_channel is not None else None,
             member_limit=member_limit,
+            managed_channel_id=created_channel.id if created_channel is not None else None,
+            managed_channel_type=channel_type if created_channel is not None else None,
         )
+        client.expiry.schedule(ev.id, ev.expires_at)
 
         embed = discord.Embed(title=f"✅ Event created: {ev.title}")
         embed.add_field(name="Start", value=start_dt.strftime("%Y-%m-%d %H:%M"), inline=True)
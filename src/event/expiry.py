@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.reminder.timer import iso_to_ts
+from src.telemetry.timing import loop_tick
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ExpiryMetrics:
+    processed: int = 0
+    batches: int = 0
+    queries: int = 0
+    horizon_loads: int = 0
+
+    # lag = when the row was actually handled - its expires_at
+    lag_seconds_total: float = 0.0
+    lag_seconds_max: float = 0.0
+    lag_seconds_last: float = 0.0
+
+    def observe(self, lag: float) -> None:
+        lag = max(0.0, lag)
+        self.processed += 1
+        self.lag_seconds_total += lag
+        self.lag_seconds_max = max(self.lag_seconds_max, lag)
+        self.lag_seconds_last = lag
+
+    def as_dict(self) -> dict:
+        return {
+            "processed": self.processed,
+            "batches": self.batches,
+            "queries": self.queries,
+            "horizon_loads": self.horizon_loads,
+            "lag_ms_avg": round(self.lag_seconds_total / self.processed * 1000, 3) if self.processed else 0.0,
+            "lag_ms_max": round(self.lag_seconds_max * 1000, 3),
+            "lag_ms_last": round(self.lag_seconds_last * 1000, 3),
+        }
+
+
+class ExpiryEngine:
+    """
+    Deletes expired events (and their channels) at their expires_at.
+
+    Deadlines up to `horizon_seconds` ahead are kept in a min-heap, loaded with
+    one range query on idx_events_expires_ts; the engine sleeps until the earliest
+    deadline (or the horizon, whichever is first), so an idle bot issues one
+    query per horizon. New events are added with schedule(). As in
+    ReminderTimer, the heap is only a wake-up hint: due rows are read back from
+    the DB in batches of `batch_size`.
+    """
+
+    def __init__(self, client, *, batch_size: int = 50, horizon_seconds: int = 6 * 3600):
+        self.client = client
+        self.batch_size = max(1, int(batch_size))
+        self.horizon_seconds = max(60, int(horizon_seconds))
+        self.metrics = ExpiryMetrics()
+
+        self._heap: list[tuple[float, int]] = []
+        self._due: dict[int, float] = {}
+        self._horizon_ts = 0.0
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+        self.protected_names: set[str] = set()
+        welcome_name = (client.config.get("welcome", {}) or {}).get("channel_name")
+        if welcome_name:
+            self.protected_names.add(welcome_name)
+
+    def schedule(self, event_id: int, expires_at_iso: str) -> None:
+        try:
+            ts = iso_to_ts(expires_at_iso)
+        except ValueError:
+            logger.warning("bad expires_at for event #%s: %r", event_id, expires_at_iso)
+            return
+        # beyond the horizon: picked up by the next horizon load
+        if ts > self._horizon_ts:
+            return
+        self._push(int(event_id), ts)
+
+    def pending(self) -> int:
+        return len(self._due)
+
+    def next_due_ts(self) -> float | None:
+        self._drop_stale_head()
+        return self._heap[0][0] if self._heap else None
+
+    def next_wakeup_ts(self) -> float:
+        head = self.next_due_ts()
+        return self._horizon_ts if head is None else min(head, self._horizon_ts)
+
+    def stats(self) -> dict:
+        return {**self.metrics.as_dict(), "pending": self.pending(), "next_due_ts": self.next_due_ts()}
+
+    def reload(self) -> None:
+        """
+        Re-read the deadlines on the next wake-up (e.g. after a schema backfill).
+        """
+        self._horizon_ts = 0.0
+        self._wake.set()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _now_iso(self) -> str:
+        return self.client.now_time().isoformat()
+
+    def _now_ts(self) -> float:
+        return self.client.now_time().timestamp()
+
+    def _push(self, event_id: int, ts: float) -> None:
+        self._due[event_id] = ts
+        heapq.heappush(self._heap, (ts, event_id))
+        if self._heap[0] == (ts, event_id):
+            self._wake.set()
+
+    def _drop_stale_head(self) -> None:
+        while self._heap:
+            ts, event_id = self._heap[0]
+            if self._due.get(event_id) == ts:
+                return
+            heapq.heappop(self._heap)
+
+    def _pop_due(self, now_ts: float) -> int:
+        n = 0
+        while True:
+            self._drop_stale_head()
+            if not self._heap or self._heap[0][0] > now_ts:
+                return n
+            _, event_id = heapq.heappop(self._heap)
+            del self._due[event_id]
+            n += 1
+
+    async def _load_horizon(self) -> None:
+        now = self._now_ts()
+        horizon_ts = now + self.horizon_seconds
+        until_iso = datetime.fromtimestamp(horizon_ts, tz=self.client.now_time().tzinfo).isoformat()
+
+        rows = await self.client.store.list_expiry_times(until_iso=until_iso)
+        self.metrics.queries += 1
+        self.metrics.horizon_loads += 1
+
+        self._horizon_ts = horizon_ts
+        for event_id, expires_at in rows:
+            self.schedule(event_id, expires_at)
+        logger.info("ExpiryEngine loaded %s deadlines (horizon %ss)", len(rows), self.horizon_seconds)
+
+    async def _sleep_until_next(self) -> None:
+        timeout = self.next_wakeup_ts() - time.time()
+        if timeout <= 0:
+            return
+        self._wake.clear()
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def step(self, now_ts: float) -> int:
+        """
+        One wake-up at `now_ts`: reload the deadlines once the horizon is reached, then
+        expire what is due. Returns rows deleted.
+        """
+        if now_ts >= self._horizon_ts:
+            await self._load_horizon()
+            # anything already overdue (e.g. expired while offline) is in the heap now
+        if not self._pop_due(now_ts):
+            return 0
+        with loop_tick("expiry"):
+            return await self.run_due()
+
+    async def run_due(self) -> int:
+        """
+        Expire everything that is due now, in bounded batches. Returns rows deleted.
+        """
+        total = 0
+        while True:
+            now_iso = self._now_iso()
+            batch = await self.client.store.fetch_expired_events(now_iso, limit=self.batch_size)
+            self.metrics.queries += 1
+            if not batch:
+                return total
+
+            await self._teardown(batch)
+
+            total += await self.client.store.delete_events(event_ids=[ev.id for ev in batch])
+            self.metrics.queries += 1
+            self.metrics.batches += 1
+
+            handled = self._now_ts()
+            for ev in batch:
+                try:
+                    self.metrics.observe(handled - iso_to_ts(ev.expires_at))
+                except ValueError:
+                    pass
+                self._due.pop(int(ev.id), None)
+
+            logger.info(
+                "expired %s events (lag last=%.3fs max=%.3fs)",
+                len(batch), self.metrics.lag_seconds_last, self.metrics.lag_seconds_max,
+            )
+            if len(batch) < self.batch_size:
+                return total
+
+    async def _teardown(self, batch) -> None:
+        # channels are deleted by the teardown worker (persisted, retried), so the
+        # rows can go right away
+        by_guild: dict[int, list[tuple[int | None, str | None]]] = {}
+        for ev in batch:
+            if not ev.managed_channel_id and not ev.channel_name:
+                continue
+            if ev.channel_name in self.protected_names:
+                logger.info("skip protected channel #%s", ev.channel_name)
+                continue
+            # by id when the bot created the channel; legacy rows only have the name
+            by_guild.setdefault(int(ev.guild_id), []).append((ev.managed_channel_id, ev.channel_name))
+
+        for guild_id, channels in by_guild.items():
+            await self.client.teardown.submit(
+                guild_id=guild_id,
+                kind="expiry",
+                channels=channels,
+                reason="Event expired",
+            )
+
+    async def _run(self) -> None:
+        await self.client.wait_until_ready()
+
+        while True:
+            try:
+                await self.step(time.time())
+                await self._sleep_until_next()
+
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("ExpiryEngine error")
+                # deadlines popped for a failed batch are gone from the heap: reload them
+                self._horizon_ts = 0.0
+                await asyncio.sleep(5)
@@ -13,7 +13,7 @@ def register_list(group: app_commands.Group, client):
         limit = max(1, min(20, limit))
         now_iso = client.now_time().isoformat()
 
-        events = client.store.list_active_events(
+        events = await client.store.list_active_events(
             guild_id=interaction.guild.id,
             channel_id=interaction.channel.id,
             now_iso=now_iso,
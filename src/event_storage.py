@@ -1,15 +1,65 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import base64
+import json
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import sqlite3
+import unicodedata
 from pathlib import Path
-from typing import List
+from itertools import islice
+from typing import Callable, Generic, Iterable, Iterator, List, TypeVar
+
+from src import migrations
+from src.db_pool import ConnectionPool
+from src.sharding import ShardScope
+
+
+T = TypeVar("T")
 
 
 def _utc_iso_now() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
+
+def _epoch(iso: str | None) -> int | None:
+    """
+    ISO 8601 (any offset; naive = UTC) -> UTC epoch seconds, as stored in the *_ts columns.
+    """
+    if iso is None:
+        return None
+    d = datetime.fromisoformat(iso)
+    if d.tzinfo is None:
+        d = d.replace(tzinfo=timezone.utc)
+    return int(d.timestamp() // 1)
+
+
+def title_key(title: str | None) -> str:
+    """
+    Catalog dedup key: NFKC, casefolded, punctuation and runs of whitespace
+    folded to one space ("Spirited  Away", "spirited away!" -> "spirited away").
+    """
+    s = unicodedata.normalize("NFKC", title or "").casefold()
+    folded = "".join(" " if unicodedata.category(c).startswith("P") else c for c in s)
+    # a title of only punctuation keeps it, so "..." and "?!" stay distinct
+    return " ".join(folded.split()) or " ".join(s.split())
+
+
+def _encode_cursor(direction: str, key: str, row_id: int) -> str:
+    raw = json.dumps([direction, key, int(row_id)], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(token: str) -> tuple[str, str, int]:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        direction, key, row_id = json.loads(raw)
+        if direction not in ("n", "p"):
+            raise ValueError(direction)
+        return direction, str(key), int(row_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"invalid cursor: {token!r}") from e
+
 @dataclass
 class MemoItem:
     id: int
@@ -50,6 +100,11 @@ class Event:
     reminded: int = 0
     remind_in_channel: int = 1
 
+    # channel created for the event by the bot (None: no channel, or a legacy row
+    # that only recorded channel_name)
+    managed_channel_id: int | None = None
+    managed_channel_type: str | None = None
+
 
 @dataclass
 class MultimediaItem:
@@ -77,159 +132,162 @@ class IdTitle:
     id: int
     title: str
 
-class EventStore:
-    def __init__(self, db_path: Path):
-        self.db_path = db_path
-        self._init_db()
-
-    def _connect(self):
-        return sqlite3.connect(self.db_path)
-
-    def _init_db(self):
-        with self._connect() as conn:
-            # --- events ---
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS events (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER NOT NULL,
-                    channel_id INTEGER NOT NULL,
-                    title TEXT NOT NULL,
-                    start_iso TEXT NOT NULL,
-                    end_iso TEXT,
-                    description TEXT,
-                    created_by INTEGER NOT NULL,
-                    expires_at TEXT NOT NULL,
-                    channel_name TEXT,
-                    member_limit INTEGER
-                );
-                """
-            )
-
-            existing_cols = {r[1] for r in conn.execute("PRAGMA table_info(events);").fetchall()}
-
-            if "remind_at_iso" not in existing_cols:
-                conn.execute("ALTER TABLE events ADD COLUMN remind_at_iso TEXT;")
-
-            if "reminded" not in existing_cols:
-                conn.execute("ALTER TABLE events ADD COLUMN reminded INTEGER NOT NULL DEFAULT 0;")
-
-            if "remind_in_channel" not in existing_cols:
-                conn.execute("ALTER TABLE events ADD COLUMN remind_in_channel INTEGER NOT NULL DEFAULT 1;")
-
-            # --- category options ---
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS event_category_options (
-                    guild_id INTEGER NOT NULL,
-                    name TEXT NOT NULL,
-                    PRIMARY KEY (guild_id, name)
-                );
-                """
-            )
-
-            # --- multimedia items (catalog) ---
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS multimedia_items (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER NOT NULL,
-
-                    media_type TEXT NOT NULL,
-                    title TEXT NOT NULL,
-
-                    provider_user_id INTEGER NOT NULL,
-                    created_at TEXT NOT NULL,
-
-                    UNIQUE (guild_id, media_type, title)
-                );
-                """
-            )
-            conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_mm_items_guild_type
-                ON multimedia_items(guild_id, media_type);
-                """
-            )
-            conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_mm_items_guild_created
-                ON multimedia_items(guild_id, created_at);
-                """
-            )
 
-            # --- multimedia views (per-user state) --- (NO FK)
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS multimedia_views (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+@dataclass
+class TeardownJob:
+    id: int
+    batch: str
+    guild_id: int
+    channel_id: int | None
+    channel_name: str | None
+    reason: str
+    attempts: int
 
-                    guild_id INTEGER NOT NULL,
-                    item_id INTEGER NOT NULL,          -- logical ref to multimedia_items.id
-                    viewer_user_id INTEGER NOT NULL,
 
-                    watched INTEGER NOT NULL DEFAULT 0,
-                    watched_at TEXT,
-                    review TEXT,
+@dataclass
+class TeardownBatch:
+    batch: str
+    guild_id: int
+    kind: str
+    category_id: int | None
+    category_name: str | None
+    status: str
 
-                    created_at TEXT NOT NULL,
 
-                    UNIQUE (guild_id, item_id, viewer_user_id)
-                );
-                """
-            )
-            conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_mm_views_guild_item
-                ON multimedia_views(guild_id, item_id);
-                """
-            )
-            conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_mm_views_guild_viewer
-                ON multimedia_views(guild_id, viewer_user_id);
-                """
-            )
+@dataclass
+class Page(Generic[T]):
+    """
+    One keyset page. Cursors are opaque tokens: pass next_cursor for older rows,
+    prev_cursor for newer ones; None means there is nothing in that direction.
+    """
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
 
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS memo_items (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+class EventStore:
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        readers: int = 4,
+        on_connect: Callable[[sqlite3.Connection], None] | None = None,
+        shard_scope: ShardScope | None = None,
+    ):
+        self.db_path = db_path
+        # background queries (expiry, reminders, teardown) only see this process's shards
+        self.shard_scope = shard_scope or ShardScope()
+        self._shard_sql = self.shard_scope.sql()
+        self._on_connect_hook = on_connect
+        self._pool = ConnectionPool(db_path, readers=readers, on_connect=self._on_connect)
+        # set once the mm_title_key backfill has made title_key unique
+        self._title_keys_ready = False
+        self._init_db()
 
-                    guild_id INTEGER NOT NULL,
-                    owner_user_id INTEGER NOT NULL,
+    def _on_connect(self, conn: sqlite3.Connection) -> None:
+        conn.create_function("title_key", 1, title_key, deterministic=True)
+        if self._on_connect_hook is not None:
+            self._on_connect_hook(conn)
 
-                    item_type TEXT NOT NULL,          -- task/movie/anime/book/game/...
-                    title TEXT NOT NULL,
-                    note TEXT,
+    def _read(self):
+        return self._pool.reader()
 
-                    status TEXT NOT NULL DEFAULT 'open',   -- open/done/canceled
+    def _write(self):
+        return self._pool.writer()
 
-                    due_at_iso TEXT,          -- optional
-                    remind_at_iso TEXT,       -- optional
-                    reminded INTEGER NOT NULL DEFAULT 0,   -- 0/1
+    def pool_stats(self) -> list[dict]:
+        return self._pool.stats()
 
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL,
+    def close(self) -> None:
+        self._pool.close()
 
-                    done_at_iso TEXT,
-                    duration_seconds INTEGER,
-                    thoughts TEXT              -- enforce <= 9999 in code
-                );
-                """
-            )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_memo_owner_status ON memo_items(guild_id, owner_user_id, status);"
-            )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_memo_remind ON memo_items(status, reminded, remind_at_iso);"
-            )
+    def _init_db(self):
+        with self._write() as conn:
+            migrations.migrate(conn)
+
+    # small one-row writes that AsyncEventStore coalesces into shared transactions
+    # (see src/write_queue.py); each has a _<name>(conn, **kwargs) body
+    GROUP_COMMIT = frozenset({
+        "upsert_multimedia_view",
+        "add_category_option",
+        "mark_event_reminded",
+        "mark_memo_reminded",
+    })
+
+    def group_commit(self, writes: list[tuple[str, dict]]) -> list[object]:
+        """
+        Run several GROUP_COMMIT writes as one transaction. Each gets its own
+        savepoint: a write that fails is rolled back alone and its exception is
+        returned in its slot; the others still commit.
+        """
+        results: list[object] = []
+        with self._write() as conn:
+            conn.execute("BEGIN IMMEDIATE;")
+            for name, kwargs in writes:
+                if name not in self.GROUP_COMMIT:
+                    results.append(ValueError(f"not a group-commit write: {name}"))
+                    continue
+                conn.execute("SAVEPOINT gc_write;")
+                try:
+                    results.append(getattr(self, f"_{name}")(conn, **kwargs))
+                except Exception as e:
+                    conn.execute("ROLLBACK TO gc_write;")
+                    results.append(e)
+                conn.execute("RELEASE gc_write;")
+        return results
+
+    def run_backfill_step(self, *, batch_size: int = 500) -> bool:
+        """
+        One chunk of pending data backfill (short write transaction). False when nothing is left.
+        """
+        with self._write() as conn:
+            return migrations.run_backfill_step(conn, batch_size=batch_size)
 
-            conn.commit()
+    def schema_version(self) -> int:
+        with self._read() as conn:
+            return migrations.current_version(conn)
 
+    # -----------------------
+    # keyset pagination (newest first by (key, id))
+    # -----------------------
+    @staticmethod
+    def _keyset(cursor: str | None, key_sql: str, id_sql: str) -> tuple[str | None, list[object], str, bool]:
+        """
+        -> (extra WHERE term, its params, ORDER BY, backwards)
+        """
+        if cursor is None:
+            return None, [], f"{key_sql} DESC, {id_sql} DESC", False
+        direction, key, row_id = _decode_cursor(cursor)
+        # spelled out instead of a row-value comparison so SQLite can seek on
+        # expression index columns (COALESCE(watched_at, created_at)) too
+        if direction == "n":
+            seek = f"{key_sql} <= ? AND ({key_sql} < ? OR {id_sql} < ?)"
+            return seek, [key, key, row_id], f"{key_sql} DESC, {id_sql} DESC", False
+        seek = f"{key_sql} >= ? AND ({key_sql} > ? OR {id_sql} > ?)"
+        return seek, [key, key, row_id], f"{key_sql} ASC, {id_sql} ASC", True
+
+    @staticmethod
+    def _make_page(rows: list[tuple[T, str, int]], *, limit: int, cursor: str | None, backwards: bool) -> Page[T]:
+        """
+        rows: (item, key, id) in query order, fetched with LIMIT limit + 1.
+        """
+        more = len(rows) > limit
+        rows = rows[:limit]
+        if backwards:
+            rows.reverse()
+        if not rows:
+            return Page()
+
+        has_older = True if backwards else more
+        has_newer = more if backwards else cursor is not None
+        first, last = rows[0], rows[-1]
+        return Page(
+            items=[r[0] for r in rows],
+            next_cursor=_encode_cursor("n", last[1], last[2]) if has_older else None,
+            prev_cursor=_encode_cursor("p", first[1], first[2]) if has_newer else None,
+        )
 
     def list_category_options(self, *, guild_id: int, limit: int = 25) -> list[str]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """
                 SELECT name
@@ -243,7 +301,7 @@ class EventStore:
         return [r[0] for r in rows]
 
     def list_all_category_options(self, *, guild_id: int, limit: int = 200) -> list[str]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """
                 SELECT name
@@ -257,24 +315,27 @@ class EventStore:
         return [r[0] for r in rows]
 
     def add_category_option(self, *, guild_id: int, name: str) -> None:
+        with self._write() as conn:
+            self._add_category_option(conn, guild_id=guild_id, name=name)
+
+    @staticmethod
+    def _add_category_option(conn: sqlite3.Connection, *, guild_id: int, name: str) -> None:
         name = (name or "").strip()
         if not name:
             return
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT OR IGNORE INTO event_category_options (guild_id, name)
-                VALUES (?, ?);
-                """,
-                (guild_id, name),
-            )
-            conn.commit()
+        conn.execute(
+            """
+            INSERT OR IGNORE INTO event_category_options (guild_id, name)
+            VALUES (?, ?);
+            """,
+            (guild_id, name),
+        )
 
     def has_category_option(self, *, guild_id: int, name: str) -> bool:
         name = (name or "").strip()
         if not name:
             return False
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 """
                 SELECT 1
@@ -290,7 +351,7 @@ class EventStore:
         name = (name or "").strip()
         if not name:
             return 0
-        with self._connect() as conn:
+        with self._write() as conn:
             cur = conn.execute(
                 """
                 DELETE FROM event_category_options
@@ -298,7 +359,6 @@ class EventStore:
                 """,
                 (guild_id, name),
             )
-            conn.commit()
             return cur.rowcount
 
     # -----------------------
@@ -317,15 +377,24 @@ class EventStore:
         expires_at: str,
         channel_name: str | None,
         member_limit: int | None,
+        managed_channel_id: int | None = None,
+        managed_channel_type: str | None = None,
     ) -> Event:
-        with self._connect() as conn:
+        """
+        managed_channel_id / managed_channel_type: the channel the bot created for
+        this event (deleted by id when the event expires); also registered in
+        bot_managed_channels.
+        """
+        with self._write() as conn:
             cur = conn.execute(
                 """
                 INSERT INTO events (
                     guild_id, channel_id, title, start_iso, end_iso,
-                    description, created_by, expires_at, channel_name, member_limit
+                    description, created_by, expires_at, channel_name, member_limit,
+                    managed_channel_id, managed_channel_type,
+                    start_ts, end_ts, expires_ts
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     guild_id,
@@ -338,11 +407,32 @@ class EventStore:
                     expires_at,
                     channel_name,
                     member_limit,
+                    managed_channel_id,
+                    managed_channel_type,
+                    _epoch(start_iso),
+                    _epoch(end_iso),
+                    _epoch(expires_at),
                 ),
             )
-            conn.commit()
             event_id = cur.lastrowid
 
+            if managed_channel_id is not None:
+                conn.execute(
+                    """
+                    INSERT INTO bot_managed_channels (channel_id, guild_id, channel_type, name, event_id, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(channel_id) DO UPDATE SET event_id = excluded.event_id;
+                    """,
+                    (
+                        int(managed_channel_id),
+                        guild_id,
+                        managed_channel_type or "text",
+                        channel_name or "",
+                        event_id,
+                        _utc_iso_now(),
+                    ),
+                )
+
         return Event(
             id=event_id,
             guild_id=guild_id,
@@ -355,8 +445,23 @@ class EventStore:
             expires_at=expires_at,
             channel_name=channel_name,
             member_limit=member_limit,
+            managed_channel_id=managed_channel_id,
+            managed_channel_type=managed_channel_type,
         )
 
+    def is_managed_channel(self, *, channel_id: int) -> bool:
+        with self._read() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM bot_managed_channels WHERE channel_id = ? LIMIT 1;",
+                (int(channel_id),),
+            ).fetchone()
+        return row is not None
+
+    def forget_managed_channel(self, *, channel_id: int) -> int:
+        with self._write() as conn:
+            cur = conn.execute("DELETE FROM bot_managed_channels WHERE channel_id = ?;", (int(channel_id),))
+            return cur.rowcount
+
     def list_active_events(
         self,
         *,
@@ -365,20 +470,21 @@ class EventStore:
         now_iso: str,
         limit: int = 20,
     ) -> List[Event]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """
                 SELECT id, guild_id, channel_id, title, start_iso, end_iso,
                        description, created_by, expires_at, channel_name, member_limit,
-                       remind_at_iso, reminded, remind_in_channel
+                       remind_at_iso, reminded, remind_in_channel,
+                       managed_channel_id, managed_channel_type
                 FROM events
                 WHERE guild_id = ?
                   AND channel_id = ?
-                  AND expires_at > ?
-                ORDER BY start_iso ASC
+                  AND expires_ts > ?
+                ORDER BY start_ts ASC
                 LIMIT ?
                 """,
-                (guild_id, channel_id, now_iso, limit),
+                (guild_id, channel_id, _epoch(now_iso), limit),
             ).fetchall()
 
         return [
@@ -397,6 +503,8 @@ class EventStore:
                 remind_at_iso=r[11],
                 reminded=r[12],
                 remind_in_channel=r[13],
+                managed_channel_id=r[14],
+                managed_channel_type=r[15],
             )
             for r in rows
         ]
@@ -410,21 +518,22 @@ class EventStore:
         now_iso: str,
         limit: int = 50,
     ) -> List[Event]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """
                 SELECT id, guild_id, channel_id, title, start_iso, end_iso,
                        description, created_by, expires_at, channel_name, member_limit,
-                       remind_at_iso, reminded, remind_in_channel
+                       remind_at_iso, reminded, remind_in_channel,
+                       managed_channel_id, managed_channel_type
                 FROM events
                 WHERE guild_id = ?
-                  AND expires_at > ?
-                  AND start_iso >= ?
-                  AND start_iso < ?
-                ORDER BY start_iso ASC
+                  AND expires_ts > ?
+                  AND start_ts >= ?
+                  AND start_ts < ?
+                ORDER BY start_ts ASC
                 LIMIT ?
                 """,
-                (guild_id, now_iso, day_start_iso, day_end_iso, limit),
+                (guild_id, _epoch(now_iso), _epoch(day_start_iso), _epoch(day_end_iso), limit),
             ).fetchall()
 
         return [
@@ -443,21 +552,88 @@ class EventStore:
                 remind_at_iso=r[11],
                 reminded=r[12],
                 remind_in_channel=r[13],
+                managed_channel_id=r[14],
+                managed_channel_type=r[15],
             )
             for r in rows
         ]
 
-    def fetch_expired_events(self, now_iso: str) -> List[Event]:
-        with self._connect() as conn:
+    def list_events_for_day_multi(
+        self,
+        *,
+        guild_ids: list[int],
+        day_start_iso: str,
+        day_end_iso: str,
+        now_iso: str,
+        limit: int = 50,
+    ) -> dict[int, List[Event]]:
+        """
+        list_events_for_day for many guilds at once: one query per 500 guilds,
+        each guild seeks idx_events_guild_start_ts. Returns {guild_id: events} (at most
+        `limit` per guild, only guilds that have events).
+        """
+        out: dict[int, List[Event]] = {}
+        ids = sorted({int(g) for g in guild_ids})
+        day_start_ts, day_end_ts, now_ts = _epoch(day_start_iso), _epoch(day_end_iso), _epoch(now_iso)
+        with self._read() as conn:
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                rows = conn.execute(
+                    f"""
+                    SELECT id, guild_id, channel_id, title, start_iso, end_iso,
+                           description, created_by, expires_at, channel_name, member_limit,
+                           remind_at_iso, reminded, remind_in_channel,
+                           managed_channel_id, managed_channel_type
+                    FROM events
+                    WHERE guild_id IN ({", ".join("?" * len(chunk))})
+                      AND start_ts >= ?
+                      AND start_ts < ?
+                      AND expires_ts > ?
+                    ORDER BY guild_id, start_ts ASC
+                    """,
+                    (*chunk, day_start_ts, day_end_ts, now_ts),
+                ).fetchall()
+
+                for r in rows:
+                    events = out.setdefault(int(r[1]), [])
+                    if len(events) >= limit:
+                        continue
+                    events.append(
+                        Event(
+                            id=r[0],
+                            guild_id=r[1],
+                            channel_id=r[2],
+                            title=r[3],
+                            start_iso=r[4],
+                            end_iso=r[5],
+                            description=r[6],
+                            created_by=r[7],
+                            expires_at=r[8],
+                            channel_name=r[9],
+                            member_limit=r[10],
+                            remind_at_iso=r[11],
+                            reminded=r[12],
+                            remind_in_channel=r[13],
+                            managed_channel_id=r[14],
+                            managed_channel_type=r[15],
+                        )
+                    )
+        return out
+
+    def fetch_expired_events(self, now_iso: str, limit: int = -1) -> List[Event]:
+        with self._read() as conn:
             rows = conn.execute(
-                """
+                f"""
                 SELECT id, guild_id, channel_id, title, start_iso, end_iso,
                        description, created_by, expires_at, channel_name, member_limit,
-                       remind_at_iso, reminded, remind_in_channel
+                       remind_at_iso, reminded, remind_in_channel,
+                       managed_channel_id, managed_channel_type
                 FROM events
-                WHERE expires_at <= ?
+                WHERE expires_ts <= ?{self._shard_sql}
+                ORDER BY expires_ts ASC
+                LIMIT ?
                 """,
-                (now_iso,),
+                (_epoch(now_iso), int(limit)),
             ).fetchall()
 
         return [
@@ -476,16 +652,35 @@ class EventStore:
                 remind_at_iso=r[11],
                 reminded=r[12],
                 remind_in_channel=r[13],
+                managed_channel_id=r[14],
+                managed_channel_type=r[15],
             )
             for r in rows
         ]
 
     def delete_expired(self, now_iso: str) -> int:
-        with self._connect() as conn:
-            cur = conn.execute("DELETE FROM events WHERE expires_at <= ?;", (now_iso,))
-            conn.commit()
+        with self._write() as conn:
+            cur = conn.execute(f"DELETE FROM events WHERE expires_ts <= ?{self._shard_sql};", (_epoch(now_iso),))
+            return cur.rowcount
+
+    def delete_events(self, *, event_ids: list[int]) -> int:
+        if not event_ids:
+            return 0
+        with self._write() as conn:
+            cur = conn.executemany("DELETE FROM events WHERE id = ?;", [(int(i),) for i in event_ids])
             return cur.rowcount
 
+    def list_expiry_times(self, *, until_iso: str) -> list[tuple[int, str]]:
+        """
+        (id, expires_at) of events expiring up to until_iso, for the expiry engine's heap.
+        """
+        with self._read() as conn:
+            rows = conn.execute(
+                f"SELECT id, expires_at FROM events WHERE expires_ts <= ?{self._shard_sql} ORDER BY expires_ts ASC;",
+                (_epoch(until_iso),),
+            ).fetchall()
+        return [(int(r[0]), str(r[1])) for r in rows]
+
     def set_event_reminder(
         self,
         *,
@@ -493,16 +688,16 @@ class EventStore:
         remind_at_iso: str,
         remind_in_channel: bool = True,
     ) -> int:
-        with self._connect() as conn:
+        with self._write() as conn:
             cur = conn.execute(
                 """
                 UPDATE events
-                SET remind_at_iso = ?, reminded = 0, remind_in_channel = ?
+                SET remind_at_iso = ?, remind_ts = ?, reminded = 0, remind_in_channel = ?,
+                    remind_attempts = 0, remind_error = NULL
                 WHERE id = ?
                 """,
-                (remind_at_iso, 1 if remind_in_channel else 0, event_id),
+                (remind_at_iso, _epoch(remind_at_iso), 1 if remind_in_channel else 0, event_id),
             )
-            conn.commit()
             return cur.rowcount
 
     def fetch_due_reminders(
@@ -510,22 +705,31 @@ class EventStore:
         *,
         now_iso: str,
         limit: int = 50,
+        exclude_ids: Iterable[int] = (),
     ) -> List[Event]:
-        with self._connect() as conn:
+        """
+        Due, unsent reminders, oldest first. exclude_ids: reminders that already
+        failed in this run, so they do not hide the ones behind them.
+        """
+        now_ts = _epoch(now_iso)
+        exclude = [int(i) for i in exclude_ids]
+        exclude_sql = f"\n                  AND id NOT IN ({', '.join('?' * len(exclude))})" if exclude else ""
+        with self._read() as conn:
             rows = conn.execute(
-                """
+                f"""
                 SELECT id, guild_id, channel_id, title, start_iso, end_iso,
                        description, created_by, expires_at, channel_name, member_limit,
-                       remind_at_iso, reminded, remind_in_channel
+                       remind_at_iso, reminded, remind_in_channel,
+                       managed_channel_id, managed_channel_type
                 FROM events
-                WHERE remind_at_iso IS NOT NULL
+                WHERE remind_ts IS NOT NULL
                   AND reminded = 0
-                  AND remind_at_iso <= ?
-                  AND expires_at > ?
-                ORDER BY remind_at_iso ASC
+                  AND remind_ts <= ?
+                  AND expires_ts > ?{exclude_sql}{self._shard_sql}
+                ORDER BY remind_ts ASC
                 LIMIT ?
                 """,
-                (now_iso, now_iso, limit),
+                (now_ts, now_ts, *exclude, limit),
             ).fetchall()
 
         return [
@@ -544,23 +748,108 @@ class EventStore:
                 remind_at_iso=r[11],
                 reminded=r[12],
                 remind_in_channel=r[13],
+                managed_channel_id=r[14],
+                managed_channel_type=r[15],
             )
             for r in rows
         ]
 
+    def list_pending_reminder_times(self) -> list[tuple[int, str]]:
+        """
+        (event_id, remind_at_iso) for every unsent event reminder; used to hydrate the in-memory timer.
+        """
+        with self._read() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT id, remind_at_iso
+                FROM events
+                WHERE remind_ts IS NOT NULL
+                  AND reminded = 0{self._shard_sql};
+                """
+            ).fetchall()
+        return [(int(r[0]), str(r[1])) for r in rows]
+
+    def list_pending_memo_reminder_times(self) -> list[tuple[int, str]]:
+        """
+        (memo_id, remind_at_iso) for every open memo whose reminder has not been sent.
+        """
+        with self._read() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT id, remind_at_iso
+                FROM memo_items
+                WHERE status = 'open'
+                  AND reminded = 0
+                  AND remind_ts IS NOT NULL{self._shard_sql};
+                """
+            ).fetchall()
+        return [(int(r[0]), str(r[1])) for r in rows]
+
     def mark_event_reminded(self, *, event_id: int) -> int:
-        with self._connect() as conn:
-            cur = conn.execute("UPDATE events SET reminded = 1 WHERE id = ?;", (event_id,))
-            conn.commit()
+        with self._write() as conn:
+            return self._mark_event_reminded(conn, event_id=event_id)
+
+    @staticmethod
+    def _mark_event_reminded(conn: sqlite3.Connection, *, event_id: int) -> int:
+        return conn.execute("UPDATE events SET reminded = 1 WHERE id = ?;", (event_id,)).rowcount
+
+    def mark_events_reminded(self, *, event_ids: list[int]) -> int:
+        """
+        Mark a whole delivery batch in one transaction.
+        """
+        if not event_ids:
+            return 0
+        with self._write() as conn:
+            cur = conn.executemany(
+                "UPDATE events SET reminded = 1 WHERE id = ?;",
+                [(int(i),) for i in event_ids],
+            )
+            return cur.rowcount
+
+    def record_reminder_failures(self, *, event_ids: list[int], error: str, max_attempts: int) -> list[int]:
+        """
+        Count one failed delivery for each reminder. Reminders that reached
+        max_attempts are closed (reminded = 1, remind_error kept); their ids are returned.
+        """
+        closed: list[int] = []
+        if not event_ids:
+            return closed
+        with self._write() as conn:
+            for event_id in event_ids:
+                row = conn.execute(
+                    """
+                    UPDATE events
+                    SET remind_attempts = remind_attempts + 1,
+                        remind_error = ?,
+                        reminded = CASE WHEN remind_attempts + 1 >= ? THEN 1 ELSE 0 END
+                    WHERE id = ? AND reminded = 0
+                    RETURNING reminded;
+                    """,
+                    (error, int(max_attempts), int(event_id)),
+                ).fetchone()
+                if row is not None and row[0]:
+                    closed.append(int(event_id))
+        return closed
+
+    def mark_memos_reminded(self, *, memo_ids: list[int]) -> int:
+        if not memo_ids:
+            return 0
+        now_iso = _utc_iso_now()
+        with self._write() as conn:
+            cur = conn.executemany(
+                "UPDATE memo_items SET reminded = 1, updated_at = ? WHERE id = ?;",
+                [(now_iso, int(i)) for i in memo_ids],
+            )
             return cur.rowcount
 
     def get_event_by_id(self, *, event_id: int) -> Event | None:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 """
                 SELECT id, guild_id, channel_id, title, start_iso, end_iso,
                     description, created_by, expires_at, channel_name, member_limit,
-                    remind_at_iso, reminded, remind_in_channel
+                    remind_at_iso, reminded, remind_in_channel,
+                    managed_channel_id, managed_channel_type
                 FROM events
                 WHERE id = ?
                 LIMIT 1;
@@ -586,38 +875,41 @@ class EventStore:
             remind_at_iso=row[11],
             reminded=row[12],
             remind_in_channel=row[13],
+            managed_channel_id=row[14],
+            managed_channel_type=row[15],
         )
 
     def cancel_event_reminder(self, *, event_id: int) -> int:
-        with self._connect() as conn:
+        with self._write() as conn:
             cur = conn.execute(
                 """
                 UPDATE events
-                SET remind_at_iso = NULL, reminded = 0
+                SET remind_at_iso = NULL, remind_ts = NULL, reminded = 0,
+                    remind_attempts = 0, remind_error = NULL
                 WHERE id = ?;
                 """,
                 (event_id,),
             )
-            conn.commit()
             return cur.rowcount
 
     def list_pending_reminders(self, *, guild_id: int, now_iso: str, limit: int = 20) -> List[Event]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """
                 SELECT id, guild_id, channel_id, title, start_iso, end_iso,
                     description, created_by, expires_at, channel_name, member_limit,
-                    remind_at_iso, reminded, remind_in_channel
+                    remind_at_iso, reminded, remind_in_channel,
+                    managed_channel_id, managed_channel_type
                 FROM events
                 WHERE guild_id = ?
-                AND remind_at_iso IS NOT NULL
+                AND remind_ts IS NOT NULL
                 AND reminded = 0
-                AND expires_at > ?
-                AND remind_at_iso >= ?
-                ORDER BY remind_at_iso ASC
+                AND expires_ts > ?
+                AND remind_ts >= ?
+                ORDER BY remind_ts ASC
                 LIMIT ?;
                 """,
-                (guild_id, now_iso, now_iso, limit),
+                (guild_id, _epoch(now_iso), _epoch(now_iso), limit),
             ).fetchall()
 
         return [
@@ -626,14 +918,39 @@ class EventStore:
                 start_iso=r[4], end_iso=r[5], description=r[6], created_by=r[7],
                 expires_at=r[8], channel_name=r[9], member_limit=r[10],
                 remind_at_iso=r[11], reminded=r[12], remind_in_channel=r[13],
+                managed_channel_id=r[14], managed_channel_type=r[15],
             )
             for r in rows
         ]
 
-    def get_multimedia_item_by_key(self, *, guild_id: int, media_type: str, title: str) -> MultimediaItem | None:
-        media_type = (media_type or "").strip().lower()
-        title = (title or "").strip()
-        with self._connect() as conn:
+    @staticmethod
+    def _mm_item_from_row(r) -> MultimediaItem:
+        return MultimediaItem(
+            id=r[0],
+            guild_id=r[1],
+            media_type=r[2],
+            title=r[3],
+            provider_user_id=r[4],
+            created_at=r[5],
+        )
+
+    def _title_keys_unique(self, conn: sqlite3.Connection) -> bool:
+        if not self._title_keys_ready:
+            self._title_keys_ready = "mm_title_key" not in migrations.pending_backfills(conn)
+        return self._title_keys_ready
+
+    def _find_multimedia_item(self, conn: sqlite3.Connection, *, guild_id: int, media_type: str, title: str):
+        row = conn.execute(
+            """
+            SELECT id, guild_id, media_type, title, provider_user_id, created_at
+            FROM multimedia_items
+            WHERE guild_id = ? AND media_type = ? AND title_key = ?
+            LIMIT 1;
+            """,
+            (guild_id, media_type, title_key(title)),
+        ).fetchone()
+        if row is None and not self._title_keys_unique(conn):
+            # rows the mm_title_key backfill has not reached yet have no key
             row = conn.execute(
                 """
                 SELECT id, guild_id, media_type, title, provider_user_id, created_at
@@ -643,19 +960,19 @@ class EventStore:
                 """,
                 (guild_id, media_type, title),
             ).fetchone()
-        if row is None:
-            return None
-        return MultimediaItem(
-            id=row[0],
-            guild_id=row[1],
-            media_type=row[2],
-            title=row[3],
-            provider_user_id=row[4],
-            created_at=row[5],
-        )
+        return row
+
+    def get_multimedia_item_by_key(self, *, guild_id: int, media_type: str, title: str) -> MultimediaItem | None:
+        """
+        The item whose title matches after normalization (see title_key).
+        """
+        media_type = (media_type or "").strip().lower()
+        with self._read() as conn:
+            row = self._find_multimedia_item(conn, guild_id=guild_id, media_type=media_type, title=title)
+        return None if row is None else self._mm_item_from_row(row)
 
     def get_multimedia_item_by_id(self, *, guild_id: int, item_id: int) -> MultimediaItem | None:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 """
                 SELECT id, guild_id, media_type, title, provider_user_id, created_at
@@ -686,40 +1003,37 @@ class EventStore:
         created_at: str | None = None,
     ) -> tuple[MultimediaItem, bool]:
         """
-        Returns (item, created_new)
+        Returns (item, created_new). Titles that normalize to the same title_key
+        are the same item. One INSERT ... ON CONFLICT DO NOTHING RETURNING; the
+        existing row is read only on a conflict, in the same write transaction.
         """
         created_at = created_at or _utc_iso_now()
         media_type = (media_type or "").strip().lower()
         title = (title or "").strip()
 
-        existing = self.get_multimedia_item_by_key(guild_id=guild_id, media_type=media_type, title=title)
-        if existing is not None:
-            return existing, False
+        with self._write() as conn:
+            if not self._title_keys_unique(conn):
+                # no unique index on title_key yet: look the key up first
+                row = self._find_multimedia_item(conn, guild_id=guild_id, media_type=media_type, title=title)
+                if row is not None:
+                    return self._mm_item_from_row(row), False
 
-        with self._connect() as conn:
-            cur = conn.execute(
+            row = conn.execute(
                 """
                 INSERT INTO multimedia_items (
-                    guild_id, media_type, title, provider_user_id, created_at
+                    guild_id, media_type, title, title_key, provider_user_id, created_at
                 )
-                VALUES (?, ?, ?, ?, ?);
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT DO NOTHING
+                RETURNING id, guild_id, media_type, title, provider_user_id, created_at;
                 """,
-                (guild_id, media_type, title, provider_user_id, created_at),
-            )
-            conn.commit()
-            item_id = cur.lastrowid
+                (guild_id, media_type, title, title_key(title), provider_user_id, created_at),
+            ).fetchone()
+            if row is not None:
+                return self._mm_item_from_row(row), True
 
-        return (
-            MultimediaItem(
-                id=item_id,
-                guild_id=guild_id,
-                media_type=media_type,
-                title=title,
-                provider_user_id=provider_user_id,
-                created_at=created_at,
-            ),
-            True,
-        )
+            row = self._find_multimedia_item(conn, guild_id=guild_id, media_type=media_type, title=title)
+            return self._mm_item_from_row(row), False
 
     def list_multimedia_items(
         self,
@@ -727,8 +1041,8 @@ class EventStore:
         guild_id: int,
         media_type: str | None = None,
         limit: int = 20,
-        offset: int = 0,
-    ) -> List[MultimediaItem]:
+        cursor: str | None = None,
+    ) -> Page[MultimediaItem]:
         where = ["guild_id = ?"]
         params: list[object] = [guild_id]
 
@@ -736,31 +1050,44 @@ class EventStore:
             where.append("media_type = ?")
             params.append(media_type.strip().lower())
 
-        params.extend([int(limit), int(offset)])
+        seek, seek_params, order, backwards = self._keyset(cursor, "created_at", "id")
+        if seek:
+            where.append(seek)
+            params.extend(seek_params)
+        params.append(int(limit) + 1)
 
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 f"""
                 SELECT id, guild_id, media_type, title, provider_user_id, created_at
                 FROM multimedia_items
                 WHERE {" AND ".join(where)}
-                ORDER BY created_at DESC, id DESC
-                LIMIT ? OFFSET ?;
+                ORDER BY {order}
+                LIMIT ?;
                 """,
                 params,
             ).fetchall()
 
-        return [
-            MultimediaItem(
-                id=r[0],
-                guild_id=r[1],
-                media_type=r[2],
-                title=r[3],
-                provider_user_id=r[4],
-                created_at=r[5],
-            )
-            for r in rows
-        ]
+        return self._make_page(
+            [
+                (
+                    MultimediaItem(
+                        id=r[0],
+                        guild_id=r[1],
+                        media_type=r[2],
+                        title=r[3],
+                        provider_user_id=r[4],
+                        created_at=r[5],
+                    ),
+                    r[5],
+                    r[0],
+                )
+                for r in rows
+            ],
+            limit=int(limit),
+            cursor=cursor,
+            backwards=backwards,
+        )
 
     def update_multimedia_item(
         self,
@@ -778,15 +1105,15 @@ class EventStore:
             values.append(media_type.strip().lower())
 
         if title is not None:
-            fields.append("title = ?")
-            values.append(title.strip())
+            fields.append("title = ?, title_key = ?")
+            values.extend([title.strip(), title_key(title)])
 
         if not fields:
             return 0
 
         values.extend([guild_id, int(item_id)])
 
-        with self._connect() as conn:
+        with self._write() as conn:
             cur = conn.execute(
                 f"""
                 UPDATE multimedia_items
@@ -795,7 +1122,6 @@ class EventStore:
                 """,
                 values,
             )
-            conn.commit()
             return cur.rowcount
 
     def delete_multimedia_item(self, *, guild_id: int, item_id: int) -> tuple[int, int]:
@@ -803,7 +1129,7 @@ class EventStore:
         No FK: manual cascade delete.
         Returns (deleted_views, deleted_items)
         """
-        with self._connect() as conn:
+        with self._write() as conn:
             cur_views = conn.execute(
                 """
                 DELETE FROM multimedia_views
@@ -818,7 +1144,6 @@ class EventStore:
                 """,
                 (guild_id, int(item_id)),
             )
-            conn.commit()
             return cur_views.rowcount, cur_item.rowcount
 
     def upsert_multimedia_view(
@@ -831,36 +1156,58 @@ class EventStore:
         watched_at: str | None = None,
         review: str | None = None,
         created_at: str | None = None,
+    ) -> int:
+        with self._write() as conn:
+            return self._upsert_multimedia_view(
+                conn,
+                guild_id=guild_id,
+                item_id=item_id,
+                viewer_user_id=viewer_user_id,
+                watched=watched,
+                watched_at=watched_at,
+                review=review,
+                created_at=created_at,
+            )
+
+    @staticmethod
+    def _upsert_multimedia_view(
+        conn: sqlite3.Connection,
+        *,
+        guild_id: int,
+        item_id: int,
+        viewer_user_id: int,
+        watched: int,
+        watched_at: str | None = None,
+        review: str | None = None,
+        created_at: str | None = None,
     ) -> int:
         created_at = created_at or _utc_iso_now()
-        with self._connect() as conn:
-            cur = conn.execute(
-                """
-                INSERT INTO multimedia_views (
-                    guild_id, item_id, viewer_user_id,
-                    watched, watched_at, review, created_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(guild_id, item_id, viewer_user_id) DO UPDATE SET
-                    watched = excluded.watched,
-                    watched_at = excluded.watched_at,
-                    review = excluded.review;
-                """,
-                (
-                    guild_id,
-                    int(item_id),
-                    int(viewer_user_id),
-                    int(watched),
-                    watched_at,
-                    review,
-                    created_at,
-                ),
+        cur = conn.execute(
+            """
+            INSERT INTO multimedia_views (
+                guild_id, item_id, viewer_user_id,
+                watched, watched_at, review, created_at
             )
-            conn.commit()
-            return cur.rowcount
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(guild_id, item_id, viewer_user_id) DO UPDATE SET
+                watched = excluded.watched,
+                watched_at = excluded.watched_at,
+                review = excluded.review;
+            """,
+            (
+                guild_id,
+                int(item_id),
+                int(viewer_user_id),
+                int(watched),
+                watched_at,
+                review,
+                created_at,
+            ),
+        )
+        return cur.rowcount
 
     def delete_multimedia_view(self, *, guild_id: int, item_id: int, viewer_user_id: int) -> int:
-        with self._connect() as conn:
+        with self._write() as conn:
             cur = conn.execute(
                 """
                 DELETE FROM multimedia_views
@@ -868,7 +1215,6 @@ class EventStore:
                 """,
                 (guild_id, int(item_id), int(viewer_user_id)),
             )
-            conn.commit()
             return cur.rowcount
 
     def list_my_multimedia(
@@ -878,8 +1224,8 @@ class EventStore:
         viewer_user_id: int,
         watched: int | None = None,
         limit: int = 20,
-        offset: int = 0,
-    ) -> list[tuple[MultimediaItem, MultimediaView]]:
+        cursor: str | None = None,
+    ) -> Page[tuple[MultimediaItem, MultimediaView]]:
         where = ["v.guild_id = ?", "v.viewer_user_id = ?"]
         params: list[object] = [guild_id, int(viewer_user_id)]
 
@@ -887,9 +1233,13 @@ class EventStore:
             where.append("v.watched = ?")
             params.append(int(watched))
 
-        params.extend([int(limit), int(offset)])
+        seek, seek_params, order, backwards = self._keyset(cursor, "COALESCE(v.watched_at, v.created_at)", "v.id")
+        if seek:
+            where.append(seek)
+            params.extend(seek_params)
+        params.append(int(limit) + 1)
 
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 f"""
                 SELECT
@@ -899,13 +1249,13 @@ class EventStore:
                 JOIN multimedia_items i
                   ON i.id = v.item_id AND i.guild_id = v.guild_id
                 WHERE {" AND ".join(where)}
-                ORDER BY COALESCE(v.watched_at, v.created_at) DESC, v.id DESC
-                LIMIT ? OFFSET ?;
+                ORDER BY {order}
+                LIMIT ?;
                 """,
                 params,
             ).fetchall()
 
-        out: list[tuple[MultimediaItem, MultimediaView]] = []
+        out: list[tuple[tuple[MultimediaItem, MultimediaView], str, int]] = []
         for r in rows:
             item = MultimediaItem(
                 id=r[0],
@@ -925,8 +1275,8 @@ class EventStore:
                 review=r[12],
                 created_at=r[13],
             )
-            out.append((item, view))
-        return out
+            out.append(((item, view), view.watched_at or view.created_at, view.id))
+        return self._make_page(out, limit=int(limit), cursor=cursor, backwards=backwards)
 
     def list_multimedia_item_views(
         self,
@@ -934,33 +1284,51 @@ class EventStore:
         guild_id: int,
         item_id: int,
         limit: int = 50,
-        offset: int = 0,
-    ) -> List[MultimediaView]:
-        with self._connect() as conn:
+        cursor: str | None = None,
+    ) -> Page[MultimediaView]:
+        where = ["guild_id = ?", "item_id = ?"]
+        params: list[object] = [guild_id, int(item_id)]
+
+        seek, seek_params, order, backwards = self._keyset(cursor, "COALESCE(watched_at, created_at)", "id")
+        if seek:
+            where.append(seek)
+            params.extend(seek_params)
+        params.append(int(limit) + 1)
+
+        with self._read() as conn:
             rows = conn.execute(
-                """
+                f"""
                 SELECT id, guild_id, item_id, viewer_user_id, watched, watched_at, review, created_at
                 FROM multimedia_views
-                WHERE guild_id = ? AND item_id = ?
-                ORDER BY COALESCE(watched_at, created_at) DESC, id DESC
-                LIMIT ? OFFSET ?;
+                WHERE {" AND ".join(where)}
+                ORDER BY {order}
+                LIMIT ?;
                 """,
-                (guild_id, int(item_id), int(limit), int(offset)),
+                params,
             ).fetchall()
 
-        return [
-            MultimediaView(
-                id=r[0],
-                guild_id=r[1],
-                item_id=r[2],
-                viewer_user_id=r[3],
-                watched=r[4],
-                watched_at=r[5],
-                review=r[6],
-                created_at=r[7],
-            )
-            for r in rows
-        ]
+        return self._make_page(
+            [
+                (
+                    MultimediaView(
+                        id=r[0],
+                        guild_id=r[1],
+                        item_id=r[2],
+                        viewer_user_id=r[3],
+                        watched=r[4],
+                        watched_at=r[5],
+                        review=r[6],
+                        created_at=r[7],
+                    ),
+                    r[5] or r[7],
+                    r[0],
+                )
+                for r in rows
+            ],
+            limit=int(limit),
+            cursor=cursor,
+            backwards=backwards,
+        )
 
     def list_multimedia_items_for_user(
         self,
@@ -972,7 +1340,7 @@ class EventStore:
         """
         List multimedia items provided/created by a specific user in this guild.
         """
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """
                 SELECT id, title
@@ -985,116 +1353,373 @@ class EventStore:
             ).fetchall()
 
         return [IdTitle(id=int(r[0]), title=str(r[1])) for r in rows]
-        
-    def dashboard_me(
+
+    def list_multimedia_items_for_guild(
         self,
         *,
         guild_id: int,
-        user_id: int,
-        now_iso: str,
-    ) -> dict:
-        with self._connect() as conn:
-            # events created by me (total / future active / reminders pending)
-            ev_total = conn.execute(
-                "SELECT COUNT(1) FROM events WHERE guild_id=? AND created_by=?;",
-                (guild_id, int(user_id)),
-            ).fetchone()[0]
-
-            ev_active_future = conn.execute(
-                "SELECT COUNT(1) FROM events WHERE guild_id=? AND created_by=? AND expires_at > ?;",
-                (guild_id, int(user_id), now_iso),
-            ).fetchone()[0]
+        media_type: str | None = None,
+        limit: int = 25,
+    ) -> List[MultimediaItem]:
+        """
+        Newest catalog items in this guild (autocomplete with an empty query).
+        """
+        return self.list_multimedia_items(guild_id=guild_id, media_type=media_type, limit=limit).items
 
-            ev_reminders_pending = conn.execute(
+    # bulk import/export (see src/multimedia/bulk.py). Rows are consumed and
+    # written chunk by chunk: each chunk is one short write transaction, so
+    # commands keep running during a long import.
+    def import_multimedia_items(
+        self,
+        *,
+        guild_id: int,
+        rows: Iterable[tuple[str, str, int, str]],
+        chunk_size: int = 5000,
+    ) -> tuple[int, int]:
+        """
+        rows: (media_type, title, provider_user_id, created_at), already normalized.
+        Titles already in the catalog (same title_key) are left as they are.
+        Returns (inserted, skipped).
+        """
+        sql = """
+            INSERT INTO multimedia_items (guild_id, media_type, title, title_key, provider_user_id, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT DO NOTHING;
+        """
+        inserted = total = 0
+        it = iter(rows)
+        while chunk := list(islice(it, max(1, int(chunk_size)))):
+            with self._write() as conn:
+                if self._title_keys_unique(conn):
+                    cur = conn.executemany(
+                        sql,
+                        [
+                            (guild_id, media_type, title, title_key(title), provider, created)
+                            for media_type, title, provider, created in chunk
+                        ],
+                    )
+                    inserted += cur.rowcount
+                else:
+                    # no unique index on title_key yet: look each title up first
+                    for media_type, title, provider, created in chunk:
+                        if self._find_multimedia_item(conn, guild_id=guild_id, media_type=media_type, title=title):
+                            continue
+                        cur = conn.execute(sql, (guild_id, media_type, title, title_key(title), provider, created))
+                        inserted += cur.rowcount
+            total += len(chunk)
+        return inserted, total - inserted
+
+    def import_multimedia_views(
+        self,
+        *,
+        guild_id: int,
+        rows: Iterable[tuple[str, str, int, int, str | None, str | None, str]],
+        overwrite: bool = True,
+        chunk_size: int = 5000,
+    ) -> tuple[int, int]:
+        """
+        rows: (media_type, title, viewer_user_id, watched, watched_at, review, created_at).
+        The item is looked up by (media_type, title_key), so exports from another
+        server or database line up. With overwrite, an existing record of the
+        same viewer is updated (as /multimedia watch does); otherwise kept.
+        Returns (written, skipped); skipped rows name an unknown item or, without
+        overwrite, an existing record. Each row writes at most one record.
+        """
+        on_conflict = (
+            """
+            DO UPDATE SET
+                watched = excluded.watched,
+                watched_at = excluded.watched_at,
+                review = excluded.review
+            """
+            if overwrite
+            else "DO NOTHING"
+        )
+        # LIMIT 1: one item per row even if two still share a title_key
+        sql = f"""
+            INSERT INTO multimedia_views (
+                guild_id, item_id, viewer_user_id,
+                watched, watched_at, review, created_at
+            )
+            SELECT guild_id, id, ?, ?, ?, ?, ?
+            FROM multimedia_items
+            WHERE guild_id = ? AND media_type = ? AND title_key = ?
+            ORDER BY id
+            LIMIT 1
+            ON CONFLICT(guild_id, item_id, viewer_user_id) {on_conflict};
+        """
+        by_id_sql = f"""
+            INSERT INTO multimedia_views (
+                guild_id, item_id, viewer_user_id,
+                watched, watched_at, review, created_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(guild_id, item_id, viewer_user_id) {on_conflict};
+        """
+        written = total = 0
+        it = iter(rows)
+        while chunk := list(islice(it, max(1, int(chunk_size)))):
+            with self._write() as conn:
+                if self._title_keys_unique(conn):
+                    cur = conn.executemany(
+                        sql,
+                        [
+                            (
+                                int(viewer), int(watched), watched_at, review, created_at,
+                                guild_id, media_type, title_key(title),
+                            )
+                            for media_type, title, viewer, watched, watched_at, review, created_at in chunk
+                        ],
+                    )
+                    written += cur.rowcount
+                else:
+                    # title_key not backfilled everywhere yet: resolve each item first
+                    for media_type, title, viewer, watched, watched_at, review, created_at in chunk:
+                        row = self._find_multimedia_item(conn, guild_id=guild_id, media_type=media_type, title=title)
+                        if row is None:
+                            continue
+                        cur = conn.execute(
+                            by_id_sql,
+                            (guild_id, row[0], int(viewer), int(watched), watched_at, review, created_at),
+                        )
+                        written += cur.rowcount
+            total += len(chunk)
+        return written, total - written
+
+    def iter_multimedia_items(self, *, guild_id: int) -> Iterator[MultimediaItem]:
+        """
+        The guild's whole catalog, oldest first, stepped from one cursor (never
+        built as a list). Holds a reader connection until exhausted or closed.
+        """
+        with self._read() as conn:
+            cur = conn.execute(
                 """
-                SELECT COUNT(1) FROM events
-                WHERE guild_id=? AND created_by=?
-                AND remind_at_iso IS NOT NULL
-                AND reminded=0
-                AND expires_at > ?;
+                SELECT id, guild_id, media_type, title, provider_user_id, created_at
+                FROM multimedia_items
+                WHERE guild_id = ?
+                ORDER BY created_at ASC, id ASC;
                 """,
-                (guild_id, int(user_id), now_iso),
-            ).fetchone()[0]
+                (guild_id,),
+            )
+            for r in cur:
+                yield MultimediaItem(
+                    id=int(r[0]),
+                    guild_id=int(r[1]),
+                    media_type=r[2],
+                    title=r[3],
+                    provider_user_id=int(r[4]),
+                    created_at=r[5],
+                )
 
-            # memo (open/done/canceled + overdue + avg duration)
-            memo_open = conn.execute(
-                "SELECT COUNT(1) FROM memo_items WHERE guild_id=? AND owner_user_id=? AND status='open';",
-                (guild_id, int(user_id)),
-            ).fetchone()[0]
-            memo_done = conn.execute(
-                "SELECT COUNT(1) FROM memo_items WHERE guild_id=? AND owner_user_id=? AND status='done';",
-                (guild_id, int(user_id)),
-            ).fetchone()[0]
-            memo_canceled = conn.execute(
-                "SELECT COUNT(1) FROM memo_items WHERE guild_id=? AND owner_user_id=? AND status='canceled';",
-                (guild_id, int(user_id)),
-            ).fetchone()[0]
-            memo_overdue = conn.execute(
-                """
-                SELECT COUNT(1) FROM memo_items
-                WHERE guild_id=? AND owner_user_id=? AND status='open'
-                AND due_at_iso IS NOT NULL AND due_at_iso < ?;
-                """,
-                (guild_id, int(user_id), now_iso),
-            ).fetchone()[0]
-            memo_avg_dur = conn.execute(
+    def iter_multimedia_views(self, *, guild_id: int) -> Iterator[tuple[str, str, MultimediaView]]:
+        """
+        (media_type, title, view) for every watch record of the guild, grouped
+        by item. Streams like iter_multimedia_items.
+        """
+        with self._read() as conn:
+            cur = conn.execute(
                 """
-                SELECT AVG(duration_seconds) FROM memo_items
-                WHERE guild_id=? AND owner_user_id=? AND status='done'
-                AND duration_seconds IS NOT NULL;
+                SELECT i.media_type, i.title,
+                       v.id, v.guild_id, v.item_id, v.viewer_user_id,
+                       v.watched, v.watched_at, v.review, v.created_at
+                FROM multimedia_views v
+                JOIN multimedia_items i ON i.id = v.item_id
+                WHERE v.guild_id = ?
+                ORDER BY v.item_id ASC, v.viewer_user_id ASC;
                 """,
-                (guild_id, int(user_id)),
-            ).fetchone()[0]
+                (guild_id,),
+            )
+            for r in cur:
+                yield r[0], r[1], MultimediaView(
+                    id=int(r[2]),
+                    guild_id=int(r[3]),
+                    item_id=int(r[4]),
+                    viewer_user_id=int(r[5]),
+                    watched=int(r[6]),
+                    watched_at=r[7],
+                    review=r[8],
+                    created_at=r[9],
+                )
 
-            # multimedia (watched/unwatched + reviews count)
-            mm_total = conn.execute(
-                """
-                SELECT COUNT(1) FROM multimedia_views
-                WHERE guild_id=? AND viewer_user_id=?;
+    @staticmethod
+    def _mm_search_terms(query: str) -> tuple[str | None, list[str]]:
+        """
+        Split a search string into an FTS5 MATCH expression (terms of >= 3 chars,
+        which the trigram index can answer) and the shorter leftover terms that
+        are checked with instr() on the candidate rows.
+        """
+        terms = (query or "").split()
+        long_terms = [t for t in terms if len(t) >= 3]
+        short_terms = [t for t in terms if len(t) < 3]
+        match = " AND ".join('"' + t.replace('"', '""') + '"' for t in long_terms) or None
+        return match, short_terms
+
+    @classmethod
+    def _mm_search_sql(
+        cls,
+        *,
+        guild_id: int,
+        query: str,
+        media_type: str | None,
+    ) -> tuple[str, list[str], list[object], bool]:
+        match, short_terms = cls._mm_search_terms(query)
+
+        where = ["i.guild_id = ?"]
+        params: list[object] = [guild_id]
+        if match is not None:
+            # CROSS JOIN pins the FTS match as the outer loop
+            source = "multimedia_items_fts f CROSS JOIN multimedia_items i ON i.id = f.rowid"
+            where.insert(0, "multimedia_items_fts MATCH ?")
+            params.insert(0, match)
+        else:
+            # 1-2 character queries: walk the guild's items newest first
+            source = "multimedia_items i"
+
+        if media_type:
+            where.append("i.media_type = ?")
+            params.append(media_type.strip().lower())
+        for t in short_terms:
+            # lower() only folds ASCII; skip it for caseless (e.g. CJK) terms
+            where.append("instr(lower(i.title), lower(?)) > 0" if t.lower() != t.upper() else "instr(i.title, ?) > 0")
+            params.append(t)
+        return source, where, params, match is not None
+
+    def search_multimedia_items(
+        self,
+        *,
+        guild_id: int,
+        query: str,
+        media_type: str | None = None,
+        limit: int = 25,
+    ) -> List[MultimediaItem]:
+        """
+        Ranked title search. Titles starting with the query come first, then FTS5
+        bm25 rank. A numeric query also matches the item with that id.
+        """
+        query = (query or "").strip()
+        if not query:
+            return self.list_multimedia_items_for_guild(guild_id=guild_id, media_type=media_type, limit=limit)
+
+        source, where, params, ranked = self._mm_search_sql(guild_id=guild_id, query=query, media_type=media_type)
+        order = "(instr(lower(i.title), lower(?)) = 1) DESC, f.rank" if ranked else "i.created_at DESC, i.id DESC"
+        if ranked:
+            params.append(query)
+        params.append(int(limit))
+
+        with self._read() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT i.id, i.guild_id, i.media_type, i.title, i.provider_user_id, i.created_at
+                FROM {source}
+                WHERE {" AND ".join(where)}
+                ORDER BY {order}
+                LIMIT ?;
                 """,
-                (guild_id, int(user_id)),
-            ).fetchone()[0]
-            mm_watched = conn.execute(
-                """
-                SELECT COUNT(1) FROM multimedia_views
-                WHERE guild_id=? AND viewer_user_id=? AND watched=1;
+                params,
+            ).fetchall()
+
+        items = [
+            MultimediaItem(
+                id=r[0],
+                guild_id=r[1],
+                media_type=r[2],
+                title=r[3],
+                provider_user_id=r[4],
+                created_at=r[5],
+            )
+            for r in rows
+        ]
+
+        if query.isdigit():
+            by_id = self.get_multimedia_item_by_id(guild_id=guild_id, item_id=int(query))
+            if by_id is not None and (not media_type or by_id.media_type == media_type.strip().lower()):
+                items = [by_id] + [it for it in items if it.id != by_id.id]
+        return items[: int(limit)]
+
+    def multimedia_search_facets(self, *, guild_id: int, query: str) -> dict[str, int]:
+        """
+        Match counts per media_type for a search query.
+        """
+        query = (query or "").strip()
+        if not query:
+            return {}
+
+        source, where, params, _ = self._mm_search_sql(guild_id=guild_id, query=query, media_type=None)
+        with self._read() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT i.media_type, COUNT(1)
+                FROM {source}
+                WHERE {" AND ".join(where)}
+                GROUP BY i.media_type
+                ORDER BY COUNT(1) DESC, i.media_type ASC;
                 """,
-                (guild_id, int(user_id)),
-            ).fetchone()[0]
-            mm_unwatched = conn.execute(
+                params,
+            ).fetchall()
+        return {str(r[0]): int(r[1]) for r in rows}
+        
+    @staticmethod
+    def _read_counters(conn: sqlite3.Connection, *, guild_id: int, user_id: int) -> dict[str, int]:
+        # stats_counters is kept up to date by triggers (see migrations._m003_stats_counters)
+        rows = conn.execute(
+            "SELECT name, value FROM stats_counters WHERE guild_id=? AND user_id=?;",
+            (guild_id, int(user_id)),
+        ).fetchall()
+        return {name: int(value) for name, value in rows}
+
+    def rebuild_stats_counters(self) -> None:
+        with self._write() as conn:
+            migrations.rebuild_stats_counters(conn)
+
+    def dashboard_me(
+        self,
+        *,
+        guild_id: int,
+        user_id: int,
+        now_iso: str,
+    ) -> dict:
+        now_ts = _epoch(now_iso)
+        with self._read() as conn:
+            c = self._read_counters(conn, guild_id=guild_id, user_id=user_id)
+
+            # time-dependent parts: one range scan each over the active window
+            ev_active_future, ev_reminders_pending = conn.execute(
                 """
-                SELECT COUNT(1) FROM multimedia_views
-                WHERE guild_id=? AND viewer_user_id=? AND watched=0;
+                SELECT COUNT(1),
+                       COALESCE(SUM(remind_ts IS NOT NULL AND reminded=0), 0)
+                FROM events
+                WHERE guild_id=? AND created_by=? AND expires_ts > ?;
                 """,
-                (guild_id, int(user_id)),
-            ).fetchone()[0]
-            mm_reviews = conn.execute(
+                (guild_id, int(user_id), now_ts),
+            ).fetchone()
+            memo_overdue = conn.execute(
                 """
-                SELECT COUNT(1) FROM multimedia_views
-                WHERE guild_id=? AND viewer_user_id=?
-                AND review IS NOT NULL AND TRIM(review) != '' AND review != '-';
+                SELECT COUNT(1) FROM memo_items
+                WHERE guild_id=? AND owner_user_id=? AND status='open'
+                AND due_ts IS NOT NULL AND due_ts < ?;
                 """,
-                (guild_id, int(user_id)),
+                (guild_id, int(user_id), now_ts),
             ).fetchone()[0]
 
+        dur_n = c.get("memo.duration_n", 0)
         return {
             "events": {
-                "total_created": int(ev_total),
+                "total_created": c.get("events.created", 0),
                 "active_future": int(ev_active_future),
                 "reminders_pending": int(ev_reminders_pending),
             },
             "memo": {
-                "open": int(memo_open),
-                "done": int(memo_done),
-                "canceled": int(memo_canceled),
+                "open": c.get("memo.open", 0),
+                "done": c.get("memo.done", 0),
+                "canceled": c.get("memo.canceled", 0),
                 "overdue": int(memo_overdue),
-                "avg_duration_seconds": (None if memo_avg_dur is None else float(memo_avg_dur)),
+                "avg_duration_seconds": (c.get("memo.duration_sum", 0) / dur_n) if dur_n else None,
             },
             "multimedia": {
-                "records": int(mm_total),
-                "watched": int(mm_watched),
-                "unwatched": int(mm_unwatched),
-                "reviews": int(mm_reviews),
+                "records": c.get("mm.records", 0),
+                "watched": c.get("mm.watched", 0),
+                "unwatched": c.get("mm.unwatched", 0),
+                "reviews": c.get("mm.reviews", 0),
             },
         }
 
@@ -1105,55 +1730,560 @@ class EventStore:
         guild_id: int,
         now_iso: str,
     ) -> dict:
-        with self._connect() as conn:
-            ev_total = conn.execute(
-                "SELECT COUNT(1) FROM events WHERE guild_id=?;",
-                (guild_id,),
-            ).fetchone()[0]
-            ev_active = conn.execute(
-                "SELECT COUNT(1) FROM events WHERE guild_id=? AND expires_at > ?;",
-                (guild_id, now_iso),
-            ).fetchone()[0]
-            ev_reminders_pending = conn.execute(
-                """
-                SELECT COUNT(1) FROM events
-                WHERE guild_id=? AND remind_at_iso IS NOT NULL AND reminded=0 AND expires_at > ?;
-                """,
-                (guild_id, now_iso),
-            ).fetchone()[0]
+        now_ts = _epoch(now_iso)
+        with self._read() as conn:
+            c = self._read_counters(conn, guild_id=guild_id, user_id=0)
 
-            memo_open = conn.execute(
-                "SELECT COUNT(1) FROM memo_items WHERE guild_id=? AND status='open';",
-                (guild_id,),
-            ).fetchone()[0]
-            memo_active_users = conn.execute(
+            ev_active, ev_reminders_pending = conn.execute(
                 """
-                SELECT COUNT(DISTINCT owner_user_id)
-                FROM memo_items
-                WHERE guild_id=?;
+                SELECT COUNT(1),
+                       COALESCE(SUM(remind_ts IS NOT NULL AND reminded=0), 0)
+                FROM events
+                WHERE guild_id=? AND expires_ts > ?;
                 """,
-                (guild_id,),
-            ).fetchone()[0]
+                (guild_id, now_ts),
+            ).fetchone()
             memo_due_soon = conn.execute(
                 """
                 SELECT COUNT(1) FROM memo_items
                 WHERE guild_id=? AND status='open'
-                AND due_at_iso IS NOT NULL AND due_at_iso <= ?;
+                AND due_ts IS NOT NULL AND due_ts <= ?;
                 """,
-                (guild_id, now_iso),
+                (guild_id, now_ts),
             ).fetchone()[0]
 
-            mm_items = conn.execute(
-                "SELECT COUNT(1) FROM multimedia_items WHERE guild_id=?;",
+        return {
+            "events": {
+                "total": c.get("events.total", 0),
+                "active": int(ev_active),
+                "reminders_pending": int(ev_reminders_pending),
+            },
+            "memo": {
+                "open": c.get("memo.open", 0),
+                "active_users": c.get("memo.users", 0),
+                "due_or_overdue": int(memo_due_soon),
+            },
+            "multimedia": {"items": c.get("mm.items", 0), "views": c.get("mm.views", 0)},
+        }
+
+    # -----------------------
+    # memos
+    # -----------------------
+    _MEMO_COLS = """
+        id, guild_id, owner_user_id, item_type, title, note, status,
+        due_at_iso, remind_at_iso, reminded, created_at, updated_at,
+        done_at_iso, duration_seconds, thoughts
+    """
+
+    @staticmethod
+    def _memo_from_row(r) -> MemoItem:
+        return MemoItem(
+            id=int(r[0]),
+            guild_id=int(r[1]),
+            owner_user_id=int(r[2]),
+            item_type=r[3],
+            title=r[4],
+            note=r[5],
+            status=r[6],
+            due_at_iso=r[7],
+            remind_at_iso=r[8],
+            reminded=int(r[9]),
+            created_at=r[10],
+            updated_at=r[11],
+            done_at_iso=r[12],
+            duration_seconds=r[13],
+            thoughts=r[14],
+        )
+
+    def create_memo_item(
+        self,
+        *,
+        guild_id: int,
+        owner_user_id: int,
+        item_type: str,
+        title: str,
+        note: str | None = None,
+        due_at_iso: str | None = None,
+        remind_at_iso: str | None = None,
+    ) -> MemoItem:
+        """
+        remind_at defaults to due_at when omitted.
+        """
+        item_type = (item_type or "").strip().lower()
+        title = (title or "").strip()
+        if not item_type or not title:
+            raise ValueError("item_type/title cannot be empty")
+        remind_at_iso = remind_at_iso or due_at_iso
+        now_iso = _utc_iso_now()
+
+        with self._write() as conn:
+            row = conn.execute(
+                f"""
+                INSERT INTO memo_items(
+                    guild_id, owner_user_id, item_type, title, note, status,
+                    due_at_iso, remind_at_iso, reminded, created_at, updated_at,
+                    due_ts, remind_ts
+                ) VALUES (?, ?, ?, ?, ?, 'open', ?, ?, 0, ?, ?, ?, ?)
+                RETURNING {self._MEMO_COLS};
+                """,
+                (
+                    guild_id, int(owner_user_id), item_type, title, note,
+                    due_at_iso, remind_at_iso, now_iso, now_iso,
+                    _epoch(due_at_iso), _epoch(remind_at_iso),
+                ),
+            ).fetchone()
+        return self._memo_from_row(row)
+
+    def list_memo_items(
+        self,
+        *,
+        guild_id: int,
+        owner_user_id: int,
+        status: str = "open",
+        limit: int = 10,
+        offset: int = 0,
+    ) -> list[MemoItem]:
+        """
+        One owner's items of a status, soonest due first; items without a due date last (oldest first).
+        """
+        limit = max(1, int(limit))
+        offset = max(0, int(offset))
+        key = (guild_id, int(owner_user_id), status)
+
+        with self._read() as conn:
+            # two index walks instead of ORDER BY due_ts IS NULL, ... (which would sort)
+            rows = conn.execute(
+                f"""
+                SELECT {self._MEMO_COLS}
+                FROM memo_items
+                WHERE guild_id=? AND owner_user_id=? AND status=? AND due_ts IS NOT NULL
+                ORDER BY due_ts ASC, id ASC
+                LIMIT ? OFFSET ?;
+                """,
+                (*key, limit, offset),
+            ).fetchall()
+            if len(rows) < limit:
+                skip = 0
+                if offset and not rows:
+                    dated = conn.execute(
+                        """
+                        SELECT COUNT(1) FROM memo_items
+                        WHERE guild_id=? AND owner_user_id=? AND status=? AND due_ts IS NOT NULL;
+                        """,
+                        key,
+                    ).fetchone()[0]
+                    skip = offset - int(dated)
+                rows += conn.execute(
+                    f"""
+                    SELECT {self._MEMO_COLS}
+                    FROM memo_items
+                    WHERE guild_id=? AND owner_user_id=? AND status=? AND due_ts IS NULL
+                    ORDER BY id ASC
+                    LIMIT ? OFFSET ?;
+                    """,
+                    (*key, limit - len(rows), max(0, skip)),
+                ).fetchall()
+        return [self._memo_from_row(r) for r in rows]
+
+    def get_memo_item_by_id(self, *, guild_id: int, owner_user_id: int, memo_id: int) -> MemoItem | None:
+        with self._read() as conn:
+            row = conn.execute(
+                f"""
+                SELECT {self._MEMO_COLS}
+                FROM memo_items
+                WHERE id=? AND guild_id=? AND owner_user_id=?;
+                """,
+                (int(memo_id), guild_id, int(owner_user_id)),
+            ).fetchone()
+        return self._memo_from_row(row) if row else None
+
+    def mark_memo_done(
+        self,
+        *,
+        guild_id: int,
+        owner_user_id: int,
+        memo_id: int,
+        duration_seconds: int | None = None,
+        thoughts: str | None = None,
+    ) -> int:
+        """
+        open -> done. Returns 0 when the memo is not the owner's or not open.
+        """
+        if thoughts is not None and len(thoughts) > 9999:
+            raise ValueError("thoughts must be at most 9999 characters")
+        now_iso = _utc_iso_now()
+        with self._write() as conn:
+            rows = conn.execute(
+                """
+                UPDATE memo_items
+                SET status='done', done_at_iso=?, duration_seconds=?, thoughts=?, updated_at=?
+                WHERE id=? AND guild_id=? AND owner_user_id=? AND status='open'
+                RETURNING id;
+                """,
+                (now_iso, duration_seconds, thoughts, now_iso, int(memo_id), guild_id, int(owner_user_id)),
+            ).fetchall()
+        return len(rows)
+
+    def cancel_memo(self, *, guild_id: int, owner_user_id: int, memo_id: int) -> int:
+        """
+        open -> canceled. Returns 0 when the memo is not the owner's or not open.
+        """
+        with self._write() as conn:
+            rows = conn.execute(
+                """
+                UPDATE memo_items
+                SET status='canceled', updated_at=?
+                WHERE id=? AND guild_id=? AND owner_user_id=? AND status='open'
+                RETURNING id;
+                """,
+                (_utc_iso_now(), int(memo_id), guild_id, int(owner_user_id)),
+            ).fetchall()
+        return len(rows)
+
+    def reschedule_memo(
+        self,
+        *,
+        guild_id: int,
+        owner_user_id: int,
+        memo_id: int,
+        due_at_iso: str | None = None,
+        remind_at_iso: str | None = None,
+    ) -> int:
+        """
+        Move an open memo's due/remind time (omitted values are kept; remind_at
+        defaults to due_at). A new remind time re-arms the reminder.
+        """
+        remind_at_iso = remind_at_iso or due_at_iso
+        with self._write() as conn:
+            rows = conn.execute(
+                """
+                UPDATE memo_items
+                SET due_at_iso = COALESCE(?, due_at_iso),
+                    due_ts = COALESCE(?, due_ts),
+                    remind_at_iso = COALESCE(?, remind_at_iso),
+                    remind_ts = COALESCE(?, remind_ts),
+                    reminded = CASE WHEN ? IS NULL THEN reminded ELSE 0 END,
+                    updated_at = ?
+                WHERE id=? AND guild_id=? AND owner_user_id=? AND status='open'
+                RETURNING id;
+                """,
+                (
+                    due_at_iso, _epoch(due_at_iso),
+                    remind_at_iso, _epoch(remind_at_iso), remind_at_iso,
+                    _utc_iso_now(), int(memo_id), guild_id, int(owner_user_id),
+                ),
+            ).fetchall()
+        return len(rows)
+
+    def fetch_due_memo_reminders(self, *, now_iso: str, limit: int = 25) -> list[MemoItem]:
+        with self._read() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT {self._MEMO_COLS}
+                FROM memo_items
+                WHERE status = 'open'
+                  AND reminded = 0
+                  AND remind_ts IS NOT NULL
+                  AND remind_ts <= ?{self._shard_sql}
+                ORDER BY remind_ts ASC
+                LIMIT ?;
+                """,
+                (_epoch(now_iso), int(limit)),
+            ).fetchall()
+        return [self._memo_from_row(r) for r in rows]
+
+    def mark_memo_reminded(self, *, memo_id: int) -> int:
+        with self._write() as conn:
+            return self._mark_memo_reminded(conn, memo_id=memo_id)
+
+    @staticmethod
+    def _mark_memo_reminded(conn: sqlite3.Connection, *, memo_id: int) -> int:
+        return conn.execute(
+            "UPDATE memo_items SET reminded = 1, updated_at = ? WHERE id = ?;",
+            (_utc_iso_now(), int(memo_id)),
+        ).rowcount
+
+    # -----------------------
+    # channel teardown jobs
+    # -----------------------
+    def enqueue_teardown(
+        self,
+        *,
+        batch: str,
+        guild_id: int,
+        kind: str,
+        channels: list[tuple[int | None, str | None]],
+        reason: str,
+        category_id: int | None = None,
+        category_name: str | None = None,
+    ) -> int:
+        """
+        Persist one batch of channel deletions: channels = [(channel_id, channel_name)].
+        """
+        now_iso = _utc_iso_now()
+        with self._write() as conn:
+            conn.execute(
+                """
+                INSERT INTO teardown_batches (batch, guild_id, kind, category_id, category_name, created_at)
+                VALUES (?, ?, ?, ?, ?, ?);
+                """,
+                (batch, guild_id, kind, category_id, category_name, now_iso),
+            )
+            cur = conn.executemany(
+                """
+                INSERT INTO teardown_jobs (
+                    batch, guild_id, channel_id, channel_name, reason,
+                    next_attempt_at, created_at, updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?);
+                """,
+                [
+                    (batch, guild_id, None if cid is None else int(cid), name, reason, now_iso, now_iso, now_iso)
+                    for cid, name in channels
+                ],
+            )
+            return cur.rowcount
+
+    def fetch_due_teardown_jobs(
+        self,
+        *,
+        now_iso: str,
+        limit: int = 50,
+        exclude_guild_ids: Iterable[int] = (),
+    ) -> list[TeardownJob]:
+        """
+        Due jobs, oldest first. exclude_guild_ids: guilds with no free deletion
+        slot, so their backlog does not fill the batch.
+        """
+        exclude = [int(g) for g in exclude_guild_ids]
+        exclude_sql = f" AND guild_id NOT IN ({', '.join('?' * len(exclude))})" if exclude else ""
+        with self._read() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT id, batch, guild_id, channel_id, channel_name, reason, attempts
+                FROM teardown_jobs
+                WHERE status = 'pending' AND next_attempt_at <= ?{exclude_sql}{self._shard_sql}
+                ORDER BY next_attempt_at ASC
+                LIMIT ?;
+                """,
+                (now_iso, *exclude, int(limit)),
+            ).fetchall()
+        return [
+            TeardownJob(
+                id=r[0],
+                batch=r[1],
+                guild_id=r[2],
+                channel_id=r[3],
+                channel_name=r[4],
+                reason=r[5],
+                attempts=r[6],
+            )
+            for r in rows
+        ]
+
+    def next_teardown_attempt_at(self) -> str | None:
+        with self._read() as conn:
+            row = conn.execute(
+                f"SELECT MIN(next_attempt_at) FROM teardown_jobs WHERE status = 'pending'{self._shard_sql};"
+            ).fetchone()
+        return row[0] if row else None
+
+    def finish_teardown_job(self, *, job_id: int, ok: bool, error: str | None = None) -> None:
+        with self._write() as conn:
+            conn.execute(
+                """
+                UPDATE teardown_jobs
+                SET status = ?, attempts = attempts + 1, last_error = ?, updated_at = ?
+                WHERE id = ?;
+                """,
+                ("done" if ok else "failed", error, _utc_iso_now(), int(job_id)),
+            )
+            if ok:
+                # the channel is gone (deleted, or already missing)
+                conn.execute(
+                    """
+                    DELETE FROM bot_managed_channels
+                    WHERE channel_id = (SELECT channel_id FROM teardown_jobs WHERE id = ?);
+                    """,
+                    (int(job_id),),
+                )
+
+    def retry_teardown_job(self, *, job_id: int, next_attempt_at: str, error: str) -> None:
+        with self._write() as conn:
+            conn.execute(
+                """
+                UPDATE teardown_jobs
+                SET attempts = attempts + 1, next_attempt_at = ?, last_error = ?, updated_at = ?
+                WHERE id = ?;
+                """,
+                (next_attempt_at, error, _utc_iso_now(), int(job_id)),
+            )
+
+    def teardown_progress(self, *, batch: str) -> dict[str, int]:
+        with self._read() as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(1) FROM teardown_jobs WHERE batch = ? GROUP BY status;",
+                (batch,),
+            ).fetchall()
+        out = {"pending": 0, "done": 0, "failed": 0}
+        out.update({str(r[0]): int(r[1]) for r in rows})
+        out["total"] = sum(out.values())
+        return out
+
+    def list_running_teardown_batches(self) -> list[TeardownBatch]:
+        with self._read() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT batch, guild_id, kind, category_id, category_name, status
+                FROM teardown_batches
+                WHERE status = 'running'{self._shard_sql}
+                ORDER BY created_at ASC;
+                """
+            ).fetchall()
+        return [
+            TeardownBatch(
+                batch=r[0],
+                guild_id=r[1],
+                kind=r[2],
+                category_id=r[3],
+                category_name=r[4],
+                status=r[5],
+            )
+            for r in rows
+        ]
+
+    def close_teardown_batch(self, *, batch: str, status: str) -> None:
+        with self._write() as conn:
+            conn.execute(
+                "UPDATE teardown_batches SET status = ?, finished_at = ? WHERE batch = ?;",
+                (status, _utc_iso_now(), batch),
+            )
+
+    # -----------------------
+    # app state (key/value)
+    # -----------------------
+    def get_app_state(self, *, key: str) -> str | None:
+        with self._read() as conn:
+            row = conn.execute("SELECT value FROM app_state WHERE key = ?;", (key,)).fetchone()
+        return None if row is None else str(row[0])
+
+    def set_app_state(self, *, key: str, value: str) -> None:
+        with self._write() as conn:
+            conn.execute(
+                """
+                INSERT INTO app_state (key, value, updated_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at;
+                """,
+                (key, value, _utc_iso_now()),
+            )
+
+    # -----------------------
+    # daily digest deliveries
+    # -----------------------
+    def list_sent_digests(self, *, digest_date: str) -> set[int]:
+        with self._read() as conn:
+            rows = conn.execute(
+                "SELECT guild_id FROM digest_deliveries WHERE digest_date = ? AND status = 'sent';",
+                (digest_date,),
+            ).fetchall()
+        return {int(r[0]) for r in rows}
+
+    def record_digest_deliveries(
+        self,
+        *,
+        digest_date: str,
+        rows: list[tuple[int, int | None, int | None, str | None]],
+    ) -> int:
+        """
+        rows = [(guild_id, channel_id, message_id, error)]; error None means sent.
+        """
+        if not rows:
+            return 0
+        now_iso = _utc_iso_now()
+        with self._write() as conn:
+            cur = conn.executemany(
+                """
+                INSERT INTO digest_deliveries (
+                    digest_date, guild_id, channel_id, message_id, status, last_error, updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(digest_date, guild_id) DO UPDATE SET
+                    channel_id = excluded.channel_id,
+                    message_id = excluded.message_id,
+                    status = excluded.status,
+                    attempts = digest_deliveries.attempts + 1,
+                    last_error = excluded.last_error,
+                    updated_at = excluded.updated_at;
+                """,
+                [
+                    (digest_date, int(g), ch, msg, "sent" if err is None else "failed", err, now_iso)
+                    for g, ch, msg, err in rows
+                ],
+            )
+            return cur.rowcount
+
+    # -----------------------
+    # guild settings
+    # -----------------------
+    @staticmethod
+    def _bump_guild_settings_version(conn: sqlite3.Connection, guild_id: int) -> int:
+        row = conn.execute(
+            """
+            INSERT INTO guild_settings_versions (guild_id, version)
+            VALUES (?, (SELECT COALESCE(MAX(version), 0) + 1 FROM guild_settings_versions))
+            ON CONFLICT(guild_id) DO UPDATE SET version = excluded.version
+            RETURNING version;
+            """,
+            (guild_id,),
+        ).fetchone()
+        return int(row[0])
+
+    def get_guild_settings(self, *, guild_id: int) -> tuple[int, dict[str, str]]:
+        """
+        (version, {key: json value}) of one guild; version 0 when it has never been set.
+        """
+        with self._read() as conn:
+            row = conn.execute(
+                "SELECT version FROM guild_settings_versions WHERE guild_id = ?;",
                 (guild_id,),
-            ).fetchone()[0]
-            mm_views = conn.execute(
-                "SELECT COUNT(1) FROM multimedia_views WHERE guild_id=?;",
+            ).fetchone()
+            rows = conn.execute(
+                "SELECT key, value FROM guild_settings WHERE guild_id = ?;",
                 (guild_id,),
-            ).fetchone()[0]
+            ).fetchall()
+        return (int(row[0]) if row else 0), {str(r[0]): str(r[1]) for r in rows}
 
-        return {
-            "events": {"total": int(ev_total), "active": int(ev_active), "reminders_pending": int(ev_reminders_pending)},
-            "memo": {"open": int(memo_open), "active_users": int(memo_active_users), "due_or_overdue": int(memo_due_soon)},
-            "multimedia": {"items": int(mm_items), "views": int(mm_views)},
-        }
\ No newline at end of file
+    def set_guild_setting(self, *, guild_id: int, key: str, value: str, updated_by: int | None = None) -> int:
+        """
+        Store one JSON value; returns the guild's new settings version.
+        """
+        with self._write() as conn:
+            conn.execute(
+                """
+                INSERT INTO guild_settings (guild_id, key, value, updated_by, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(guild_id, key) DO UPDATE SET
+                    value = excluded.value,
+                    updated_by = excluded.updated_by,
+                    updated_at = excluded.updated_at;
+                """,
+                (guild_id, key, value, updated_by, _utc_iso_now()),
+            )
+            return self._bump_guild_settings_version(conn, guild_id)
+
+    def delete_guild_setting(self, *, guild_id: int, key: str) -> int:
+        with self._write() as conn:
+            conn.execute("DELETE FROM guild_settings WHERE guild_id = ? AND key = ?;", (guild_id, key))
+            return self._bump_guild_settings_version(conn, guild_id)
+
+    def list_guild_settings_changes(self, *, since_version: int) -> list[tuple[int, int]]:
+        """
+        (guild_id, version) of guilds whose settings changed after since_version.
+        """
+        with self._read() as conn:
+            rows = conn.execute(
+                "SELECT guild_id, version FROM guild_settings_versions WHERE version > ? ORDER BY version;",
+                (int(since_version),),
+            ).fetchall()
+        return [(int(r[0]), int(r[1])) for r in rows]
@@ -78,7 +78,7 @@ def register_add(group: app_commands.Group, client) -> None:
             return
 
         try:
-            item = client.store.create_memo_item(
+            item = await client.store.create_memo_item(
                 guild_id=interaction.guild.id,
                 owner_user_id=interaction.user.id,
                 item_type=item_type,
@@ -91,6 +91,8 @@ def register_add(group: app_commands.Group, client) -> None:
             await interaction.response.send_message(f"Failed: {e}", ephemeral=True)
             return
 
+        client.reminders.schedule("memo", item.id, item.remind_at_iso)
+
         msg = f"📝 Created memo `#{item.id}` **[{item.item_type}]** {item.title}"
         if item.due_at_iso:
             msg += f"\nDue: `{item.due_at_iso}`"
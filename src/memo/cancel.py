@@ -15,7 +15,7 @@ def register_cancel(group: app_commands.Group, client) -> None:
             await interaction.response.send_message("Please use this in a server channel.", ephemeral=True)
             return
 
-        rc = client.store.cancel_memo(
+        rc = await client.store.cancel_memo(
             guild_id=interaction.guild.id,
             owner_user_id=interaction.user.id,
             memo_id=int(memo_id),
@@ -24,4 +24,6 @@ def register_cancel(group: app_commands.Group, client) -> None:
             await interaction.response.send_message("Memo not found or not open.", ephemeral=True)
             return
 
+        client.reminders.cancel("memo", int(memo_id))
+
         await interaction.response.send_message(f"🧹 Canceled memo `#{memo_id}`", ephemeral=True)
@@ -26,7 +26,7 @@ def register_done(group: app_commands.Group, client) -> None:
             return
 
         try:
-            rc = client.store.mark_memo_done(
+            rc = await client.store.mark_memo_done(
                 guild_id=interaction.guild.id,
                 owner_user_id=interaction.user.id,
                 memo_id=int(memo_id),
@@ -41,4 +41,6 @@ def register_done(group: app_commands.Group, client) -> None:
             await interaction.response.send_message("Memo not found or not open.", ephemeral=True)
             return
 
+        client.reminders.cancel("memo", int(memo_id))
+
         await interaction.response.send_message(f"✅ Done memo `#{memo_id}`", ephemeral=True)
@@ -23,7 +23,7 @@ def register_list(group: app_commands.Group, client) -> None:
 
         limit = max(1, min(int(limit), 20))
 
-        items = client.store.list_memo_items(
+        items = await client.store.list_memo_items(
             guild_id=interaction.guild.id,
             owner_user_id=interaction.user.id,
             status=status,
@@ -1,34 +1,40 @@
-from discord.ext import tasks
-from datetime import datetime, timezone
+import logging
+from datetime import timezone
 
-def _utc_iso_now() -> str:
-    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+from src.reminder.delivery import ReminderDelivery
+
+logger = logging.getLogger(__name__)
 
 class MemoReminderLoop:
-    def __init__(self, client):
+    """
+    Memo reminder delivery. Woken by ReminderTimer when a memo reminder is due;
+    each batch is sent concurrently and marked in one transaction.
+    """
+
+    def __init__(self, client, batch_size: int = 25, delivery: ReminderDelivery | None = None):
         self.client = client
+        self.batch_size = max(1, int(batch_size))
+        self.delivery = delivery or ReminderDelivery(client)
+
+    async def run_due(self) -> list[int]:
+        while True:
+            # the client's clock (wall clock in the bot, simulated in src.bench)
+            now_iso = self.client.now_time().astimezone(timezone.utc).isoformat()
+            due = await self.client.store.fetch_due_memo_reminders(now_iso=now_iso, limit=self.batch_size)
+
+            await self.delivery.run_batch("memo", due, self._send_one)
+            # memo reminders are one-shot: failures are marked too, nothing to retry
+            await self.client.store.mark_memos_reminded(memo_ids=[m.id for m in due])
+
+            if len(due) < self.batch_size:
+                return []
 
-    def start(self):
-        self.loop.start()
-
-    @tasks.loop(seconds=30)
-    async def loop(self):
-        now_iso = _utc_iso_now()
-        due = self.client.store.fetch_due_memo_reminders(now_iso=now_iso, limit=25)
-
-        for m in due:
-            try:
-                user = await self.client.fetch_user(int(m.owner_user_id))
-                if user:
-                    await user.send(
-                        f"⏰ Memo reminder\n"
-                        f"`#{m.id}` **[{m.item_type}]** {m.title}\n"
-                        f"remind_at: {m.remind_at_iso}\n"
-                        f"用 `/memo show {m.id}` 查看，或 `/memo done {m.id}` 完成。"
-                    )
-            finally:
-                self.client.store.mark_memo_reminded(memo_id=m.id)
-
-    @loop.before_loop
-    async def before_loop(self):
-        await self.client.wait_until_ready()
\ No newline at end of file
+    async def _send_one(self, m) -> bool:
+        await self.delivery.send_dm(
+            int(m.owner_user_id),
+            f"⏰ Memo reminder\n"
+            f"`#{m.id}` **[{m.item_type}]** {m.title}\n"
+            f"remind_at: {m.remind_at_iso}\n"
+            f"用 `/memo show {m.id}` 查看，或 `/memo done {m.id}` 完成。",
+        )
+        return True
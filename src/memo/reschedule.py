@@ -54,7 +54,7 @@ def register_reschedule(group: app_commands.Group, client) -> None:
             await interaction.response.send_message("Invalid datetime format.", ephemeral=True)
             return
 
-        rc = client.store.reschedule_memo(
+        rc = await client.store.reschedule_memo(
             guild_id=interaction.guild.id,
             owner_user_id=interaction.user.id,
             memo_id=int(memo_id),
@@ -65,4 +65,8 @@ def register_reschedule(group: app_commands.Group, client) -> None:
             await interaction.response.send_message("Memo not found or not open.", ephemeral=True)
             return
 
+        # remind_at defaults to due_at when omitted
+        if remind_iso or due_iso:
+            client.reminders.schedule("memo", int(memo_id), remind_iso or due_iso)
+
         await interaction.response.send_message(f"🗓️ Rescheduled memo `#{memo_id}`", ephemeral=True)
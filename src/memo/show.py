@@ -15,7 +15,7 @@ def register_show(group: app_commands.Group, client) -> None:
             await interaction.response.send_message("Please use this in a server channel.", ephemeral=True)
             return
 
-        item = client.store.get_memo_item_by_id(
+        item = await client.store.get_memo_item_by_id(
             guild_id=interaction.guild.id,
             owner_user_id=interaction.user.id,
             memo_id=int(memo_id),
@@ -0,0 +1,923 @@
+"""
+Versioned schema migrations for EventStore.
+
+- `schema_version` records every applied migration; startup is a single
+  SELECT when the database is already current.
+- Each migration runs in its own IMMEDIATE transaction, so concurrent
+  processes cannot apply the same migration twice.
+- Migrations that need to rewrite existing rows register a Backfill instead of
+  doing it inline. Backfills are persisted in `schema_backfills` and advanced
+  in small chunks (one short write transaction each) while the bot keeps
+  serving commands.
+"""
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable
+
+
+def _utc_iso_now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+@dataclass(frozen=True)
+class Backfill:
+    name: str
+    # step(conn, after_id, batch_size) -> last id processed, or None when nothing is left
+    step: Callable[[sqlite3.Connection, int, int], int | None]
+    # runs in the same transaction as the final (empty) step
+    on_complete: Callable[[sqlite3.Connection], None] | None = None
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    apply: Callable[[sqlite3.Connection], None]
+    backfills: tuple[Backfill, ...] = field(default_factory=tuple)
+
+
+def _columns(conn: sqlite3.Connection, table: str) -> set[str]:
+    return {r[1] for r in conn.execute(f"PRAGMA table_info({table});").fetchall()}
+
+
+# -----------------------
+# migrations
+# -----------------------
+def _m001_baseline(conn: sqlite3.Connection) -> None:
+    # --- events ---
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            channel_id INTEGER NOT NULL,
+            title TEXT NOT NULL,
+            start_iso TEXT NOT NULL,
+            end_iso TEXT,
+            description TEXT,
+            created_by INTEGER NOT NULL,
+            expires_at TEXT NOT NULL,
+            channel_name TEXT,
+            member_limit INTEGER
+        );
+        """
+    )
+
+    # databases created before schema_version existed may lack these
+    existing_cols = _columns(conn, "events")
+
+    if "remind_at_iso" not in existing_cols:
+        conn.execute("ALTER TABLE events ADD COLUMN remind_at_iso TEXT;")
+
+    if "reminded" not in existing_cols:
+        conn.execute("ALTER TABLE events ADD COLUMN reminded INTEGER NOT NULL DEFAULT 0;")
+
+    if "remind_in_channel" not in existing_cols:
+        conn.execute("ALTER TABLE events ADD COLUMN remind_in_channel INTEGER NOT NULL DEFAULT 1;")
+
+    # --- category options ---
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS event_category_options (
+            guild_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            PRIMARY KEY (guild_id, name)
+        );
+        """
+    )
+
+    # --- multimedia items (catalog) ---
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS multimedia_items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+
+            media_type TEXT NOT NULL,
+            title TEXT NOT NULL,
+
+            provider_user_id INTEGER NOT NULL,
+            created_at TEXT NOT NULL,
+
+            UNIQUE (guild_id, media_type, title)
+        );
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_mm_items_guild_type
+        ON multimedia_items(guild_id, media_type);
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_mm_items_guild_created
+        ON multimedia_items(guild_id, created_at);
+        """
+    )
+
+    # --- multimedia views (per-user state) --- (NO FK)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS multimedia_views (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+
+            guild_id INTEGER NOT NULL,
+            item_id INTEGER NOT NULL,          -- logical ref to multimedia_items.id
+            viewer_user_id INTEGER NOT NULL,
+
+            watched INTEGER NOT NULL DEFAULT 0,
+            watched_at TEXT,
+            review TEXT,
+
+            created_at TEXT NOT NULL,
+
+            UNIQUE (guild_id, item_id, viewer_user_id)
+        );
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_mm_views_guild_item
+        ON multimedia_views(guild_id, item_id);
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_mm_views_guild_viewer
+        ON multimedia_views(guild_id, viewer_user_id);
+        """
+    )
+
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS memo_items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+
+            guild_id INTEGER NOT NULL,
+            owner_user_id INTEGER NOT NULL,
+
+            item_type TEXT NOT NULL,          -- task/movie/anime/book/game/...
+            title TEXT NOT NULL,
+            note TEXT,
+
+            status TEXT NOT NULL DEFAULT 'open',   -- open/done/canceled
+
+            due_at_iso TEXT,          -- optional
+            remind_at_iso TEXT,       -- optional
+            reminded INTEGER NOT NULL DEFAULT 0,   -- 0/1
+
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+
+            done_at_iso TEXT,
+            duration_seconds INTEGER,
+            thoughts TEXT              -- enforce <= 9999 in code
+        );
+        """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_memo_owner_status ON memo_items(guild_id, owner_user_id, status);"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_memo_remind ON memo_items(status, reminded, remind_at_iso);"
+    )
+
+
+def _m002_hot_query_indexes(conn: sqlite3.Connection) -> None:
+    # list_active_events: (guild, channel, expires) filter, ordered by start
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_guild_channel_start ON events(guild_id, channel_id, start_iso);"
+    )
+    # list_events_for_day
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_events_guild_start ON events(guild_id, start_iso);")
+    # fetch_expired_events / delete_expired
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_events_expires ON events(expires_at);")
+    # dashboard_* counts by creator
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_guild_creator ON events(guild_id, created_by, expires_at);"
+    )
+    # unsent reminders only: fetch_due_reminders / timer hydration
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_events_due_reminders
+        ON events(remind_at_iso)
+        WHERE reminded = 0 AND remind_at_iso IS NOT NULL;
+        """
+    )
+    # list_pending_reminders (per guild)
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_events_guild_pending_reminders
+        ON events(guild_id, remind_at_iso)
+        WHERE reminded = 0 AND remind_at_iso IS NOT NULL;
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_mm_items_guild_provider
+        ON multimedia_items(guild_id, provider_user_id);
+        """
+    )
+
+
+# stats_counters: (guild_id, user_id, name) -> value, user_id = 0 for guild-wide counters.
+# Maintained by triggers, so every write path (commands, imports, cleanup) keeps them exact.
+def _bump(guild: str, user: str, name: str, delta: str) -> str:
+    return (
+        "INSERT INTO stats_counters (guild_id, user_id, name, value) "
+        f"VALUES ({guild}, {user}, {name}, {delta}) "
+        "ON CONFLICT(guild_id, user_id, name) DO UPDATE SET value = value + excluded.value;"
+    )
+
+
+def _event_contrib(r: str, sign: int) -> list[str]:
+    return [
+        _bump(f"{r}.guild_id", f"{r}.created_by", "'events.created'", f"{sign}"),
+        _bump(f"{r}.guild_id", "0", "'events.total'", f"{sign}"),
+    ]
+
+
+def _memo_status_contrib(r: str, sign: int) -> list[str]:
+    done_dur = f"({r}.status = 'done' AND {r}.duration_seconds IS NOT NULL)"
+    return [
+        _bump(f"{r}.guild_id", f"{r}.owner_user_id", f"'memo.' || {r}.status", f"{sign}"),
+        _bump(f"{r}.guild_id", "0", f"'memo.' || {r}.status", f"{sign}"),
+        _bump(
+            f"{r}.guild_id", f"{r}.owner_user_id", "'memo.duration_sum'",
+            f"{sign} * (CASE WHEN {done_dur} THEN {r}.duration_seconds ELSE 0 END)",
+        ),
+        _bump(f"{r}.guild_id", f"{r}.owner_user_id", "'memo.duration_n'", f"{sign} * {done_dur}"),
+    ]
+
+
+def _memo_owner_contrib(r: str, sign: int) -> list[str]:
+    # memo.users = number of owners with at least one memo (COUNT(DISTINCT owner_user_id))
+    items = (
+        "(SELECT value FROM stats_counters "
+        f"WHERE guild_id = {r}.guild_id AND user_id = {r}.owner_user_id AND name = 'memo.items')"
+    )
+    edge = f"CASE WHEN {items} = 1 THEN 1 ELSE 0 END" if sign > 0 else f"CASE WHEN {items} = 0 THEN -1 ELSE 0 END"
+    return [
+        _bump(f"{r}.guild_id", f"{r}.owner_user_id", "'memo.items'", f"{sign}"),
+        _bump(f"{r}.guild_id", "0", "'memo.users'", edge),
+    ]
+
+
+def _view_contrib(r: str, sign: int) -> list[str]:
+    has_review = f"({r}.review IS NOT NULL AND TRIM({r}.review) != '' AND {r}.review != '-')"
+    return [
+        _bump(f"{r}.guild_id", f"{r}.viewer_user_id", "'mm.records'", f"{sign}"),
+        _bump(f"{r}.guild_id", f"{r}.viewer_user_id", "'mm.watched'", f"{sign} * ({r}.watched = 1)"),
+        _bump(f"{r}.guild_id", f"{r}.viewer_user_id", "'mm.unwatched'", f"{sign} * ({r}.watched = 0)"),
+        _bump(f"{r}.guild_id", f"{r}.viewer_user_id", "'mm.reviews'", f"{sign} * {has_review}"),
+        _bump(f"{r}.guild_id", "0", "'mm.views'", f"{sign}"),
+    ]
+
+
+def _item_contrib(r: str, sign: int) -> list[str]:
+    return [_bump(f"{r}.guild_id", "0", "'mm.items'", f"{sign}")]
+
+
+def _create_trigger(conn: sqlite3.Connection, name: str, when: str, body: list[str]) -> None:
+    conn.execute(f"DROP TRIGGER IF EXISTS {name};")
+    conn.execute(f"CREATE TRIGGER {name} {when} BEGIN\n" + "\n".join(body) + "\nEND;")
+
+
+def rebuild_stats_counters(conn: sqlite3.Connection) -> None:
+    conn.execute("DELETE FROM stats_counters;")
+    statements = [
+        # events
+        "SELECT guild_id, created_by, 'events.created', COUNT(1) FROM events GROUP BY guild_id, created_by",
+        "SELECT guild_id, 0, 'events.total', COUNT(1) FROM events GROUP BY guild_id",
+        # memo
+        "SELECT guild_id, owner_user_id, 'memo.' || status, COUNT(1) FROM memo_items GROUP BY guild_id, owner_user_id, status",
+        "SELECT guild_id, 0, 'memo.' || status, COUNT(1) FROM memo_items GROUP BY guild_id, status",
+        """
+        SELECT guild_id, owner_user_id, 'memo.duration_sum', SUM(duration_seconds) FROM memo_items
+        WHERE status = 'done' AND duration_seconds IS NOT NULL GROUP BY guild_id, owner_user_id
+        """,
+        """
+        SELECT guild_id, owner_user_id, 'memo.duration_n', COUNT(1) FROM memo_items
+        WHERE status = 'done' AND duration_seconds IS NOT NULL GROUP BY guild_id, owner_user_id
+        """,
+        "SELECT guild_id, owner_user_id, 'memo.items', COUNT(1) FROM memo_items GROUP BY guild_id, owner_user_id",
+        "SELECT guild_id, 0, 'memo.users', COUNT(DISTINCT owner_user_id) FROM memo_items GROUP BY guild_id",
+        # multimedia
+        "SELECT guild_id, viewer_user_id, 'mm.records', COUNT(1) FROM multimedia_views GROUP BY guild_id, viewer_user_id",
+        """
+        SELECT guild_id, viewer_user_id, 'mm.watched', SUM(watched = 1) FROM multimedia_views
+        GROUP BY guild_id, viewer_user_id
+        """,
+        """
+        SELECT guild_id, viewer_user_id, 'mm.unwatched', SUM(watched = 0) FROM multimedia_views
+        GROUP BY guild_id, viewer_user_id
+        """,
+        """
+        SELECT guild_id, viewer_user_id, 'mm.reviews',
+               SUM(review IS NOT NULL AND TRIM(review) != '' AND review != '-')
+        FROM multimedia_views GROUP BY guild_id, viewer_user_id
+        """,
+        "SELECT guild_id, 0, 'mm.views', COUNT(1) FROM multimedia_views GROUP BY guild_id",
+        "SELECT guild_id, 0, 'mm.items', COUNT(1) FROM multimedia_items GROUP BY guild_id",
+    ]
+    for select in statements:
+        conn.execute(f"INSERT INTO stats_counters (guild_id, user_id, name, value) {select};")
+
+
+def _m003_stats_counters(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS stats_counters (
+            guild_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,      -- 0 = guild-wide
+            name TEXT NOT NULL,
+            value INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (guild_id, user_id, name)
+        ) WITHOUT ROWID;
+        """
+    )
+
+    _create_trigger(conn, "trg_stats_events_ins", "AFTER INSERT ON events", _event_contrib("NEW", 1))
+    _create_trigger(conn, "trg_stats_events_del", "AFTER DELETE ON events", _event_contrib("OLD", -1))
+
+    _create_trigger(
+        conn, "trg_stats_memo_ins", "AFTER INSERT ON memo_items",
+        _memo_status_contrib("NEW", 1) + _memo_owner_contrib("NEW", 1),
+    )
+    _create_trigger(
+        conn, "trg_stats_memo_del", "AFTER DELETE ON memo_items",
+        _memo_status_contrib("OLD", -1) + _memo_owner_contrib("OLD", -1),
+    )
+    _create_trigger(
+        conn, "trg_stats_memo_upd", "AFTER UPDATE OF status, duration_seconds ON memo_items",
+        _memo_status_contrib("OLD", -1) + _memo_status_contrib("NEW", 1),
+    )
+
+    _create_trigger(conn, "trg_stats_views_ins", "AFTER INSERT ON multimedia_views", _view_contrib("NEW", 1))
+    _create_trigger(conn, "trg_stats_views_del", "AFTER DELETE ON multimedia_views", _view_contrib("OLD", -1))
+    _create_trigger(
+        conn, "trg_stats_views_upd", "AFTER UPDATE OF watched, review ON multimedia_views",
+        _view_contrib("OLD", -1) + _view_contrib("NEW", 1),
+    )
+
+    _create_trigger(conn, "trg_stats_items_ins", "AFTER INSERT ON multimedia_items", _item_contrib("NEW", 1))
+    _create_trigger(conn, "trg_stats_items_del", "AFTER DELETE ON multimedia_items", _item_contrib("OLD", -1))
+
+    # time-dependent dashboard parts (active / overdue) stay as indexed range queries
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_events_guild_expires ON events(guild_id, expires_at);")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_memo_guild_status_due ON memo_items(guild_id, status, due_at_iso);"
+    )
+
+    rebuild_stats_counters(conn)
+
+
+def _m004_multimedia_fts(conn: sqlite3.Connection) -> None:
+    # external-content FTS5 index over catalog titles; the trigram tokenizer
+    # matches any substring of >= 3 characters, which works for CJK titles
+    # without word segmentation
+    conn.execute(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS multimedia_items_fts USING fts5(
+            title,
+            content='multimedia_items',
+            content_rowid='id',
+            tokenize='trigram'
+        );
+        """
+    )
+    _create_trigger(
+        conn, "trg_mm_items_fts_ins", "AFTER INSERT ON multimedia_items",
+        ["INSERT INTO multimedia_items_fts (rowid, title) VALUES (NEW.id, NEW.title);"],
+    )
+    _create_trigger(
+        conn, "trg_mm_items_fts_del", "AFTER DELETE ON multimedia_items",
+        ["INSERT INTO multimedia_items_fts (multimedia_items_fts, rowid, title) VALUES ('delete', OLD.id, OLD.title);"],
+    )
+    _create_trigger(
+        conn, "trg_mm_items_fts_upd", "AFTER UPDATE OF title ON multimedia_items",
+        [
+            "INSERT INTO multimedia_items_fts (multimedia_items_fts, rowid, title) VALUES ('delete', OLD.id, OLD.title);",
+            "INSERT INTO multimedia_items_fts (rowid, title) VALUES (NEW.id, NEW.title);",
+        ],
+    )
+    conn.execute("INSERT INTO multimedia_items_fts (multimedia_items_fts) VALUES ('rebuild');")
+
+    # 1-2 character queries are below the trigram size and walk the guild's
+    # items newest first; carrying the title in the index keeps that walk
+    # off the table rows. Supersedes idx_mm_items_guild_created.
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_mm_items_guild_created_title ON multimedia_items(guild_id, created_at, title);"
+    )
+    conn.execute("DROP INDEX IF EXISTS idx_mm_items_guild_created;")
+
+
+def _m005_keyset_indexes(conn: sqlite3.Connection) -> None:
+    # keyset pagination: (created_at, id) / (COALESCE(watched_at, created_at), id), newest first.
+    # The catalog index keeps `title` at the end so short title searches stay index-only;
+    # it replaces the (guild_id, created_at, title) index from migration 4.
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_mm_items_guild_created_id ON multimedia_items(guild_id, created_at, id, title);"
+    )
+    conn.execute("DROP INDEX IF EXISTS idx_mm_items_guild_created_title;")
+    # media_type-filtered pages; supersedes idx_mm_items_guild_type
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_mm_items_guild_type_created ON multimedia_items(guild_id, media_type, created_at, id);"
+    )
+    conn.execute("DROP INDEX IF EXISTS idx_mm_items_guild_type;")
+
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_mm_views_viewer_seen
+        ON multimedia_views(guild_id, viewer_user_id, COALESCE(watched_at, created_at), id);
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_mm_views_item_seen
+        ON multimedia_views(guild_id, item_id, COALESCE(watched_at, created_at), id);
+        """
+    )
+    # both are prefixes of the two indexes above
+    conn.execute("DROP INDEX IF EXISTS idx_mm_views_guild_viewer;")
+    conn.execute("DROP INDEX IF EXISTS idx_mm_views_guild_item;")
+
+
+def _m006_channel_teardown(conn: sqlite3.Connection) -> None:
+    # background channel deletions; a batch groups the jobs of one purge / expiry run
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS teardown_batches (
+            batch TEXT PRIMARY KEY,
+            guild_id INTEGER NOT NULL,
+            kind TEXT NOT NULL,              -- expiry/purge
+            category_id INTEGER,             -- purge: deleted once every job is done
+            category_name TEXT,
+            status TEXT NOT NULL DEFAULT 'running',   -- running/done/failed
+            created_at TEXT NOT NULL,
+            finished_at TEXT
+        );
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS teardown_jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            batch TEXT NOT NULL,
+            guild_id INTEGER NOT NULL,
+            channel_id INTEGER,              -- preferred
+            channel_name TEXT,               -- fallback when the id is unknown
+            reason TEXT NOT NULL,
+
+            status TEXT NOT NULL DEFAULT 'pending',   -- pending/done/failed
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at TEXT NOT NULL,
+            last_error TEXT,
+
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        );
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_teardown_jobs_due
+        ON teardown_jobs(next_attempt_at)
+        WHERE status = 'pending';
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_teardown_jobs_batch ON teardown_jobs(batch, status);")
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_teardown_batches_running
+        ON teardown_batches(created_at)
+        WHERE status = 'running';
+        """
+    )
+
+
+def _m007_managed_channels(conn: sqlite3.Connection) -> None:
+    # channels the bot created for events, addressed by snowflake instead of name
+    cols = _columns(conn, "events")
+    if "managed_channel_id" not in cols:
+        conn.execute("ALTER TABLE events ADD COLUMN managed_channel_id INTEGER;")
+    if "managed_channel_type" not in cols:
+        conn.execute("ALTER TABLE events ADD COLUMN managed_channel_type TEXT;")
+
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS bot_managed_channels (
+            channel_id INTEGER PRIMARY KEY,
+            guild_id INTEGER NOT NULL,
+            channel_type TEXT NOT NULL,      -- text/voice
+            name TEXT NOT NULL,              -- at creation time, informational only
+            event_id INTEGER,
+            created_at TEXT NOT NULL
+        );
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_bot_managed_channels_event ON bot_managed_channels(event_id);")
+
+
+def _m008_app_state(conn: sqlite3.Connection) -> None:
+    # small key/value state that must survive restarts (e.g. the synced command tree hash)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS app_state (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        );
+        """
+    )
+
+
+def _m009_digest_deliveries(conn: sqlite3.Connection) -> None:
+    # one row per guild and digest day; a missing/failed row is caught up after a restart
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS digest_deliveries (
+            digest_date TEXT NOT NULL,       -- local date (YYYY-MM-DD) in time.default_tz
+            guild_id INTEGER NOT NULL,
+            channel_id INTEGER,
+            message_id INTEGER,
+            status TEXT NOT NULL,            -- sent/failed
+            attempts INTEGER NOT NULL DEFAULT 1,
+            last_error TEXT,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (digest_date, guild_id)
+        );
+        """
+    )
+
+
+def _m010_guild_settings(conn: sqlite3.Connection) -> None:
+    # per-guild overrides of config.yaml values; value is JSON
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS guild_settings (
+            guild_id INTEGER NOT NULL,
+            key TEXT NOT NULL,
+            value TEXT NOT NULL,
+            updated_by INTEGER,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (guild_id, key)
+        );
+        """
+    )
+    # version: global sequence bumped on every change of a guild's settings, so
+    # other processes can find changed guilds with one range query
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS guild_settings_versions (
+            guild_id INTEGER PRIMARY KEY,
+            version INTEGER NOT NULL
+        );
+        """
+    )
+    conn.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_guild_settings_versions_version ON guild_settings_versions(version);"
+    )
+
+
+def _m011_epoch_columns(conn: sqlite3.Connection) -> None:
+    # canonical UTC epoch seconds next to the ISO strings (which keep whatever
+    # offset they were written with, and are only used for display)
+    cols = _columns(conn, "events")
+    for col in ("start_ts", "end_ts", "expires_ts", "remind_ts"):
+        if col not in cols:
+            conn.execute(f"ALTER TABLE events ADD COLUMN {col} INTEGER;")
+    cols = _columns(conn, "memo_items")
+    for col in ("due_ts", "remind_ts"):
+        if col not in cols:
+            conn.execute(f"ALTER TABLE memo_items ADD COLUMN {col} INTEGER;")
+
+    # every range query now reads the integer columns; the ISO indexes go
+    for name in (
+        "idx_events_guild_channel_start",
+        "idx_events_guild_start",
+        "idx_events_expires",
+        "idx_events_guild_creator",
+        "idx_events_guild_expires",
+        "idx_events_due_reminders",
+        "idx_events_guild_pending_reminders",
+        "idx_memo_remind",
+        "idx_memo_guild_status_due",
+    ):
+        conn.execute(f"DROP INDEX IF EXISTS {name};")
+
+    # list_active_events
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_guild_channel_start_ts ON events(guild_id, channel_id, start_ts);"
+    )
+    # list_events_for_day(_multi)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_events_guild_start_ts ON events(guild_id, start_ts);")
+    # expiry engine
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_events_expires_ts ON events(expires_ts);")
+    # dashboard_me / dashboard_server
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_guild_creator_expires_ts ON events(guild_id, created_by, expires_ts);"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_events_guild_expires_ts ON events(guild_id, expires_ts);")
+    # unsent reminders only: fetch_due_reminders / timer hydration / list_pending_reminders
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_events_due_remind_ts
+        ON events(remind_ts)
+        WHERE reminded = 0 AND remind_ts IS NOT NULL;
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_events_guild_pending_remind_ts
+        ON events(guild_id, remind_ts)
+        WHERE reminded = 0 AND remind_ts IS NOT NULL;
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_memo_remind_ts ON memo_items(status, reminded, remind_ts);")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_memo_guild_status_due_ts ON memo_items(guild_id, status, due_ts);")
+
+
+def _epoch_sql(col: str) -> str:
+    # strftime('%s') reads ISO 8601 with or without an offset ('Z', '+02:00'); naive is UTC
+    return f"CAST(strftime('%s', {col}) AS INTEGER)"
+
+
+def _chunk_end(conn: sqlite3.Connection, table: str, after_id: int, batch_size: int) -> int | None:
+    row = conn.execute(
+        f"SELECT MAX(id) FROM (SELECT id FROM {table} WHERE id > ? ORDER BY id LIMIT ?);",
+        (after_id, batch_size),
+    ).fetchone()
+    return None if row[0] is None else int(row[0])
+
+
+def _bf_events_epoch(conn: sqlite3.Connection, after_id: int, batch_size: int) -> int | None:
+    last = _chunk_end(conn, "events", after_id, batch_size)
+    if last is None:
+        return None
+    conn.execute(
+        f"""
+        UPDATE events
+        SET start_ts = {_epoch_sql("start_iso")},
+            end_ts = {_epoch_sql("end_iso")},
+            expires_ts = {_epoch_sql("expires_at")},
+            remind_ts = {_epoch_sql("remind_at_iso")}
+        WHERE id > ? AND id <= ?;
+        """,
+        (after_id, last),
+    )
+    return last
+
+
+def _bf_memo_epoch(conn: sqlite3.Connection, after_id: int, batch_size: int) -> int | None:
+    last = _chunk_end(conn, "memo_items", after_id, batch_size)
+    if last is None:
+        return None
+    conn.execute(
+        f"""
+        UPDATE memo_items
+        SET due_ts = {_epoch_sql("due_at_iso")},
+            remind_ts = {_epoch_sql("remind_at_iso")}
+        WHERE id > ? AND id <= ?;
+        """,
+        (after_id, last),
+    )
+    return last
+
+
+def _m012_memo_indexes(conn: sqlite3.Connection) -> None:
+    # list_memo_items / dashboard_me: one owner's items of a status, in due order
+    # (the trailing rowid makes ORDER BY due_ts, id an index walk)
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_memo_owner_status_due_ts
+        ON memo_items(guild_id, owner_user_id, status, due_ts);
+        """
+    )
+    # unsent reminders only: fetch_due_memo_reminders / timer hydration
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_memo_due_remind_ts
+        ON memo_items(remind_ts)
+        WHERE status = 'open' AND reminded = 0 AND remind_ts IS NOT NULL;
+        """
+    )
+    # both superseded by the two above
+    conn.execute("DROP INDEX IF EXISTS idx_memo_owner_status;")
+    conn.execute("DROP INDEX IF EXISTS idx_memo_remind_ts;")
+
+
+def _m013_mm_title_key(conn: sqlite3.Connection) -> None:
+    # normalized title (event_storage.title_key): titles that differ only in
+    # case, width, spacing or punctuation are one catalog item. Filled by the
+    # mm_title_key backfill; unique once duplicates are merged (_mm_title_key_done).
+    if "title_key" not in _columns(conn, "multimedia_items"):
+        conn.execute("ALTER TABLE multimedia_items ADD COLUMN title_key TEXT;")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_mm_items_guild_type_key ON multimedia_items(guild_id, media_type, title_key);"
+    )
+
+
+def _bf_mm_title_key(conn: sqlite3.Connection, after_id: int, batch_size: int) -> int | None:
+    last = _chunk_end(conn, "multimedia_items", after_id, batch_size)
+    if last is None:
+        return None
+    # title_key() is registered on every store connection (EventStore._on_connect)
+    conn.execute(
+        "UPDATE multimedia_items SET title_key = title_key(title) WHERE id > ? AND id <= ?;",
+        (after_id, last),
+    )
+    return last
+
+
+def _mm_title_key_done(conn: sqlite3.Connection) -> None:
+    # fold duplicates into the oldest item; its watch record wins when a viewer has both
+    dupes = conn.execute(
+        """
+        SELECT i.guild_id, i.id, k.keep_id
+        FROM multimedia_items i
+        JOIN (
+            SELECT guild_id, media_type, title_key, MIN(id) AS keep_id
+            FROM multimedia_items
+            WHERE title_key IS NOT NULL
+            GROUP BY guild_id, media_type, title_key
+            HAVING COUNT(1) > 1
+        ) k ON i.guild_id = k.guild_id AND i.media_type = k.media_type AND i.title_key = k.title_key
+        WHERE i.id <> k.keep_id;
+        """
+    ).fetchall()
+    conn.executemany(
+        "UPDATE OR IGNORE multimedia_views SET item_id = ? WHERE guild_id = ? AND item_id = ?;",
+        [(keep_id, guild_id, item_id) for guild_id, item_id, keep_id in dupes],
+    )
+    conn.executemany(
+        "DELETE FROM multimedia_views WHERE guild_id = ? AND item_id = ?;",
+        [(guild_id, item_id) for guild_id, item_id, _ in dupes],
+    )
+    conn.executemany("DELETE FROM multimedia_items WHERE id = ?;", [(item_id,) for _, item_id, _ in dupes])
+
+    conn.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_mm_items_guild_type_title_key
+        ON multimedia_items(guild_id, media_type, title_key);
+        """
+    )
+    conn.execute("DROP INDEX IF EXISTS idx_mm_items_guild_type_key;")
+
+
+def _m014_event_remind_attempts(conn: sqlite3.Connection) -> None:
+    # failed deliveries of an event reminder; after ReminderScheduler.max_attempts
+    # the reminder is closed (reminded = 1) with the last error kept here
+    cols = _columns(conn, "events")
+    if "remind_attempts" not in cols:
+        conn.execute("ALTER TABLE events ADD COLUMN remind_attempts INTEGER NOT NULL DEFAULT 0;")
+    if "remind_error" not in cols:
+        conn.execute("ALTER TABLE events ADD COLUMN remind_error TEXT;")
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(1, "baseline", _m001_baseline),
+    Migration(2, "hot_query_indexes", _m002_hot_query_indexes),
+    Migration(3, "stats_counters", _m003_stats_counters),
+    Migration(4, "multimedia_fts", _m004_multimedia_fts),
+    Migration(5, "keyset_indexes", _m005_keyset_indexes),
+    Migration(6, "channel_teardown", _m006_channel_teardown),
+    Migration(7, "managed_channels", _m007_managed_channels),
+    Migration(8, "app_state", _m008_app_state),
+    Migration(9, "digest_deliveries", _m009_digest_deliveries),
+    Migration(10, "guild_settings", _m010_guild_settings),
+    Migration(
+        11,
+        "epoch_columns",
+        _m011_epoch_columns,
+        backfills=(Backfill("events_epoch", _bf_events_epoch), Backfill("memo_epoch", _bf_memo_epoch)),
+    ),
+    Migration(12, "memo_indexes", _m012_memo_indexes),
+    Migration(
+        13,
+        "mm_title_key",
+        _m013_mm_title_key,
+        backfills=(Backfill("mm_title_key", _bf_mm_title_key, on_complete=_mm_title_key_done),),
+    ),
+    Migration(14, "event_remind_attempts", _m014_event_remind_attempts),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+BACKFILLS: dict[str, Backfill] = {bf.name: bf for m in MIGRATIONS for bf in m.backfills}
+
+
+# -----------------------
+# runner
+# -----------------------
+def _ensure_meta_tables(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TEXT NOT NULL
+        );
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_backfills (
+            name TEXT PRIMARY KEY,
+            last_id INTEGER NOT NULL DEFAULT 0,
+            done INTEGER NOT NULL DEFAULT 0,
+            started_at TEXT NOT NULL,
+            finished_at TEXT
+        );
+        """
+    )
+
+
+def current_version(conn: sqlite3.Connection) -> int:
+    try:
+        row = conn.execute("SELECT MAX(version) FROM schema_version;").fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return int(row[0] or 0)
+
+
+def migrate(conn: sqlite3.Connection) -> list[int]:
+    """
+    Apply pending migrations. Returns the versions applied (empty when current).
+    """
+    if current_version(conn) >= LATEST_VERSION:
+        return []
+
+    if conn.in_transaction:
+        conn.commit()
+
+    applied: list[int] = []
+    for m in MIGRATIONS:
+        conn.execute("BEGIN IMMEDIATE;")
+        try:
+            _ensure_meta_tables(conn)
+            # re-check under the write lock: another process may have migrated
+            if current_version(conn) >= m.version:
+                conn.rollback()
+                continue
+
+            m.apply(conn)
+            conn.execute(
+                "INSERT INTO schema_version (version, name, applied_at) VALUES (?, ?, ?);",
+                (m.version, m.name, _utc_iso_now()),
+            )
+            for bf in m.backfills:
+                conn.execute(
+                    "INSERT OR IGNORE INTO schema_backfills (name, started_at) VALUES (?, ?);",
+                    (bf.name, _utc_iso_now()),
+                )
+                # an empty table (e.g. a new database) finishes here, on_complete included
+                _advance_backfill(conn, bf, batch_size=1)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        applied.append(m.version)
+    return applied
+
+
+def pending_backfills(conn: sqlite3.Connection) -> list[str]:
+    try:
+        rows = conn.execute("SELECT name FROM schema_backfills WHERE done = 0 ORDER BY rowid;").fetchall()
+    except sqlite3.OperationalError:
+        return []
+    return [r[0] for r in rows if r[0] in BACKFILLS]
+
+
+def run_backfill_step(conn: sqlite3.Connection, *, batch_size: int = 500) -> bool:
+    """
+    Advance the oldest unfinished backfill by one chunk.
+    Returns False when no backfill is left. Caller owns the transaction.
+    """
+    names = pending_backfills(conn)
+    if not names:
+        return False
+
+    _advance_backfill(conn, BACKFILLS[names[0]], batch_size=batch_size)
+    return True
+
+
+def _advance_backfill(conn: sqlite3.Connection, bf: Backfill, *, batch_size: int) -> None:
+    row = conn.execute("SELECT last_id, done FROM schema_backfills WHERE name = ?;", (bf.name,)).fetchone()
+    if row is None or row[1]:
+        return
+
+    last_id = bf.step(conn, int(row[0]), int(batch_size))
+    if last_id is None:
+        if bf.on_complete is not None:
+            bf.on_complete(conn)
+        conn.execute(
+            "UPDATE schema_backfills SET done = 1, finished_at = ? WHERE name = ?;",
+            (_utc_iso_now(), bf.name),
+        )
+    else:
+        conn.execute("UPDATE schema_backfills SET last_id = ? WHERE name = ?;", (int(last_id), bf.name))
@@ -7,6 +7,9 @@ from src.multimedia.unwatch import register_unwatch
 from src.multimedia.my import register_my
 from src.multimedia.stats import register_stats
 from src.multimedia.delete_item import register_delete_item
+from src.multimedia.search import register_search
+from src.multimedia.bulk_import import register_import
+from src.multimedia.bulk_export import register_export
 
 
 def register_multimedia_commands(tree: app_commands.CommandTree, client) -> None:
@@ -19,5 +22,8 @@ def register_multimedia_commands(tree: app_commands.CommandTree, client) -> None
     register_my(group, client)
     register_stats(group, client)
     register_delete_item(group, client)
+    register_search(group, client)
+    register_import(group, client)
+    register_export(group, client)
 
     tree.add_command(group)
@@ -0,0 +1,68 @@
+"""
+Bulk import/export of the multimedia catalog and watch history.
+
+    python -m src.multimedia import catalog titles.csv --guild 123 [--db events.db]
+    python -m src.multimedia import views history.jsonl --guild 123 [--keep-existing]
+    python -m src.multimedia export catalog --guild 123 --out catalog.csv
+
+Prints the import report (JSON) or writes the export (stdout: JSONL).
+Safe to run while the bot is up: each chunk is one short write transaction.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from src.event_storage import EventStore
+from src.multimedia.bulk import CHUNK_SIZE, FORMATS, KINDS, export_file, export_records, import_file
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("action", choices=["import", "export"])
+    parser.add_argument("kind", choices=KINDS)
+    parser.add_argument("path", type=Path, nargs="?", help="file to import")
+    parser.add_argument("--guild", type=int, required=True)
+    parser.add_argument("--db", type=Path, default=Path("events.db"))
+    parser.add_argument("--format", choices=FORMATS, help="default: from the file extension (export: jsonl)")
+    parser.add_argument("--out", type=Path, help="export: write here instead of stdout")
+    parser.add_argument("--provider", type=int, default=0, help="catalog rows without provider_user_id")
+    parser.add_argument("--keep-existing", action="store_true", help="views: do not overwrite existing records")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="rows per write transaction")
+    args = parser.parse_intermixed_args(argv)
+
+    store = EventStore(args.db, readers=1)
+    try:
+        if args.action == "import":
+            if args.path is None:
+                parser.error("import needs a file")
+            # titles are matched on title_key: finish its backfill (and duplicate merge) first
+            while store.run_backfill_step():
+                pass
+            report = import_file(
+                store,
+                args.path,
+                fmt=args.format,
+                kind=args.kind,
+                guild_id=args.guild,
+                provider_user_id=args.provider,
+                overwrite=not args.keep_existing,
+                chunk_size=args.chunk_size,
+            )
+            print(json.dumps(report.as_dict(), indent=2, ensure_ascii=False))
+            return 0
+
+        if args.out:
+            n = export_file(store, args.out, fmt=args.format, kind=args.kind, guild_id=args.guild)
+        else:
+            n = export_records(store, sys.stdout, kind=args.kind, fmt=args.format or "jsonl", guild_id=args.guild)
+        print(f"{n} rows", file=sys.stderr)
+        return 0
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -33,7 +33,7 @@ def register_add(group: app_commands.Group, client) -> None:
             await interaction.response.send_message(f"Unknown media_type: `{media_type}`.", ephemeral=True)
             return
 
-        existing = client.store.get_multimedia_item_by_key(
+        existing = await client.store.get_multimedia_item_by_key(
             guild_id=interaction.guild.id,
             media_type=media_type,
             title=title,
@@ -46,7 +46,7 @@ def register_add(group: app_commands.Group, client) -> None:
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        item, _created = client.store.create_or_get_multimedia_item(
+        item, _created = await client.store.create_or_get_multimedia_item(
             guild_id=interaction.guild.id,
             provider_user_id=interaction.user.id,
             media_type=media_type,
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import discord
+from discord import app_commands
+
+
+async def item_id_choices(client, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[int]]:
+    """
+    Catalog item autocomplete backed by the FTS title index
+    (empty input lists the newest items, digits also match by id).
+    """
+    if interaction.guild is None:
+        return []
+
+    items = await client.store.search_multimedia_items(
+        guild_id=interaction.guild.id,
+        query=current or "",
+        limit=25,
+    )
+    return [
+        app_commands.Choice(name=f"{it.id} — [{it.media_type}] {it.title}"[:100], value=int(it.id))
+        for it in items
+    ]
@@ -0,0 +1,266 @@
+"""
+Bulk import/export of the multimedia catalog and watch history (CSV or JSONL).
+
+Files are read line by line through a generator pipeline (parse -> normalize and
+validate -> chunked executemany), and exports are written straight from a store
+cursor, so memory stays flat whatever the file size. /multimedia import and
+/multimedia export run this on an attached file; `python -m src.multimedia`
+on a local path.
+
+Watch records name their item by media_type + title (item_id is exported for
+reference only), so a history imports into another server once its catalog is there.
+"""
+from __future__ import annotations
+
+import csv
+import json
+from contextlib import closing
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, TextIO
+
+from src.event_storage import EventStore
+from src.multimedia.add import MEDIA_TYPES
+
+FORMATS = ("csv", "jsonl")
+KINDS = ("catalog", "views")
+
+CATALOG_FIELDS = ("id", "media_type", "title", "provider_user_id", "created_at")
+VIEW_FIELDS = ("item_id", "media_type", "title", "viewer_user_id", "watched", "watched_at", "review", "created_at")
+
+# rows per write transaction
+CHUNK_SIZE = 5000
+# rejected rows listed in a report (all are counted)
+MAX_ERRORS = 20
+
+_TRUE = {"1", "true", "yes", "y", "watched"}
+_FALSE = {"0", "false", "no", "n"}
+
+
+def _utc_iso_now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+@dataclass
+class ImportReport:
+    read: int = 0
+    written: int = 0
+    skipped: int = 0  # already present (or, for watch records, an unknown item)
+    invalid: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    def reject(self, line: int, reason: str) -> None:
+        self.invalid += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append(f"line {line}: {reason}")
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def detect_format(name: str) -> str:
+    suffix = Path(name).suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix in (".jsonl", ".ndjson", ".json"):
+        return "jsonl"
+    raise ValueError(f"unknown file type {name!r} (use .csv or .jsonl)")
+
+
+# -----------------------
+# reading
+# -----------------------
+def read_records(f: TextIO, fmt: str, report: ImportReport) -> Iterator[tuple[int, dict]]:
+    """
+    (line number, record) per row. Lines that do not parse are rejected here.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(f)
+        if reader.fieldnames:
+            reader.fieldnames = [(h or "").strip().lower() for h in reader.fieldnames]
+        for rec in reader:
+            yield reader.line_num, rec
+        return
+
+    for n, line in enumerate(f, start=1):
+        if not line.strip():
+            continue
+        try:
+            rec = json.loads(line)
+        except ValueError as e:
+            report.read += 1
+            report.reject(n, f"invalid JSON ({e.msg})")
+            continue
+        if not isinstance(rec, dict):
+            report.read += 1
+            report.reject(n, "not a JSON object")
+            continue
+        yield n, {str(k).strip().lower(): v for k, v in rec.items()}
+
+
+def _text(rec: dict, key: str) -> str:
+    v = rec.get(key)
+    return "" if v is None else str(v).strip()
+
+
+def _int(rec: dict, key: str) -> int | None:
+    s = _text(rec, key)
+    if not s:
+        return None
+    try:
+        return int(s)
+    except ValueError:
+        raise ValueError(f"{key} must be an integer") from None
+
+
+def _iso(rec: dict, key: str) -> str | None:
+    s = _text(rec, key)
+    if not s:
+        return None
+    try:
+        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+    except ValueError:
+        raise ValueError(f"{key} must be an ISO 8601 datetime") from None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
+def _key(rec: dict) -> tuple[str, str]:
+    media_type = _text(rec, "media_type").lower()
+    if media_type not in MEDIA_TYPES:
+        raise ValueError(f"unknown media_type {media_type!r}")
+    title = _text(rec, "title")
+    if not title:
+        raise ValueError("title is empty")
+    return media_type, title
+
+
+def catalog_rows(
+    records: Iterable[tuple[int, dict]],
+    report: ImportReport,
+    *,
+    provider_user_id: int,
+    now_iso: str,
+) -> Iterator[tuple[str, str, int, str]]:
+    """
+    (media_type, title, provider_user_id, created_at) for EventStore.import_multimedia_items.
+    """
+    for line, rec in records:
+        report.read += 1
+        try:
+            media_type, title = _key(rec)
+            provider = _int(rec, "provider_user_id")
+            created_at = _iso(rec, "created_at") or now_iso
+        except ValueError as e:
+            report.reject(line, str(e))
+            continue
+        yield media_type, title, provider_user_id if provider is None else provider, created_at
+
+
+def view_rows(
+    records: Iterable[tuple[int, dict]],
+    report: ImportReport,
+    *,
+    now_iso: str,
+) -> Iterator[tuple[str, str, int, int, str | None, str | None, str]]:
+    """
+    (media_type, title, viewer_user_id, watched, watched_at, review, created_at)
+    for EventStore.import_multimedia_views; same review rules as /multimedia watch.
+    """
+    for line, rec in records:
+        report.read += 1
+        try:
+            media_type, title = _key(rec)
+            viewer = _int(rec, "viewer_user_id")
+            if viewer is None:
+                raise ValueError("viewer_user_id is empty")
+            flag = _text(rec, "watched").lower()
+            if flag and flag not in _TRUE | _FALSE:
+                raise ValueError(f"watched must be true/false, got {flag!r}")
+            watched = 0 if flag in _FALSE else 1
+            watched_at = _iso(rec, "watched_at") if watched else None
+            created_at = _iso(rec, "created_at") or now_iso
+        except ValueError as e:
+            report.reject(line, str(e))
+            continue
+        review = (_text(rec, "review") or "-") if watched else "-"
+        yield media_type, title, viewer, watched, watched_at, review, created_at
+
+
+def import_records(
+    store: EventStore,
+    f: TextIO,
+    *,
+    kind: str,
+    fmt: str,
+    guild_id: int,
+    provider_user_id: int = 0,
+    overwrite: bool = True,
+    chunk_size: int = CHUNK_SIZE,
+) -> ImportReport:
+    report = ImportReport()
+    records = read_records(f, fmt, report)
+    now_iso = _utc_iso_now()
+    if kind == "catalog":
+        report.written, report.skipped = store.import_multimedia_items(
+            guild_id=guild_id,
+            rows=catalog_rows(records, report, provider_user_id=provider_user_id, now_iso=now_iso),
+            chunk_size=chunk_size,
+        )
+    elif kind == "views":
+        report.written, report.skipped = store.import_multimedia_views(
+            guild_id=guild_id,
+            rows=view_rows(records, report, now_iso=now_iso),
+            overwrite=overwrite,
+            chunk_size=chunk_size,
+        )
+    else:
+        raise ValueError(f"unknown kind {kind!r}")
+    return report
+
+
+def import_file(store: EventStore, path: Path, *, fmt: str | None = None, **kwargs) -> ImportReport:
+    # utf-8-sig: spreadsheet exports often start with a BOM
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return import_records(store, f, fmt=fmt or detect_format(path.name), **kwargs)
+
+
+# -----------------------
+# writing
+# -----------------------
+def write_records(out: TextIO, fmt: str, fields: tuple[str, ...], rows: Iterable[tuple]) -> int:
+    n = 0
+    if fmt == "csv":
+        writer = csv.writer(out)
+        writer.writerow(fields)
+        for row in rows:
+            writer.writerow(row)
+            n += 1
+    else:
+        for row in rows:
+            out.write(json.dumps(dict(zip(fields, row)), ensure_ascii=False) + "\n")
+            n += 1
+    return n
+
+
+def export_records(store: EventStore, out: TextIO, *, kind: str, fmt: str, guild_id: int) -> int:
+    # closing(): a failed write gives the reader connection back right away
+    if kind == "catalog":
+        with closing(store.iter_multimedia_items(guild_id=guild_id)) as items:
+            rows = ((it.id, it.media_type, it.title, it.provider_user_id, it.created_at) for it in items)
+            return write_records(out, fmt, CATALOG_FIELDS, rows)
+    if kind == "views":
+        with closing(store.iter_multimedia_views(guild_id=guild_id)) as views:
+            rows = (
+                (v.item_id, media_type, title, v.viewer_user_id, v.watched, v.watched_at, v.review, v.created_at)
+                for media_type, title, v in views
+            )
+            return write_records(out, fmt, VIEW_FIELDS, rows)
+    raise ValueError(f"unknown kind {kind!r}")
+
+
+def export_file(store: EventStore, path: Path, *, fmt: str | None = None, **kwargs) -> int:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        return export_records(store, f, fmt=fmt or detect_format(path.name), **kwargs)
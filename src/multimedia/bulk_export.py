@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+import discord
+from discord import app_commands
+
+from src.multimedia import bulk
+
+
+def register_export(group: app_commands.Group, client) -> None:
+    @group.command(name="export", description="Export the catalog or watch records as CSV/JSONL (admins)")
+    @app_commands.describe(kind="catalog or views", format="csv or jsonl")
+    @app_commands.choices(
+        kind=[app_commands.Choice(name=k, value=k) for k in bulk.KINDS],
+        format=[app_commands.Choice(name=f, value=f) for f in bulk.FORMATS],
+    )
+    @app_commands.checks.has_permissions(manage_guild=True)
+    async def export_cmd(interaction: discord.Interaction, kind: str, format: str = "csv"):
+        if interaction.guild is None:
+            await interaction.response.send_message("Please use this in a server channel.", ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / f"{kind}-{interaction.guild.id}.{format}"
+            n = await client.store.run(
+                bulk.export_file,
+                client.store.sync,
+                path,
+                fmt=format,
+                kind=kind,
+                guild_id=interaction.guild.id,
+            )
+
+            if path.stat().st_size > interaction.guild.filesize_limit:
+                await interaction.followup.send(
+                    f"{n} rows is over this server's upload limit; "
+                    f"export on the host with `python -m src.multimedia export {kind} --guild {interaction.guild.id} --out <file>`.",
+                    ephemeral=True,
+                )
+                return
+            await interaction.followup.send(f"📤 {n} {kind} rows", file=discord.File(path), ephemeral=True)
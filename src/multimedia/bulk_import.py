@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+import discord
+from discord import app_commands
+
+from src.multimedia import bulk
+
+
+def register_import(group: app_commands.Group, client) -> None:
+    @group.command(name="import", description="Import catalog titles or watch records from a CSV/JSONL file (admins)")
+    @app_commands.describe(
+        kind="catalog: media_type,title[,provider_user_id,created_at] / views: media_type,title,viewer_user_id,...",
+        file=".csv or .jsonl (same columns as /multimedia export)",
+        overwrite="views: replace existing records of the same viewer (default: yes)",
+    )
+    @app_commands.choices(kind=[app_commands.Choice(name=k, value=k) for k in bulk.KINDS])
+    @app_commands.checks.has_permissions(manage_guild=True)
+    async def import_cmd(
+        interaction: discord.Interaction,
+        kind: str,
+        file: discord.Attachment,
+        overwrite: bool = True,
+    ):
+        if interaction.guild is None or interaction.user is None:
+            await interaction.response.send_message("Please use this in a server channel.", ephemeral=True)
+            return
+
+        try:
+            fmt = bulk.detect_format(file.filename)
+        except ValueError as e:
+            await interaction.response.send_message(str(e), ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / f"import.{fmt}"
+            await file.save(path)
+            # the whole pipeline runs on one store worker; each chunk is its own transaction
+            report = await client.store.run(
+                bulk.import_file,
+                client.store.sync,
+                path,
+                fmt=fmt,
+                kind=kind,
+                guild_id=interaction.guild.id,
+                provider_user_id=interaction.user.id,
+                overwrite=overwrite,
+            )
+
+        embed = discord.Embed(title=f"📥 Imported {kind}")
+        embed.add_field(name="Rows", value=str(report.read), inline=True)
+        embed.add_field(name="Written", value=str(report.written), inline=True)
+        embed.add_field(name="Skipped", value=str(report.skipped), inline=True)
+        embed.add_field(name="Invalid", value=str(report.invalid), inline=True)
+        if report.errors:
+            embed.add_field(name="Errors", value="\n".join(report.errors)[:1000], inline=False)
+        await interaction.followup.send(embed=embed, ephemeral=True)
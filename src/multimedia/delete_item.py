@@ -3,6 +3,8 @@ from __future__ import annotations
 import discord
 from discord import app_commands
 
+from src.multimedia.autocomplete import item_id_choices
+
 
 def _can_delete_item(interaction: discord.Interaction, provider_user_id: int) -> bool:
     if interaction.user is None:
@@ -14,14 +16,21 @@ def _can_delete_item(interaction: discord.Interaction, provider_user_id: int) ->
 
 
 def register_delete_item(group: app_commands.Group, client) -> None:
+    async def item_id_autocomplete(
+        interaction: discord.Interaction,
+        current: str,
+    ) -> list[app_commands.Choice[int]]:
+        return await item_id_choices(client, interaction, current)
+
     @group.command(name="delete-item", description="Delete a catalog item (provider or admin only)")
     @app_commands.describe(item_id="Catalog item ID")
+    @app_commands.autocomplete(item_id=item_id_autocomplete)
     async def delete_item(interaction: discord.Interaction, item_id: int):
         if interaction.guild is None:
             await interaction.response.send_message("Please use this in a server channel.", ephemeral=True)
             return
 
-        item = client.store.get_multimedia_item_by_id(guild_id=interaction.guild.id, item_id=int(item_id))
+        item = await client.store.get_multimedia_item_by_id(guild_id=interaction.guild.id, item_id=int(item_id))
         if item is None:
             await interaction.response.send_message("Item not found.", ephemeral=True)
             return
@@ -30,7 +39,7 @@ def register_delete_item(group: app_commands.Group, client) -> None:
             await interaction.response.send_message("Permission denied.", ephemeral=True)
             return
 
-        deleted_views, deleted_items = client.store.delete_multimedia_item(
+        deleted_views, deleted_items = await client.store.delete_multimedia_item(
             guild_id=interaction.guild.id,
             item_id=item.id,
         )
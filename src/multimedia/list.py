@@ -3,6 +3,8 @@ from __future__ import annotations
 import discord
 from discord import app_commands
 
+from src.multimedia.pager import CursorPager
+
 MEDIA_TYPES = ["music", "movie", "tv", "anime", "other"]
 
 
@@ -12,28 +14,29 @@ def register_list(group: app_commands.Group, client) -> None:
         return [app_commands.Choice(name=t, value=t) for t in MEDIA_TYPES if cur in t][:25]
 
     @group.command(name="list", description="List catalog items")
-    @app_commands.describe(media_type="Optional filter", limit="1-50", offset="Pagination offset")
+    @app_commands.describe(media_type="Optional filter", limit="Items per page (1-40)")
     @app_commands.autocomplete(media_type=media_type_autocomplete)
-    async def list_cmd(interaction: discord.Interaction, media_type: str | None = None, limit: int = 20, offset: int = 0):
-        if interaction.guild is None:
+    async def list_cmd(interaction: discord.Interaction, media_type: str | None = None, limit: int = 20):
+        if interaction.guild is None or interaction.user is None:
             await interaction.response.send_message("Please use this in a server channel.", ephemeral=True)
             return
 
-        limit = max(1, min(int(limit), 50))
-        offset = max(0, int(offset))
-
-        items = client.store.list_multimedia_items(
-            guild_id=interaction.guild.id,
-            media_type=media_type,
-            limit=limit,
-            offset=offset,
-        )
-
-        if not items:
-            await interaction.response.send_message("No items found.", ephemeral=True)
-            return
-
-        lines = [f"`#{it.id}` **[{it.media_type}]** {it.title} — by <@{it.provider_user_id}>" for it in items]
-        embed = discord.Embed(title="📚 Multimedia catalog", description="\n".join(lines[:40]))
-        embed.set_footer(text=f"limit={limit}, offset={offset}")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        limit = max(1, min(int(limit), 40))
+        guild_id = interaction.guild.id
+
+        async def fetch(cursor: str | None):
+            return await client.store.list_multimedia_items(
+                guild_id=guild_id,
+                media_type=media_type,
+                limit=limit,
+                cursor=cursor,
+            )
+
+        def render(page, page_no: int) -> discord.Embed:
+            lines = [f"`#{it.id}` **[{it.media_type}]** {it.title} — by <@{it.provider_user_id}>" for it in page.items]
+            embed = discord.Embed(title="📚 Multimedia catalog", description="\n".join(lines))
+            embed.set_footer(text=f"page {page_no}" + (f" · {media_type}" if media_type else ""))
+            return embed
+
+        pager = CursorPager(owner_id=interaction.user.id, fetch=fetch, render=render)
+        await pager.start(interaction, empty_message="No items found.")
@@ -3,35 +3,40 @@ from __future__ import annotations
 import discord
 from discord import app_commands
 
+from src.multimedia.pager import CursorPager
+
 
 def register_my(group: app_commands.Group, client) -> None:
     @group.command(name="my", description="List your watchlist/history")
-    @app_commands.describe(watched="Optional filter", limit="1-50", offset="Pagination offset")
-    async def my(interaction: discord.Interaction, watched: bool | None = None, limit: int = 20, offset: int = 0):
+    @app_commands.describe(watched="Optional filter", limit="Records per page (1-40)")
+    async def my(interaction: discord.Interaction, watched: bool | None = None, limit: int = 20):
         if interaction.guild is None or interaction.user is None:
             await interaction.response.send_message("Please use this in a server channel.", ephemeral=True)
             return
 
-        limit = max(1, min(int(limit), 50))
-        offset = max(0, int(offset))
-
-        pairs = client.store.list_my_multimedia(
-            guild_id=interaction.guild.id,
-            viewer_user_id=interaction.user.id,
-            watched=None if watched is None else (1 if watched else 0),
-            limit=limit,
-            offset=offset,
-        )
-        if not pairs:
-            await interaction.response.send_message("No records found.", ephemeral=True)
-            return
+        limit = max(1, min(int(limit), 40))
+        guild_id = interaction.guild.id
+        user_id = interaction.user.id
+
+        async def fetch(cursor: str | None):
+            return await client.store.list_my_multimedia(
+                guild_id=guild_id,
+                viewer_user_id=user_id,
+                watched=None if watched is None else (1 if watched else 0),
+                limit=limit,
+                cursor=cursor,
+            )
+
+        def render(page, page_no: int) -> discord.Embed:
+            lines = []
+            for item, view in page.items:
+                flag = "✅" if view.watched else "⏳"
+                rev = f" — 💬 {view.review}" if view.review else ""
+                lines.append(f"{flag} `#{item.id}` **[{item.media_type}]** {item.title}{rev}")
 
-        lines = []
-        for item, view in pairs:
-            flag = "✅" if view.watched else "⏳"
-            rev = f" — 💬 {view.review}" if view.review else ""
-            lines.append(f"{flag} `#{item.id}` **[{item.media_type}]** {item.title}{rev}")
+            embed = discord.Embed(title="🗂️ My multimedia", description="\n".join(lines))
+            embed.set_footer(text=f"page {page_no}")
+            return embed
 
-        embed = discord.Embed(title="🗂️ My multimedia", description="\n".join(lines[:40]))
-        embed.set_footer(text=f"limit={limit}, offset={offset}")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        pager = CursorPager(owner_id=user_id, fetch=fetch, render=render)
+        await pager.start(interaction, empty_message="No records found.")
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Awaitable, Callable
+
+import discord
+
+from src.event_storage import Page
+
+FetchPage = Callable[[str | None], Awaitable[Page]]
+RenderPage = Callable[[Page, int], discord.Embed]
+
+
+class CursorPager(discord.ui.View):
+    """
+    ◀ / ▶ buttons over a cursor-paginated store query.
+
+    Each click fetches the neighbouring page with the stored cursor (constant
+    cost at any depth). Only the user who ran the command can page.
+    """
+
+    def __init__(self, *, owner_id: int, fetch: FetchPage, render: RenderPage, timeout: float = 300):
+        super().__init__(timeout=timeout)
+        self.owner_id = int(owner_id)
+        self.fetch = fetch
+        self.render = render
+
+        self.page: Page = Page()
+        self.page_no = 1
+        self._interaction: discord.Interaction | None = None
+
+    async def start(self, interaction: discord.Interaction, *, empty_message: str) -> None:
+        self.page = await self.fetch(None)
+        if not self.page.items:
+            await interaction.response.send_message(empty_message, ephemeral=True)
+            return
+
+        self._interaction = interaction
+        if self.page.next_cursor is None:
+            # single page: no buttons
+            self.stop()
+            await interaction.response.send_message(embed=self.render(self.page, self.page_no), ephemeral=True)
+            return
+
+        self._sync_buttons()
+        await interaction.response.send_message(embed=self.render(self.page, self.page_no), view=self, ephemeral=True)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user is not None and interaction.user.id == self.owner_id
+
+    async def on_timeout(self) -> None:
+        if self._interaction is None:
+            return
+        try:
+            await self._interaction.edit_original_response(view=None)
+        except discord.HTTPException:
+            pass
+
+    def _sync_buttons(self) -> None:
+        self.prev_button.disabled = self.page.prev_cursor is None
+        self.next_button.disabled = self.page.next_cursor is None
+
+    async def _go(self, interaction: discord.Interaction, cursor: str | None, step: int) -> None:
+        page = await self.fetch(cursor)
+        if page.items:
+            self.page_no = max(1, self.page_no + step)
+        else:
+            # the rows around the cursor were deleted meanwhile; restart from the newest
+            page = await self.fetch(None)
+            self.page_no = 1
+        self.page = page
+        self._sync_buttons()
+        await interaction.response.edit_message(embed=self.render(page, self.page_no), view=self)
+
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+    async def prev_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._go(interaction, self.page.prev_cursor, -1)
+
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+    async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._go(interaction, self.page.next_cursor, +1)
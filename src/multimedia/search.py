@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import discord
+from discord import app_commands
+
+MEDIA_TYPES = ["music", "movie", "tv", "anime", "other"]
+
+
+def register_search(group: app_commands.Group, client) -> None:
+    async def media_type_autocomplete(interaction: discord.Interaction, current: str):
+        cur = (current or "").lower()
+        return [app_commands.Choice(name=t, value=t) for t in MEDIA_TYPES if cur in t][:25]
+
+    @group.command(name="search", description="Search the catalog by title")
+    @app_commands.describe(query="Part of the title (or an item ID)", media_type="Optional filter", limit="1-50")
+    @app_commands.autocomplete(media_type=media_type_autocomplete)
+    async def search_cmd(interaction: discord.Interaction, query: str, media_type: str | None = None, limit: int = 20):
+        if interaction.guild is None:
+            await interaction.response.send_message("Please use this in a server channel.", ephemeral=True)
+            return
+
+        query = (query or "").strip()
+        if not query:
+            await interaction.response.send_message("query cannot be empty.", ephemeral=True)
+            return
+
+        limit = max(1, min(int(limit), 50))
+
+        items = await client.store.search_multimedia_items(
+            guild_id=interaction.guild.id,
+            query=query,
+            media_type=media_type,
+            limit=limit,
+        )
+        if not items:
+            await interaction.response.send_message(f"No items match `{query}`.", ephemeral=True)
+            return
+
+        facets = await client.store.multimedia_search_facets(guild_id=interaction.guild.id, query=query)
+
+        lines = [f"`#{it.id}` **[{it.media_type}]** {it.title} — by <@{it.provider_user_id}>" for it in items]
+        embed = discord.Embed(title=f"🔎 {query}", description="\n".join(lines[:40]))
+        if facets:
+            embed.set_footer(text=" · ".join(f"{t}: {n}" for t, n in facets.items()))
+        await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -3,44 +3,55 @@ from __future__ import annotations
 import discord
 from discord import app_commands
 
+from src.multimedia.autocomplete import item_id_choices
+from src.multimedia.pager import CursorPager
+
 
 def register_stats(group: app_commands.Group, client) -> None:
+    async def item_id_autocomplete(
+        interaction: discord.Interaction,
+        current: str,
+    ) -> list[app_commands.Choice[int]]:
+        return await item_id_choices(client, interaction, current)
+
     @group.command(name="stats", description="Show viewers for an item")
-    @app_commands.describe(item_id="Catalog item ID", limit="1-50", offset="Pagination offset")
-    async def stats(interaction: discord.Interaction, item_id: int, limit: int = 20, offset: int = 0):
-        if interaction.guild is None:
+    @app_commands.describe(item_id="Catalog item ID", limit="Viewers per page (1-40)")
+    @app_commands.autocomplete(item_id=item_id_autocomplete)
+    async def stats(interaction: discord.Interaction, item_id: int, limit: int = 20):
+        if interaction.guild is None or interaction.user is None:
             await interaction.response.send_message("Please use this in a server channel.", ephemeral=True)
             return
 
-        limit = max(1, min(int(limit), 50))
-        offset = max(0, int(offset))
+        limit = max(1, min(int(limit), 40))
 
-        item = client.store.get_multimedia_item_by_id(guild_id=interaction.guild.id, item_id=int(item_id))
+        item = await client.store.get_multimedia_item_by_id(guild_id=interaction.guild.id, item_id=int(item_id))
         if item is None:
             await interaction.response.send_message("Item not found.", ephemeral=True)
             return
 
-        views = client.store.list_multimedia_item_views(
-            guild_id=interaction.guild.id,
-            item_id=item.id,
-            limit=limit,
-            offset=offset,
-        )
-        if not views:
-            await interaction.response.send_message("No viewers yet.", ephemeral=True)
-            return
-
-        lines = []
-        for v in views:
-            flag = "✅" if v.watched else "⏳"
-            who = f"<@{v.viewer_user_id}>"
-            when = v.watched_at or v.created_at
-            rev = f" — 💬 {v.review}" if v.review else ""
-            lines.append(f"{flag} {who} — {when}{rev}")
-
-        embed = discord.Embed(
-            title="👥 Item stats",
-            description=f"`#{item.id}` **[{item.media_type}]** {item.title}\n\n" + "\n".join(lines[:40]),
-        )
-        embed.set_footer(text=f"limit={limit}, offset={offset}")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        async def fetch(cursor: str | None):
+            return await client.store.list_multimedia_item_views(
+                guild_id=item.guild_id,
+                item_id=item.id,
+                limit=limit,
+                cursor=cursor,
+            )
+
+        def render(page, page_no: int) -> discord.Embed:
+            lines = []
+            for v in page.items:
+                flag = "✅" if v.watched else "⏳"
+                who = f"<@{v.viewer_user_id}>"
+                when = v.watched_at or v.created_at
+                rev = f" — 💬 {v.review}" if v.review else ""
+                lines.append(f"{flag} {who} — {when}{rev}")
+
+            embed = discord.Embed(
+                title="👥 Item stats",
+                description=f"`#{item.id}` **[{item.media_type}]** {item.title}\n\n" + "\n".join(lines),
+            )
+            embed.set_footer(text=f"page {page_no}")
+            return embed
+
+        pager = CursorPager(owner_id=interaction.user.id, fetch=fetch, render=render)
+        await pager.start(interaction, empty_message="No viewers yet.")
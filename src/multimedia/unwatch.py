@@ -3,35 +3,15 @@ from __future__ import annotations
 import discord
 from discord import app_commands
 
+from src.multimedia.autocomplete import item_id_choices
+
 
 def register_unwatch(group: app_commands.Group, client) -> None:
     async def item_id_autocomplete(
         interaction: discord.Interaction,
         current: str,
     ) -> list[app_commands.Choice[int]]:
-        if interaction.guild is None:
-            return []
-
-        items = client.store.list_multimedia_items_for_guild(
-            guild_id=interaction.guild.id,
-            limit=25,
-        )
-
-        cur = (current or "").strip().lower()
-
-        def matched(it) -> bool:
-            if not cur:
-                return True
-            return str(it.id).startswith(cur) or cur in (it.title or "").lower()
-
-        out: list[app_commands.Choice[int]] = []
-        for it in items:
-            if not matched(it):
-                continue
-            out.append(app_commands.Choice(name=f"{it.id} — {it.title}"[:100], value=int(it.id)))
-            if len(out) >= 25:
-                break
-        return out
+        return await item_id_choices(client, interaction, current)
 
     @group.command(name="unwatch", description="Remove your watch/review record for an item")
     @app_commands.describe(item_id="Catalog item ID (autocomplete shows id & title)")
@@ -41,7 +21,7 @@ def register_unwatch(group: app_commands.Group, client) -> None:
             await interaction.response.send_message("Please use this in a server channel.", ephemeral=True)
             return
 
-        item = client.store.get_multimedia_item_by_id(
+        item = await client.store.get_multimedia_item_by_id(
             guild_id=interaction.guild.id,
             item_id=int(item_id),
         )
@@ -49,7 +29,7 @@ def register_unwatch(group: app_commands.Group, client) -> None:
             await interaction.response.send_message("Item not found.", ephemeral=True)
             return
 
-        rowcount = client.store.delete_multimedia_view(
+        rowcount = await client.store.delete_multimedia_view(
             guild_id=interaction.guild.id,
             item_id=item.id,
             viewer_user_id=interaction.user.id,
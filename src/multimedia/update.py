@@ -47,7 +47,7 @@ def register_update(group: app_commands.Group, client) -> None:
         if review is not None and review.strip() == "-":
             review = None  # 清成 NULL
 
-        rowcount = client.store.update_multimedia_item(
+        rowcount = await client.store.update_multimedia_item(
             guild_id=interaction.guild.id,
             item_id=int(item_id),
             media_type=media_type,
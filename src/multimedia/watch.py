@@ -5,6 +5,8 @@ from datetime import datetime, timezone
 import discord
 from discord import app_commands
 
+from src.multimedia.autocomplete import item_id_choices
+
 
 def _utc_iso_now() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
@@ -15,29 +17,7 @@ def register_watch(group: app_commands.Group, client) -> None:
         interaction: discord.Interaction,
         current: str,
     ) -> list[app_commands.Choice[int]]:
-        if interaction.guild is None:
-            return []
-
-        items = client.store.list_multimedia_items_for_guild(
-            guild_id=interaction.guild.id,
-            limit=25,
-        )
-
-        cur = (current or "").strip().lower()
-
-        def matched(it) -> bool:
-            if not cur:
-                return True
-            return str(it.id).startswith(cur) or cur in (it.title or "").lower()
-
-        out: list[app_commands.Choice[int]] = []
-        for it in items:
-            if not matched(it):
-                continue
-            out.append(app_commands.Choice(name=f"{it.id} — {it.title}"[:100], value=int(it.id)))
-            if len(out) >= 25:
-                break
-        return out
+        return await item_id_choices(client, interaction, current)
 
     @group.command(name="watch", description="Mark watched/listened and add review (per user)")
     @app_commands.describe(
@@ -56,7 +36,7 @@ def register_watch(group: app_commands.Group, client) -> None:
             await interaction.response.send_message("Please use this in a server channel.", ephemeral=True)
             return
 
-        item = client.store.get_multimedia_item_by_id(
+        item = await client.store.get_multimedia_item_by_id(
             guild_id=interaction.guild.id,
             item_id=int(item_id),
         )
@@ -70,7 +50,7 @@ def register_watch(group: app_commands.Group, client) -> None:
         if watched:
             final_review = (review or "").strip() or "-"
 
-        client.store.upsert_multimedia_view(
+        await client.store.upsert_multimedia_view(
             guild_id=interaction.guild.id,
             item_id=item.id,
             viewer_user_id=interaction.user.id,
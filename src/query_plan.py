@@ -0,0 +1,257 @@
+"""
+Query-plan regression check for EventStore.
+
+Runs every store method against a throwaway database, captures the SQL it
+executes, and runs EXPLAIN QUERY PLAN on each statement. A statement fails
+when SQLite plans a full table scan (or a full scan of a non-partial index).
+
+    python -m src.query_plan [-v]
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import sqlite3
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.event_storage import EventStore, _encode_cursor as _cursor
+from src.sharding import ShardScope
+
+_PLANNED = re.compile(r"^\s*(SELECT|UPDATE|DELETE|WITH|INSERT\s+INTO\s+\w+\s*(\([^)]*\))?\s*SELECT)\b", re.I | re.S)
+_SCAN = re.compile(r"^SCAN (\w+)(?: USING (?:COVERING )?INDEX (\w+))?")
+# FTS5 virtual-table scan driven by a MATCH constraint (idxStr contains "M")
+_FTS_MATCH = re.compile(r"^SCAN \w+ VIRTUAL TABLE INDEX \d+:\S*M")
+# FTS5 reads its own shadow tables ('main'.'<name>_config' etc.)
+_FTS_INTERNAL = re.compile(r"'main'\.'\w+_(config|data|idx|docsize|content)'")
+
+NOW = "2025-06-01T12:00:00+00:00"
+
+# bookkeeping tables with a handful of rows; scanning them is fine
+_SMALL_TABLES = {"schema_version", "schema_backfills"}
+
+
+@dataclass
+class PlanResult:
+    sql: str
+    plan: list[str]
+    full_scans: list[str] = field(default_factory=list)
+
+
+def _exercise(store: EventStore) -> None:
+    """
+    Call every store method once with realistic arguments.
+    """
+    g, ch, u = 1, 10, 100
+
+    store.schema_version()
+    store.run_backfill_step()
+
+    store.add_category_option(guild_id=g, name="cat")
+    store.group_commit([("add_category_option", {"guild_id": g, "name": "gc"}), ("mark_memo_reminded", {"memo_id": 1})])
+    store.list_category_options(guild_id=g)
+    store.list_all_category_options(guild_id=g)
+    store.has_category_option(guild_id=g, name="cat")
+    store.delete_category_option(guild_id=g, name="cat")
+
+    ev = store.create_event(
+        guild_id=g, channel_id=ch, title="t", start_iso=NOW, end_iso=None, description=None,
+        created_by=u, expires_at="2025-06-02T12:00:00+00:00", channel_name="t", member_limit=None,
+        managed_channel_id=ch + 1, managed_channel_type="text",
+    )
+    store.is_managed_channel(channel_id=ch + 1)
+    store.list_active_events(guild_id=g, channel_id=ch, now_iso=NOW)
+    store.list_events_for_day(
+        guild_id=g, day_start_iso="2025-06-01T00:00:00+00:00", day_end_iso="2025-06-02T00:00:00+00:00", now_iso=NOW,
+    )
+    store.list_events_for_day_multi(
+        guild_ids=[g, g + 1], day_start_iso="2025-06-01T00:00:00+00:00", day_end_iso="2025-06-02T00:00:00+00:00",
+        now_iso=NOW,
+    )
+    store.set_event_reminder(event_id=ev.id, remind_at_iso=NOW)
+    store.get_event_by_id(event_id=ev.id)
+    store.list_pending_reminders(guild_id=g, now_iso=NOW)
+    store.list_pending_reminder_times()
+    store.fetch_due_reminders(now_iso=NOW)
+    store.fetch_due_reminders(now_iso=NOW, exclude_ids=[ev.id])
+    store.record_reminder_failures(event_ids=[ev.id], error="e", max_attempts=5)
+    store.mark_event_reminded(event_id=ev.id)
+    store.mark_events_reminded(event_ids=[ev.id])
+    store.cancel_event_reminder(event_id=ev.id)
+    store.fetch_expired_events(NOW)
+    store.fetch_expired_events(NOW, limit=50)
+    store.list_expiry_times(until_iso=NOW)
+    store.delete_events(event_ids=[ev.id])
+    store.forget_managed_channel(channel_id=ch + 1)
+    store.delete_expired(NOW)
+
+    memo = store.create_memo_item(
+        guild_id=g, owner_user_id=u, item_type="task", title="m", note=None, due_at_iso=NOW, remind_at_iso=None,
+    )
+    store.list_memo_items(guild_id=g, owner_user_id=u, status="open", limit=10, offset=0)
+    store.list_memo_items(guild_id=g, owner_user_id=u, status="open", limit=10, offset=5)
+    store.get_memo_item_by_id(guild_id=g, owner_user_id=u, memo_id=memo.id)
+    store.reschedule_memo(guild_id=g, owner_user_id=u, memo_id=memo.id, due_at_iso=NOW, remind_at_iso=None)
+    store.list_pending_memo_reminder_times()
+    store.fetch_due_memo_reminders(now_iso=NOW)
+    store.mark_memo_reminded(memo_id=memo.id)
+    store.mark_memos_reminded(memo_ids=[memo.id])
+    store.mark_memo_done(guild_id=g, owner_user_id=u, memo_id=memo.id, duration_seconds=60, thoughts="-")
+    store.cancel_memo(guild_id=g, owner_user_id=u, memo_id=memo.id)
+
+    item, _ = store.create_or_get_multimedia_item(guild_id=g, provider_user_id=u, media_type="movie", title="x")
+    store.get_multimedia_item_by_key(guild_id=g, media_type="movie", title="x")
+    store.get_multimedia_item_by_id(guild_id=g, item_id=item.id)
+    store.list_multimedia_items(guild_id=g)
+    store.list_multimedia_items(guild_id=g, media_type="movie")
+    store.list_multimedia_items(guild_id=g, cursor=_cursor("n", NOW, item.id))
+    store.list_multimedia_items(guild_id=g, media_type="movie", cursor=_cursor("p", NOW, item.id))
+    store.list_multimedia_items_for_user(guild_id=g, user_id=u)
+    store.list_multimedia_items_for_guild(guild_id=g)
+    store.search_multimedia_items(guild_id=g, query="xyz")
+    store.search_multimedia_items(guild_id=g, query="xyz 1", media_type="movie")
+    store.search_multimedia_items(guild_id=g, query="x")
+    store.search_multimedia_items(guild_id=g, query=str(item.id))
+    store.multimedia_search_facets(guild_id=g, query="xyz")
+    store.update_multimedia_item(guild_id=g, item_id=item.id, title="y")
+    store.upsert_multimedia_view(guild_id=g, item_id=item.id, viewer_user_id=u, watched=1, watched_at=NOW, review="-")
+    store.list_my_multimedia(guild_id=g, viewer_user_id=u)
+    store.list_my_multimedia(guild_id=g, viewer_user_id=u, watched=1)
+    store.list_my_multimedia(guild_id=g, viewer_user_id=u, cursor=_cursor("n", NOW, 1))
+    store.list_my_multimedia(guild_id=g, viewer_user_id=u, watched=0, cursor=_cursor("p", NOW, 1))
+    store.list_multimedia_item_views(guild_id=g, item_id=item.id)
+    store.list_multimedia_item_views(guild_id=g, item_id=item.id, cursor=_cursor("n", NOW, 1))
+    store.list_multimedia_item_views(guild_id=g, item_id=item.id, cursor=_cursor("p", NOW, 1))
+    store.import_multimedia_items(guild_id=g, rows=[("movie", "z", u, NOW)])
+    store.import_multimedia_views(guild_id=g, rows=[("movie", "z", u, 1, NOW, "-", NOW)])
+    store.import_multimedia_views(guild_id=g, rows=[("movie", "z", u, 1, NOW, "-", NOW)], overwrite=False)
+    list(store.iter_multimedia_items(guild_id=g))
+    list(store.iter_multimedia_views(guild_id=g))
+    store.delete_multimedia_view(guild_id=g, item_id=item.id, viewer_user_id=u)
+    store.delete_multimedia_item(guild_id=g, item_id=item.id)
+
+    store.enqueue_teardown(batch="b", guild_id=g, kind="purge", channels=[(ch, "t"), (None, "x")], reason="r")
+    store.fetch_due_teardown_jobs(now_iso=NOW)
+    store.fetch_due_teardown_jobs(now_iso=NOW, exclude_guild_ids=[g + 1, g + 2])
+    store.next_teardown_attempt_at()
+    store.retry_teardown_job(job_id=1, next_attempt_at=NOW, error="e")
+    store.finish_teardown_job(job_id=1, ok=True)
+    store.teardown_progress(batch="b")
+    store.list_running_teardown_batches()
+    store.close_teardown_batch(batch="b", status="done")
+
+    store.record_digest_deliveries(digest_date="2025-06-01", rows=[(g, ch, 1, None)])
+    store.list_sent_digests(digest_date="2025-06-01")
+
+    store.set_guild_setting(guild_id=g, key="k", value="1", updated_by=u)
+    store.get_guild_settings(guild_id=g)
+    store.delete_guild_setting(guild_id=g, key="k")
+    store.list_guild_settings_changes(since_version=0)
+
+    store.set_app_state(key="k", value="v")
+    store.get_app_state(key="k")
+
+    store.dashboard_me(guild_id=g, user_id=u, now_iso=NOW)
+    store.dashboard_server(guild_id=g, now_iso=NOW)
+
+
+def _exercise_sharded(store: EventStore) -> None:
+    """
+    The background queries that carry a shard filter (see ShardScope.sql).
+    """
+    store.fetch_expired_events(NOW, limit=50)
+    store.list_expiry_times(until_iso=NOW)
+    store.delete_expired(NOW)
+    store.fetch_due_reminders(now_iso=NOW)
+    store.fetch_due_reminders(now_iso=NOW, exclude_ids=[1])
+    store.list_pending_reminder_times()
+    store.list_pending_memo_reminder_times()
+    store.fetch_due_memo_reminders(now_iso=NOW)
+    store.fetch_due_teardown_jobs(now_iso=NOW)
+    store.fetch_due_teardown_jobs(now_iso=NOW, exclude_guild_ids=[1])
+    store.next_teardown_attempt_at()
+    store.list_running_teardown_batches()
+
+
+def _partial_indexes(conn: sqlite3.Connection) -> set[str]:
+    names: set[str] = set()
+    tables = [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table';")]
+    for t in tables:
+        for row in conn.execute(f"PRAGMA index_list({t!r});"):
+            # (seq, name, unique, origin, partial)
+            if row[4]:
+                names.add(row[1])
+    return names
+
+
+def check_query_plans(db_path: Path | None = None) -> list[PlanResult]:
+    captured: list[str] = []
+
+    def on_connect(conn: sqlite3.Connection) -> None:
+        conn.set_trace_callback(captured.append)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = db_path or Path(tmp) / "plan.db"
+        store = EventStore(path, readers=1, on_connect=on_connect)
+        # one-off migration work (e.g. counter rebuilds) is allowed to scan
+        captured.clear()
+        try:
+            _exercise(store)
+        finally:
+            store.close()
+
+        store = EventStore(path, readers=1, on_connect=on_connect, shard_scope=ShardScope(4, (0, 2)))
+        try:
+            _exercise_sharded(store)
+        finally:
+            store.close()
+
+        seen: set[str] = set()
+        results: list[PlanResult] = []
+        conn = sqlite3.connect(path)
+        try:
+            partial = _partial_indexes(conn)
+            for sql in captured:
+                sql = sql.strip()
+                if sql in seen or not _PLANNED.match(sql) or _FTS_INTERNAL.search(sql):
+                    continue
+                seen.add(sql)
+
+                plan = [r[3] for r in conn.execute("EXPLAIN QUERY PLAN " + sql)]
+                res = PlanResult(sql=sql, plan=plan)
+                for detail in plan:
+                    m = _SCAN.match(detail)
+                    if m is None or _FTS_MATCH.match(detail) or m.group(1) == "CONSTANT" or m.group(1) in _SMALL_TABLES:
+                        continue
+                    index = m.group(2)
+                    if index is None or index not in partial:
+                        res.full_scans.append(detail)
+                results.append(res)
+        finally:
+            conn.close()
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-v", "--verbose", action="store_true", help="print every plan, not only failures")
+    args = parser.parse_args(argv)
+
+    results = check_query_plans()
+    bad = [r for r in results if r.full_scans]
+
+    for r in results:
+        if r.full_scans or args.verbose:
+            flag = "FULL SCAN" if r.full_scans else "ok"
+            print(f"[{flag}] {' '.join(r.sql.split())}")
+            for detail in r.plan:
+                print(f"    {detail}")
+
+    print(f"{len(results)} statements checked, {len(bad)} with full scans")
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
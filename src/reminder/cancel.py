@@ -12,7 +12,7 @@ def register_cancel(group: app_commands.Group, client) -> None:
             await interaction.response.send_message("Use this in a server.", ephemeral=True)
             return
 
-        ev = client.store.get_event_by_id(event_id=event_id)
+        ev = await client.store.get_event_by_id(event_id=event_id)
         if ev is None or ev.guild_id != interaction.guild.id:
             await interaction.response.send_message("Event not found in this server.", ephemeral=True)
             return
@@ -21,9 +21,11 @@ def register_cancel(group: app_commands.Group, client) -> None:
             await interaction.response.send_message("This event has no reminder set.", ephemeral=True)
             return
 
-        updated = client.store.cancel_event_reminder(event_id=event_id)
+        updated = await client.store.cancel_event_reminder(event_id=event_id)
         if updated <= 0:
             await interaction.response.send_message("Failed to cancel reminder.", ephemeral=True)
             return
 
+        client.reminders.cancel("event", event_id)
+
         await interaction.response.send_message(f"✅ Reminder cancelled for event `{event_id}`.", ephemeral=True)
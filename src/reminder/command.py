@@ -47,7 +47,7 @@ def register_reminder_commands(tree: app_commands.CommandTree, client):
             )
             return
 
-        updated = client.store.set_event_reminder(
+        updated = await client.store.set_event_reminder(
             event_id=event_id,
             remind_at_iso=remind_at_iso,
             remind_in_channel=in_channel,
@@ -60,6 +60,8 @@ def register_reminder_commands(tree: app_commands.CommandTree, client):
             )
             return
 
+        client.reminders.schedule("event", event_id, remind_at_iso)
+
         await interaction.response.send_message(
             f"⏰ Reminder set for event `{event_id}` at **{when}** (Paris)",
             ephemeral=True,
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, TypeVar
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * (len(sorted_values) - 1)))))
+    return sorted_values[k]
+
+
+@dataclass
+class BatchReport:
+    kind: str
+    size: int
+    sent: int
+    failed: int
+    elapsed_seconds: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+    @property
+    def per_second(self) -> float:
+        return self.sent / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def log(self) -> None:
+        logger.info(
+            "reminder batch kind=%s size=%s sent=%s failed=%s elapsed=%.3fs rate=%.1f/s p50=%.1fms p95=%.1fms p99=%.1fms max=%.1fms",
+            self.kind, self.size, self.sent, self.failed, self.elapsed_seconds, self.per_second,
+            self.p50_ms, self.p95_ms, self.p99_ms, self.max_ms,
+        )
+
+
+@dataclass
+class BatchResult(Generic[T]):
+    sent: list[T]
+    failed: list[T]
+    report: BatchReport
+
+
+class ReminderDelivery:
+    """
+    Fan-out for reminder sends.
+
+    - at most `concurrency` sends in flight per batch
+    - sends to the same route (a DM user or a channel) are serialized, so a burst
+      for one destination queues locally instead of hitting its Discord bucket in
+      parallel (discord.py still handles any 429 it receives)
+    """
+
+    def __init__(self, client: discord.Client, *, concurrency: int = 8):
+        self.client = client
+        self.concurrency = max(1, int(concurrency))
+        self._routes: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+
+    @asynccontextmanager
+    async def route(self, key: str):
+        lock = self._routes.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._routes[key] = lock
+        async with lock:
+            yield
+
+    async def get_user(self, user_id: int) -> discord.abc.User:
+        # cached users skip the HTTP round-trip
+        user = self.client.get_user(int(user_id))
+        if user is None:
+            user = await self.client.fetch_user(int(user_id))
+        return user
+
+    async def send_dm(self, user_id: int, content: str) -> None:
+        async with self.route(f"user:{int(user_id)}"):
+            user = await self.get_user(user_id)
+            await user.send(content)
+
+    async def send_channel(self, channel_id: int, content: str) -> bool:
+        ch = self.client.get_channel(int(channel_id))
+        if ch is None:
+            return False
+        async with self.route(f"channel:{int(channel_id)}"):
+            await ch.send(content)
+        return True
+
+    async def run_batch(
+        self,
+        kind: str,
+        items: list[T],
+        send: Callable[[T], Awaitable[bool]],
+    ) -> BatchResult[T]:
+        sem = asyncio.Semaphore(self.concurrency)
+        latencies: list[float] = []
+
+        async def one(item: T) -> bool:
+            async with sem:
+                t0 = time.perf_counter()
+                try:
+                    return await send(item)
+                except Exception:
+                    logger.exception("reminder send failed (kind=%s)", kind)
+                    return False
+                finally:
+                    latencies.append(time.perf_counter() - t0)
+
+        t_batch = time.perf_counter()
+        results = await asyncio.gather(*(one(it) for it in items))
+        elapsed = time.perf_counter() - t_batch
+
+        sent = [it for it, ok in zip(items, results) if ok]
+        failed = [it for it, ok in zip(items, results) if not ok]
+
+        lat_ms = sorted(x * 1000 for x in latencies)
+        report = BatchReport(
+            kind=kind,
+            size=len(items),
+            sent=len(sent),
+            failed=len(failed),
+            elapsed_seconds=elapsed,
+            p50_ms=_percentile(lat_ms, 50),
+            p95_ms=_percentile(lat_ms, 95),
+            p99_ms=_percentile(lat_ms, 99),
+            max_ms=lat_ms[-1] if lat_ms else 0.0,
+        )
+        if items:
+            report.log()
+        return BatchResult(sent=sent, failed=failed, report=report)
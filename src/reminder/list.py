@@ -24,7 +24,7 @@ def register_list(group: app_commands.Group, client) -> None:
         limit = max(1, min(int(limit), 20))
         now_iso = _now_utc_iso()
 
-        events = client.store.list_pending_reminders(
+        events = await client.store.list_pending_reminders(
             guild_id=interaction.guild.id,
             now_iso=now_iso,
             limit=limit,
@@ -1,69 +1,89 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
+from datetime import timezone
 
 import discord
-from discord.ext import tasks
-
-logger = logging.getLogger(__name__)
 
+from src.reminder.delivery import ReminderDelivery
 
-def now_utc_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+logger = logging.getLogger(__name__)
 
 
 class ReminderScheduler:
     """
-    轮询 DB，发送到点提醒。
+    发送到点的活动提醒。由 ReminderTimer 在最早的提醒到点时唤醒，不再轮询。
+    同一批提醒并发发送（ReminderDelivery 限流），成功的在一个事务里批量标记。
+    发送失败的提醒在本轮跳过（不挡住后面的提醒），连续失败 max_attempts 次后关闭。
     依赖 store 方法：
-      - fetch_due_reminders(now_iso=..., limit=...)
-      - mark_event_reminded(event_id=...)
+      - fetch_due_reminders(now_iso=..., limit=..., exclude_ids=[...])
+      - mark_events_reminded(event_ids=[...])
+      - record_reminder_failures(event_ids=[...], error=..., max_attempts=...)
     """
 
-    def __init__(self, client: discord.Client, poll_seconds: int = 15):
+    def __init__(
+        self,
+        client: discord.Client,
+        batch_size: int = 50,
+        delivery: ReminderDelivery | None = None,
+        max_attempts: int = 5,
+    ):
         self.client = client
-        self.poll_seconds = max(5, min(int(poll_seconds), 60))
-
-        self._poll_due.change_interval(seconds=self.poll_seconds)
-
-    def start(self) -> None:
-        if not self._poll_due.is_running():
-            self._poll_due.start()
+        self.batch_size = max(1, min(int(batch_size), 500))
+        self.delivery = delivery or ReminderDelivery(client)
+        self.max_attempts = max(1, int(max_attempts))
 
-    def stop(self) -> None:
-        if self._poll_due.is_running():
-            self._poll_due.cancel()
-
-    @tasks.loop(seconds=15) 
-    async def _poll_due(self):
-        await self._run_once()
-
-    @_poll_due.before_loop
-    async def _before(self):
-        await self.client.wait_until_ready()
-        logger.info("ReminderScheduler started (poll_seconds=%s)", self.poll_seconds)
-
-    async def _run_once(self):
+    async def run_due(self) -> list[int]:
+        """
+        Send every due reminder. Returns event ids whose delivery failed (retry later).
+        """
         store = getattr(self.client, "store", None)
         if store is None:
-            return
-
-        now_iso = now_utc_iso()
-
-        try:
-            due_events = store.fetch_due_reminders(now_iso=now_iso, limit=50)
-        except Exception:
-            logger.exception("fetch_due_reminders failed")
-            return
+            return []
+
+        failed: set[int] = set()
+        while True:
+            # the client's clock (wall clock in the bot, simulated in src.bench)
+            now_iso = self.client.now_time().astimezone(timezone.utc).isoformat()
+            try:
+                due_events = await store.fetch_due_reminders(
+                    now_iso=now_iso, limit=self.batch_size, exclude_ids=failed,
+                )
+            except Exception:
+                logger.exception("fetch_due_reminders failed")
+                return sorted(failed)
+
+            result = await self.delivery.run_batch("event", due_events, self._send_one)
+
+            if result.sent:
+                try:
+                    await store.mark_events_reminded(event_ids=[ev.id for ev in result.sent])
+                except Exception:
+                    # the sent rows are still unmarked: stop rather than fetch them again
+                    logger.exception("mark_events_reminded failed (%s events)", len(result.sent))
+                    return sorted(failed | {ev.id for ev in result.failed})
 
-        for ev in due_events:
-            sent = await self._send_one(ev)
-            if sent:
+            if result.failed:
+                # skipped for the rest of this run; closed for good after max_attempts
+                failed.update(ev.id for ev in result.failed)
                 try:
-                    store.mark_event_reminded(event_id=ev.id)
+                    closed = await store.record_reminder_failures(
+                        event_ids=[ev.id for ev in result.failed],
+                        error="DM and channel delivery failed",
+                        max_attempts=self.max_attempts,
+                    )
                 except Exception:
-                    logger.exception("mark_event_reminded failed (event_id=%s)", ev.id)
+                    logger.exception("record_reminder_failures failed (%s events)", len(result.failed))
+                else:
+                    if closed:
+                        logger.warning("giving up on %s event reminders after %s attempts: %s",
+                                       len(closed), self.max_attempts, closed)
+                    # closed rows are reminded = 1 now: nothing to retry or exclude
+                    failed.difference_update(closed)
+
+            # a full batch means more may be due
+            if len(due_events) < self.batch_size:
+                return sorted(failed)
 
     async def _send_one(self, ev) -> bool:
         """
@@ -80,8 +100,7 @@ class ReminderScheduler:
         )
 
         try:
-            user = await self.client.fetch_user(user_id)
-            await user.send(msg)
+            await self.delivery.send_dm(user_id, msg)
             return True
         except discord.Forbidden:
             pass
@@ -89,12 +108,10 @@ class ReminderScheduler:
             logger.exception("DM send failed (user_id=%s, event_id=%s)", user_id, ev.id)
 
         if remind_in_channel:
-            ch = self.client.get_channel(channel_id)
-            if ch is not None:
-                try:
-                    await ch.send(f"<@{user_id}> {msg}")
+            try:
+                if await self.delivery.send_channel(channel_id, f"<@{user_id}> {msg}"):
                     return True
-                except Exception:
-                    logger.exception("Channel send failed (channel_id=%s, event_id=%s)", channel_id, ev.id)
+            except Exception:
+                logger.exception("Channel send failed (channel_id=%s, event_id=%s)", channel_id, ev.id)
 
         return False
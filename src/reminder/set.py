@@ -40,12 +40,12 @@ def register_set(group: app_commands.Group, client) -> None:
             )
             return
 
-        ev = client.store.get_event_by_id(event_id=event_id)
+        ev = await client.store.get_event_by_id(event_id=event_id)
         if ev is None or ev.guild_id != interaction.guild.id:
             await interaction.response.send_message("Event not found in this server.", ephemeral=True)
             return
 
-        updated = client.store.set_event_reminder(
+        updated = await client.store.set_event_reminder(
             event_id=event_id,
             remind_at_iso=remind_at_iso,
             remind_in_channel=in_channel,
@@ -54,6 +54,8 @@ def register_set(group: app_commands.Group, client) -> None:
             await interaction.response.send_message("Failed to set reminder.", ephemeral=True)
             return
 
+        client.reminders.schedule("event", event_id, remind_at_iso)
+
         await interaction.response.send_message(
             f"⏰ 提示器已部署给指定任务： `{event_id}`，您需要在巴黎时间 {when} 积极响应.",
             ephemeral=True,
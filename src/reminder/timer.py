@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+
+from src.telemetry.timing import loop_tick
+
+logger = logging.getLogger(__name__)
+
+# handler() -> ids that are still pending (delivery failed), retried later
+DueHandler = Callable[[], Awaitable[list[int]]]
+
+
+def iso_to_ts(dt_str: str) -> float:
+    d = datetime.fromisoformat(dt_str)
+    if d.tzinfo is None:
+        d = d.replace(tzinfo=timezone.utc)
+    return d.timestamp()
+
+
+class ReminderTimer:
+    """
+    One in-memory min-heap of upcoming reminders (event + memo), keyed by remind time.
+
+    The heap is only a wake-up hint: when the head is due, the handler for that kind
+    runs its DB query, so stale entries are harmless. Changes are applied lazily —
+    schedule()/cancel() update `_due` and push a new entry; outdated heap entries are
+    dropped when they reach the top.
+    """
+
+    def __init__(self, client, *, retry_seconds: int = 60, max_sleep_seconds: int = 3600):
+        self.client = client
+        self.retry_seconds = max(5, int(retry_seconds))
+        self.max_sleep_seconds = max(1, int(max_sleep_seconds))
+
+        self._heap: list[tuple[float, str, int]] = []
+        self._due: dict[tuple[str, int], float] = {}
+        self._handlers: dict[str, DueHandler] = {}
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def register(self, kind: str, handler: DueHandler) -> None:
+        self._handlers[kind] = handler
+
+    def schedule(self, kind: str, item_id: int, remind_at_iso: str | None) -> None:
+        if not remind_at_iso:
+            self.cancel(kind, item_id)
+            return
+        try:
+            ts = iso_to_ts(remind_at_iso)
+        except ValueError:
+            logger.warning("bad remind_at for %s #%s: %r", kind, item_id, remind_at_iso)
+            return
+        self._push(kind, int(item_id), ts)
+
+    def cancel(self, kind: str, item_id: int) -> None:
+        self._due.pop((kind, int(item_id)), None)
+
+    def pending(self) -> int:
+        return len(self._due)
+
+    def next_due_ts(self) -> float | None:
+        self._drop_stale_head()
+        return self._heap[0][0] if self._heap else None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def hydrate(self) -> None:
+        store = self.client.store
+        for item_id, remind_at_iso in await store.list_pending_reminder_times():
+            self.schedule("event", item_id, remind_at_iso)
+        for item_id, remind_at_iso in await store.list_pending_memo_reminder_times():
+            self.schedule("memo", item_id, remind_at_iso)
+        logger.info("ReminderTimer hydrated (%s pending)", self.pending())
+
+    def _push(self, kind: str, item_id: int, ts: float) -> None:
+        key = (kind, item_id)
+        self._due[key] = ts
+        heapq.heappush(self._heap, (ts, kind, item_id))
+
+        # only wake the runner if this became the earliest deadline
+        if self._heap[0] == (ts, kind, item_id):
+            self._wake.set()
+
+    def _drop_stale_head(self) -> None:
+        while self._heap:
+            ts, kind, item_id = self._heap[0]
+            if self._due.get((kind, item_id)) == ts:
+                return
+            heapq.heappop(self._heap)
+
+    def _pop_due(self, now_ts: float) -> dict[str, list[int]]:
+        due: dict[str, list[int]] = {}
+        while True:
+            self._drop_stale_head()
+            if not self._heap or self._heap[0][0] > now_ts:
+                return due
+            _, kind, item_id = heapq.heappop(self._heap)
+            del self._due[(kind, item_id)]
+            due.setdefault(kind, []).append(item_id)
+
+    async def _sleep_until_next(self) -> None:
+        head = self.next_due_ts()
+        timeout = self.max_sleep_seconds if head is None else min(head - time.time(), self.max_sleep_seconds)
+        if timeout <= 0:
+            return
+        self._wake.clear()
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _hydrate_with_retry(self) -> None:
+        delay = 5
+        while True:
+            try:
+                await self.hydrate()
+                return
+            except Exception:
+                logger.exception("ReminderTimer hydrate failed, retrying in %ss", delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_sleep_seconds)
+
+    async def step(self, now_ts: float) -> int:
+        """
+        Run the handler of every kind with an entry due at `now_ts`, and requeue what
+        could not be delivered `retry_seconds` later. Returns how many handlers ran.
+        """
+        due = self._pop_due(now_ts)
+        ran = 0
+        for kind in sorted(due):
+            handler = self._handlers.get(kind)
+            if handler is None:
+                continue
+            ran += 1
+            try:
+                with loop_tick(f"reminder:{kind}"):
+                    retry_ids = await handler()
+            except Exception:
+                # the popped entries are only in memory: put them back or they
+                # are lost until the next hydrate
+                logger.exception("reminder handler failed (kind=%s)", kind)
+                retry_ids = due[kind]
+            retry_at = now_ts + self.retry_seconds
+            for item_id in retry_ids:
+                self._push(kind, int(item_id), retry_at)
+        return ran
+
+    async def _run(self) -> None:
+        await self.client.wait_until_ready()
+        await self._hydrate_with_retry()
+
+        while True:
+            try:
+                await self._sleep_until_next()
+                await self.step(time.time())
+
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("ReminderTimer error")
+                await asyncio.sleep(1)
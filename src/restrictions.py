@@ -1,4 +1,106 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
 import discord
+from discord import app_commands
+
+
+@dataclass
+class _GuildChannels:
+    settings_version: int
+    # allowed channel ids for commands without their own list
+    default_ids: frozenset[int] | None
+    per_command: dict[str, frozenset[int]] = field(default_factory=dict)
+    # config names that matched no channel (used for the hint)
+    missing_names: dict[str | None, tuple[str, ...]] = field(default_factory=dict)
+
+
+class AllowedChannelIndex:
+    """
+    Allowed channel ids per guild for the channel-restricted commands.
+
+    Built from the guild's settings: ids set with /settings are used as they are,
+    config.yaml channel names are resolved to ids once. The MyClient channel
+    create/update/delete listeners drop a guild's entry, and a settings change
+    shows up as a new settings version, so a check is a dict lookup plus an
+    integer compare.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self._guilds: dict[int, _GuildChannels] = {}
+
+    def invalidate(self, guild_id: int) -> None:
+        self._guilds.pop(int(guild_id), None)
+
+    def _resolve(self, guild: discord.Guild, ids: frozenset[int], names: tuple[str, ...]) -> tuple[frozenset[int], tuple[str, ...]]:
+        if ids:
+            # deleted channels drop out (the delete listener rebuilds this entry)
+            return frozenset(i for i in ids if guild.get_channel(i) is not None), ()
+        if not names:
+            return ids, ()
+        wanted = set(names)
+        found = frozenset(ch.id for ch in guild.text_channels if ch.name in wanted)
+        found_names = {ch.name for ch in guild.text_channels if ch.id in found}
+        return found, tuple(n for n in names if n not in found_names)
+
+    def _build(self, guild: discord.Guild, settings) -> _GuildChannels:
+        configured = bool(settings.event_create_channel_ids or settings.event_create_channel_names)
+        default_ids, missing = self._resolve(guild, settings.event_create_channel_ids, settings.event_create_channel_names)
+        entry = _GuildChannels(
+            settings_version=settings.version,
+            default_ids=default_ids if configured else None,
+            missing_names={None: missing},
+        )
+        for command in set(settings.command_channel_ids) | set(settings.command_channel_names):
+            ids, missing = self._resolve(
+                guild,
+                settings.command_channel_ids.get(command, frozenset()),
+                settings.command_channel_names.get(command, ()),
+            )
+            entry.per_command[command] = ids
+            entry.missing_names[command] = missing
+        return entry
+
+    async def lookup(self, guild: discord.Guild, command: str | None) -> tuple[frozenset[int] | None, tuple[str, ...]]:
+        """
+        (allowed channel ids or None when nothing is configured, config names not found)
+        """
+        settings = await self.client.settings.get(guild.id)
+        entry = self._guilds.get(guild.id)
+        if entry is None or entry.settings_version != settings.version:
+            entry = self._build(guild, settings)
+            self._guilds[guild.id] = entry
+
+        if command is not None and command in entry.per_command:
+            return entry.per_command[command], entry.missing_names.get(command, ())
+        return entry.default_ids, entry.missing_names.get(None, ())
+
+    # called from MyClient.on_guild_channel_* -------------------------------
+    def on_channel_create(self, channel: discord.abc.GuildChannel) -> None:
+        # a new channel may carry a configured name
+        self.invalidate(channel.guild.id)
+
+    def on_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel) -> None:
+        if before.name != after.name:
+            self.invalidate(after.guild.id)
+
+    def on_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        self.invalidate(channel.guild.id)
+
+
+def restricted_command_names(tree: app_commands.CommandTree) -> list[str]:
+    """
+    Qualified names of the commands using only_in_event_create_channel.
+    """
+    return sorted(
+        cmd.qualified_name
+        for cmd in tree.walk_commands()
+        if isinstance(cmd, app_commands.Command)
+        and any(getattr(check, "__event_create_channel__", False) for check in cmd.checks)
+    )
+
 
 def only_in_event_create_channel(client):
 
@@ -10,31 +112,27 @@ def only_in_event_create_channel(client):
             )
             return False
 
-        cfg = client.config.get("event", {})
-        allowed_name = cfg.get("event_create_channel_name")
+        command = interaction.command.qualified_name if interaction.command else None
+        allowed, missing = await client.allowed_channels.lookup(interaction.guild, command)
 
-        if not allowed_name:
+        if allowed is None:
             await interaction.response.send_message(
                 "Event create channel is not configured.",
                 ephemeral=True,
             )
             return False
 
-        if interaction.channel.name != allowed_name:
-            target = discord.utils.get(
-                interaction.guild.text_channels,
-                name=allowed_name,
-            )
-
-            hint = (
-                f"Please use this command in {target.mention}."
-                if target
-                else f"Please use this command in **#{allowed_name}**."
-            )
-
-            await interaction.response.send_message(hint, ephemeral=True)
-            return False
+        if interaction.channel.id in allowed:
+            return True
 
-        return True
+        targets = [f"<#{cid}>" for cid in sorted(allowed)] + [f"**#{n}**" for n in missing]
+        hint = (
+            f"Please use this command in {', '.join(targets[:5])}."
+            if targets
+            else "None of the allowed channels exist any more. Ask an admin to update `/settings`."
+        )
+        await interaction.response.send_message(hint, ephemeral=True)
+        return False
 
+    predicate.__event_create_channel__ = True
     return discord.app_commands.check(predicate)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import discord
+from discord import app_commands
+
+from src.settings.cache import GuildSettings, GuildSettingsCache
+from src.settings.reset import register_settings_reset
+from src.settings.set import register_settings_set
+from src.settings.show import register_settings_show
+
+
+def register_settings_commands(tree: app_commands.CommandTree, client) -> None:
+    settings_group = app_commands.Group(
+        name="settings",
+        description="Per-server bot settings (admins)",
+        guild_only=True,
+        default_permissions=discord.Permissions(manage_guild=True),
+    )
+    tree.add_command(settings_group)
+
+    register_settings_show(settings_group, client)
+    register_settings_set(settings_group, client)
+    register_settings_reset(settings_group, client)
+
+__all__ = ["GuildSettings", "GuildSettingsCache", "register_settings_commands"]
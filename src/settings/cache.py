@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import re
+from dataclasses import dataclass, field, replace
+
+logger = logging.getLogger(__name__)
+
+_ID = re.compile(r"\d{15,22}")
+_TRUE = {"true", "yes", "on", "1", "y"}
+_FALSE = {"false", "no", "off", "0", "n"}
+
+
+@dataclass(frozen=True)
+class SettingSpec:
+    key: str
+    kind: str  # channel / channel_ids / bool / role_ids / user_ids
+    description: str
+
+
+# "channels:<command>" keys hold a per-command allow-list (see spec_for)
+COMMAND_CHANNELS_PREFIX = "channels:"
+
+SETTINGS: dict[str, SettingSpec] = {
+    s.key: s
+    for s in [
+        SettingSpec("event_create_channels", "channel_ids", "Channels where /event create and /category are allowed"),
+        SettingSpec("welcome_channel", "channel", "Channel for welcome messages"),
+        SettingSpec("ads_channel", "channel", "Channel for the daily event digest"),
+        SettingSpec("ads_enabled", "bool", "Post the daily event digest"),
+        SettingSpec("purge_role_ids", "role_ids", "Roles allowed to use /category purge"),
+        SettingSpec("purge_user_ids", "user_ids", "Users allowed to use /category purge"),
+    ]
+}
+
+# keys renamed since they were first stored
+_LEGACY_KEYS = {"event_create_channel": "event_create_channels"}
+
+
+def spec_for(key: str) -> SettingSpec | None:
+    spec = SETTINGS.get(key)
+    if spec is None and key.startswith(COMMAND_CHANNELS_PREFIX) and len(key) > len(COMMAND_CHANNELS_PREFIX):
+        command = key[len(COMMAND_CHANNELS_PREFIX):]
+        spec = SettingSpec(key, "channel_ids", f"Channels where /{command} is allowed (instead of event_create_channels)")
+    return spec
+
+
+@dataclass(frozen=True)
+class GuildSettings:
+    """
+    Effective settings of one guild: config.yaml values overridden by guild_settings rows.
+    Channels set per guild are stored by id; the *_name fields are the config.yaml fallback.
+    """
+
+    guild_id: int
+    version: int = 0
+
+    event_create_channel_ids: frozenset[int] = frozenset()
+    event_create_channel_names: tuple[str, ...] = ()
+    # per-command allow-lists, keyed by qualified command name ("category purge")
+    command_channel_ids: dict[str, frozenset[int]] = field(default_factory=dict)
+    command_channel_names: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    welcome_channel_id: int | None = None
+    welcome_channel_name: str | None = None
+    ads_enabled: bool = False
+    ads_channel_id: int | None = None
+    ads_channel_name: str | None = None
+    purge_role_ids: frozenset[int] = frozenset()
+    purge_user_ids: frozenset[int] = frozenset()
+
+    # keys set for this guild (the rest are config.yaml defaults)
+    overridden: frozenset[str] = field(default_factory=frozenset)
+
+
+def _names(value) -> tuple[str, ...]:
+    if not value:
+        return ()
+    if isinstance(value, str):
+        value = [value]
+    return tuple(str(v).strip() for v in value if str(v).strip())
+
+
+def defaults_from_config(config: dict) -> GuildSettings:
+    event_cfg = config.get("event", {}) or {}
+    welcome_cfg = config.get("welcome", {}) or {}
+    ads_cfg = config.get("ads", {}) or {}
+    purge_cfg = ((config.get("category", {}) or {}).get("purge", {})) or {}
+    return GuildSettings(
+        guild_id=0,
+        event_create_channel_names=_names(event_cfg.get("event_create_channel_name")),
+        command_channel_names={
+            str(cmd).strip(): _names(names) for cmd, names in (event_cfg.get("command_channels") or {}).items()
+        },
+        welcome_channel_name=welcome_cfg.get("channel_name") or None,
+        ads_enabled=bool(ads_cfg.get("enabled", False)),
+        ads_channel_id=int(ads_cfg["channel_id"]) if ads_cfg.get("channel_id") else None,
+        ads_channel_name=ads_cfg.get("channel_name") or None,
+        purge_role_ids=frozenset(int(i) for i in (purge_cfg.get("allowed_role_ids") or [])),
+        purge_user_ids=frozenset(int(i) for i in (purge_cfg.get("allowed_user_ids") or [])),
+    )
+
+
+def parse_setting_value(key: str, text: str) -> object:
+    """
+    User input -> JSON-able value for `key`. Raises ValueError with a user-facing message.
+    """
+    spec = spec_for(key)
+    if spec is None:
+        raise ValueError(f"Unknown setting: `{key}`")
+    text = (text or "").strip()
+
+    if spec.kind == "channel":
+        ids = _ID.findall(text)
+        if len(ids) != 1:
+            raise ValueError("Expected one channel (mention it with #, or paste its ID).")
+        return int(ids[0])
+
+    if spec.kind == "channel_ids":
+        ids = _ID.findall(text)
+        if not ids:
+            raise ValueError("Expected one or more channels (#mentions or IDs).")
+        return sorted({int(i) for i in ids})
+
+    if spec.kind == "bool":
+        low = text.lower()
+        if low in _TRUE:
+            return True
+        if low in _FALSE:
+            return False
+        raise ValueError("Expected true or false.")
+
+    ids = _ID.findall(text)
+    if not ids:
+        what = "roles" if spec.kind == "role_ids" else "users"
+        raise ValueError(f"Expected one or more {what} (mentions or IDs).")
+    return sorted({int(i) for i in ids})
+
+
+def format_setting(settings: GuildSettings, key: str) -> str:
+    spec = spec_for(key)
+    if key == "event_create_channels" or key.startswith(COMMAND_CHANNELS_PREFIX):
+        if key == "event_create_channels":
+            ids, names = settings.event_create_channel_ids, settings.event_create_channel_names
+        else:
+            command = key[len(COMMAND_CHANNELS_PREFIX):]
+            ids = settings.command_channel_ids.get(command, frozenset())
+            names = settings.command_channel_names.get(command, ())
+        parts = [f"<#{i}>" for i in sorted(ids)] or [f"#{n}" for n in names]
+        return " ".join(parts) or "—"
+    if spec.kind == "channel":
+        cid = getattr(settings, f"{key}_id")
+        name = getattr(settings, f"{key}_name")
+        return f"<#{cid}>" if cid else (f"#{name}" if name else "—")
+    if spec.kind == "bool":
+        return "on" if getattr(settings, key) else "off"
+    ids = sorted(getattr(settings, key))
+    fmt = "<@&{}>" if spec.kind == "role_ids" else "<@{}>"
+    return " ".join(fmt.format(i) for i in ids) or "—"
+
+
+def _apply(base: GuildSettings, guild_id: int, version: int, raw: dict[str, str]) -> GuildSettings:
+    values: dict = {}
+    command_ids = dict(base.command_channel_ids)
+    command_names = dict(base.command_channel_names)
+    for key, value_json in raw.items():
+        key = _LEGACY_KEYS.get(key, key)
+        spec = spec_for(key)
+        if spec is None:
+            continue
+        try:
+            value = json.loads(value_json)
+            if key.startswith(COMMAND_CHANNELS_PREFIX):
+                command = key[len(COMMAND_CHANNELS_PREFIX):]
+                command_ids[command] = frozenset(int(i) for i in value)
+                command_names.pop(command, None)
+            elif spec.kind == "channel_ids":
+                # a per-guild list replaces the config.yaml names
+                values[f"{key[:-1]}_ids"] = frozenset(int(i) for i in (value if isinstance(value, list) else [value]))
+                values[f"{key[:-1]}_names"] = ()
+            elif spec.kind == "channel":
+                values[f"{key}_id"] = int(value)
+                values[f"{key}_name"] = None
+            elif spec.kind == "bool":
+                values[key] = bool(value)
+            else:
+                values[key] = frozenset(int(i) for i in value)
+        except (TypeError, ValueError):
+            logger.warning("bad guild setting %s=%r (guild %s)", key, value_json, guild_id)
+    return replace(
+        base,
+        guild_id=guild_id,
+        version=version,
+        overridden=frozenset(_LEGACY_KEYS.get(k, k) for k in raw if spec_for(_LEGACY_KEYS.get(k, k))),
+        command_channel_ids=command_ids,
+        command_channel_names=command_names,
+        **values,
+    )
+
+
+@dataclass
+class _Entry:
+    version: int
+    raw: dict[str, str]
+    settings: GuildSettings
+
+
+class GuildSettingsCache:
+    """
+    In-memory GuildSettings per guild.
+
+    - get() is a dict lookup once a guild is loaded (one indexed read the first time)
+    - set()/reset() write through: the row is stored, then the cached entry is
+      updated in place with the version the store returned
+    - every change bumps the guild's version (a global sequence), and a refresh
+      every `refresh_seconds` drops entries that another bot process changed
+    """
+
+    def __init__(self, store, config: dict, *, refresh_seconds: float = 30.0):
+        self.store = store
+        self.defaults = defaults_from_config(config)
+        self.refresh_seconds = max(1.0, float(refresh_seconds))
+
+        self._entries: dict[int, _Entry] = {}
+        self._loading: dict[int, asyncio.Task] = {}
+        self._seen_version = 0
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def peek(self, guild_id: int) -> GuildSettings | None:
+        entry = self._entries.get(int(guild_id))
+        return entry.settings if entry else None
+
+    async def get(self, guild_id: int) -> GuildSettings:
+        guild_id = int(guild_id)
+        entry = self._entries.get(guild_id)
+        if entry is not None:
+            return entry.settings
+
+        # concurrent misses share one load
+        task = self._loading.get(guild_id)
+        if task is None:
+            task = asyncio.create_task(self._load(guild_id))
+            self._loading[guild_id] = task
+            task.add_done_callback(lambda _t, g=guild_id: self._loading.pop(g, None))
+        return await task
+
+    async def _load(self, guild_id: int) -> GuildSettings:
+        version, raw = await self.store.get_guild_settings(guild_id=guild_id)
+        return self._put(guild_id, version, raw)
+
+    def _put(self, guild_id: int, version: int, raw: dict[str, str]) -> GuildSettings:
+        entry = self._entries.get(guild_id)
+        if entry is not None and entry.version > version:
+            # a newer write landed while this was loading
+            return entry.settings
+        settings = _apply(self.defaults, guild_id, version, raw)
+        self._entries[guild_id] = _Entry(version=version, raw=dict(raw), settings=settings)
+        return settings
+
+    async def set(self, guild_id: int, key: str, value: object, *, updated_by: int | None = None) -> GuildSettings:
+        guild_id = int(guild_id)
+        value_json = json.dumps(value, separators=(",", ":"))
+        version = await self.store.set_guild_setting(
+            guild_id=guild_id, key=key, value=value_json, updated_by=updated_by
+        )
+        return await self._written(guild_id, version, key, value_json)
+
+    async def reset(self, guild_id: int, key: str) -> GuildSettings:
+        guild_id = int(guild_id)
+        for old_key, new_key in _LEGACY_KEYS.items():
+            if new_key == key:
+                await self.store.delete_guild_setting(guild_id=guild_id, key=old_key)
+        version = await self.store.delete_guild_setting(guild_id=guild_id, key=key)
+        return await self._written(guild_id, version, key, None)
+
+    async def _written(self, guild_id: int, version: int, key: str, value_json: str | None) -> GuildSettings:
+        entry = self._entries.get(guild_id)
+        if entry is None or version != self._seen_version + 1:
+            # other changes happened since our last refresh: re-read the guild. Not via
+            # get(): a load already in flight may have read the row before this write
+            self._entries.pop(guild_id, None)
+            return await self._load(guild_id)
+
+        raw = dict(entry.raw)
+        if value_json is None:
+            raw.pop(key, None)
+        else:
+            raw[key] = value_json
+        self._seen_version = version
+        return self._put(guild_id, version, raw)
+
+    def invalidate(self, guild_id: int) -> None:
+        self._entries.pop(int(guild_id), None)
+
+    async def refresh(self) -> int:
+        """
+        Drop entries changed by other processes. Returns how many were dropped.
+        """
+        changes = await self.store.list_guild_settings_changes(since_version=self._seen_version)
+        dropped = 0
+        for guild_id, version in changes:
+            entry = self._entries.get(guild_id)
+            if entry is not None and entry.version < version:
+                del self._entries[guild_id]
+                dropped += 1
+            self._seen_version = max(self._seen_version, version)
+        return dropped
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+                await asyncio.sleep(self.refresh_seconds)
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("GuildSettingsCache refresh failed")
+                await asyncio.sleep(self.refresh_seconds)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import discord
+from discord import app_commands
+
+from src.settings.cache import format_setting, spec_for
+from src.settings.set import setting_keys
+
+
+def register_settings_reset(group: app_commands.Group, client) -> None:
+    async def setting_key_choices(interaction: discord.Interaction, current: str):
+        cur = (current or "").lower()
+        return [app_commands.Choice(name=k, value=k) for k in setting_keys(client) if cur in k][:25]
+
+    @group.command(name="reset", description="Reset one bot setting to the default")
+    @app_commands.checks.has_permissions(manage_guild=True)
+    @app_commands.autocomplete(key=setting_key_choices)
+    @app_commands.describe(key="Setting name")
+    async def reset_cmd(interaction: discord.Interaction, key: str):
+        if interaction.guild is None:
+            await interaction.response.send_message("Please use this in a server channel.", ephemeral=True)
+            return
+
+        if spec_for(key) is None:
+            await interaction.response.send_message(f"⚠️ Unknown setting: `{key}`", ephemeral=True)
+            return
+
+        settings = await client.settings.reset(interaction.guild.id, key)
+        await interaction.response.send_message(
+            f"↩️ **{key}** reset to default: {format_setting(settings, key)}",
+            ephemeral=True,
+        )
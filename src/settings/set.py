@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import discord
+from discord import app_commands
+
+from src.restrictions import restricted_command_names
+from src.settings.cache import COMMAND_CHANNELS_PREFIX, SETTINGS, format_setting, parse_setting_value, spec_for
+
+
+def setting_keys(client) -> list[str]:
+    # fixed keys, then one per-command allow-list per channel-restricted command
+    return list(SETTINGS) + [f"{COMMAND_CHANNELS_PREFIX}{name}" for name in restricted_command_names(client.tree)]
+
+
+def register_settings_set(group: app_commands.Group, client) -> None:
+    async def setting_key_choices(interaction: discord.Interaction, current: str):
+        cur = (current or "").lower()
+        return [app_commands.Choice(name=k, value=k) for k in setting_keys(client) if cur in k][:25]
+
+    @group.command(name="set", description="Change one bot setting for this server")
+    @app_commands.checks.has_permissions(manage_guild=True)
+    @app_commands.autocomplete(key=setting_key_choices)
+    @app_commands.describe(
+        key="Setting name",
+        value="Channel (#mention or ID), true/false, or role/user mentions or IDs",
+    )
+    async def set_cmd(interaction: discord.Interaction, key: str, value: str):
+        if interaction.guild is None:
+            await interaction.response.send_message("Please use this in a server channel.", ephemeral=True)
+            return
+
+        try:
+            parsed = parse_setting_value(key, value)
+        except ValueError as e:
+            await interaction.response.send_message(f"⚠️ {e}", ephemeral=True)
+            return
+
+        if key.startswith(COMMAND_CHANNELS_PREFIX) and key not in setting_keys(client):
+            await interaction.response.send_message(
+                f"⚠️ `{key[len(COMMAND_CHANNELS_PREFIX):]}` is not a channel-restricted command.",
+                ephemeral=True,
+            )
+            return
+
+        kind = spec_for(key).kind
+        channel_ids = [parsed] if kind == "channel" else (parsed if kind == "channel_ids" else [])
+        if any(interaction.guild.get_channel(int(cid)) is None for cid in channel_ids):
+            await interaction.response.send_message("⚠️ That channel is not in this server.", ephemeral=True)
+            return
+
+        settings = await client.settings.set(interaction.guild.id, key, parsed, updated_by=interaction.user.id)
+        await interaction.response.send_message(
+            f"✅ **{key}** = {format_setting(settings, key)}",
+            ephemeral=True,
+        )
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import discord
+from discord import app_commands
+
+from src.settings.cache import COMMAND_CHANNELS_PREFIX, SETTINGS, format_setting
+
+
+def register_settings_show(group: app_commands.Group, client) -> None:
+    @group.command(name="show", description="Show this server's bot settings")
+    @app_commands.checks.has_permissions(manage_guild=True)
+    async def show_cmd(interaction: discord.Interaction):
+        if interaction.guild is None:
+            await interaction.response.send_message("Please use this in a server channel.", ephemeral=True)
+            return
+
+        settings = await client.settings.get(interaction.guild.id)
+
+        embed = discord.Embed(title="⚙️ Server settings")
+        for key, spec in SETTINGS.items():
+            source = "set" if key in settings.overridden else "default"
+            embed.add_field(
+                name=f"{key} ({source})",
+                value=f"{format_setting(settings, key)}\n{spec.description}",
+                inline=False,
+            )
+        for command in sorted(set(settings.command_channel_ids) | set(settings.command_channel_names)):
+            key = f"{COMMAND_CHANNELS_PREFIX}{command}"
+            source = "set" if key in settings.overridden else "default"
+            embed.add_field(name=f"{key} ({source})", value=format_setting(settings, key), inline=False)
+        embed.set_footer(text=f"version {settings.version} · /settings set <key> <value> · /settings reset <key>")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+def shard_for(guild_id: int, shard_count: int) -> int:
+    # Discord's routing rule: (guild_id >> 22) % shard_count
+    return (int(guild_id) >> 22) % int(shard_count)
+
+
+@dataclass(frozen=True)
+class ShardScope:
+    """
+    The shards this process runs. Several bot processes can share one events.db;
+    background work (expiry, reminders, teardown, ads) is partitioned by guild
+    shard, so each guild's rows are handled by exactly one process.
+
+    shard_count=None or shard_ids=None: this process handles every guild.
+    """
+
+    shard_count: int | None = None
+    shard_ids: tuple[int, ...] | None = None
+
+    @classmethod
+    def from_config(cls, cfg: dict) -> "ShardScope":
+        if not cfg.get("enabled"):
+            return cls()
+
+        count = cfg.get("count")
+        ids = cfg.get("ids")
+        count = int(count) if count else None
+        if not ids:
+            return cls(shard_count=count)
+
+        if count is None:
+            raise ValueError("shard.ids needs shard.count")
+        shard_ids = tuple(sorted({int(i) for i in ids}))
+        if shard_ids[0] < 0 or shard_ids[-1] >= count:
+            raise ValueError(f"shard.ids must be within 0..{count - 1}")
+        return cls(shard_count=count, shard_ids=shard_ids)
+
+    @property
+    def partial(self) -> bool:
+        """True when other processes run the remaining shards."""
+        return bool(self.shard_count) and self.shard_ids is not None and len(self.shard_ids) < self.shard_count
+
+    def runs_shard(self, shard_id: int) -> bool:
+        return not self.partial or int(shard_id) in self.shard_ids
+
+    def owns(self, guild_id: int) -> bool:
+        return not self.partial or shard_for(guild_id, self.shard_count) in self.shard_ids
+
+    def sql(self, column: str = "guild_id") -> str:
+        """
+        ' AND <filter>' restricting `column` to this process's shards ('' when unpartitioned).
+        Only ints from the config are inlined, so the statement text stays fixed.
+        """
+        if not self.partial:
+            return ""
+        ids = ", ".join(str(i) for i in self.shard_ids)
+        return f" AND (({column} >> 22) % {int(self.shard_count)}) IN ({ids})"
@@ -0,0 +1,18 @@
+from src.telemetry.logs import JsonFormatter, configure_logging
+from src.telemetry.metrics import REGISTRY, MetricsRegistry
+from src.telemetry.server import MetricsServer
+from src.telemetry.timing import CommandTiming, InstrumentedCommandTree, finish_command, install_http_timing, loop_tick, record_store
+
+__all__ = [
+    "JsonFormatter",
+    "configure_logging",
+    "REGISTRY",
+    "MetricsRegistry",
+    "MetricsServer",
+    "CommandTiming",
+    "InstrumentedCommandTree",
+    "finish_command",
+    "install_http_timing",
+    "loop_tick",
+    "record_store",
+]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+
+# seconds; covers a 1 ms store read up to a 10 s stuck command
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def _labels(labels: dict[str, object] | None) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in (labels or {}).items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _fmt_labels(labels: Labels, extra: tuple[str, str] | None = None) -> str:
+    items = list(labels) + ([extra] if extra else [])
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in items) + "}"
+
+
+class MetricsRegistry:
+    """
+    Minimal Prometheus-style registry: counters and histograms with labels.
+    Thread-safe (store timings are recorded from executor threads).
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._help: dict[str, tuple[str, str]] = {}
+        self._counters: dict[str, dict[Labels, float]] = defaultdict(dict)
+        # name -> labels -> [bucket counts..., sum, count]
+        self._histograms: dict[str, dict[Labels, list[float]]] = defaultdict(dict)
+
+    def describe(self, name: str, kind: str, help_text: str) -> None:
+        self._help[name] = (kind, help_text)
+
+    def inc(self, name: str, value: float = 1.0, labels: dict[str, object] | None = None) -> None:
+        key = _labels(labels)
+        with self._lock:
+            series = self._counters[name]
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, labels: dict[str, object] | None = None) -> None:
+        key = _labels(labels)
+        with self._lock:
+            series = self._histograms[name]
+            h = series.get(key)
+            if h is None:
+                h = series[key] = [0.0] * (len(self.buckets) + 2)
+            for i, le in enumerate(self.buckets):
+                if value <= le:
+                    h[i] += 1
+            h[-2] += value
+            h[-1] += 1
+
+    def render(self) -> str:
+        """
+        Prometheus text exposition format (version 0.0.4).
+        """
+        lines: list[str] = []
+        with self._lock:
+            for name in sorted(self._counters):
+                kind, help_text = self._help.get(name, ("counter", ""))
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{_fmt_labels(labels)} {value:g}")
+
+            for name in sorted(self._histograms):
+                _, help_text = self._help.get(name, ("histogram", ""))
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for labels, h in sorted(self._histograms[name].items()):
+                    for i, le in enumerate(self.buckets):
+                        lines.append(f"{name}_bucket{_fmt_labels(labels, ('le', f'{le:g}'))} {h[i]:g}")
+                    lines.append(f"{name}_bucket{_fmt_labels(labels, ('le', '+Inf'))} {h[-1]:g}")
+                    lines.append(f"{name}_sum{_fmt_labels(labels)} {h[-2]:.6f}")
+                    lines.append(f"{name}_count{_fmt_labels(labels)} {h[-1]:g}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+REGISTRY.describe("dcbot_command_seconds", "histogram", "Slash command latency by phase (dispatch, defer, store, api, total)")
+REGISTRY.describe("dcbot_commands_total", "counter", "Slash commands handled, by status")
+REGISTRY.describe("dcbot_store_seconds", "histogram", "EventStore call time (queue + run), by method")
+REGISTRY.describe("dcbot_store_calls_total", "counter", "EventStore calls, by method and status")
+REGISTRY.describe("dcbot_store_rows_total", "counter", "Rows returned/affected by EventStore calls, by method")
+REGISTRY.describe("dcbot_discord_api_seconds", "histogram", "Discord HTTP request time (rest / interaction)")
+REGISTRY.describe("dcbot_loop_tick_seconds", "histogram", "Background loop tick duration, by loop")
+REGISTRY.describe("dcbot_loop_ticks_total", "counter", "Background loop ticks, by loop and status")
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import logging
+
+from src.telemetry.metrics import REGISTRY, MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsServer:
+    """
+    GET /metrics in the Prometheus text format, served from the bot's event loop.
+    """
+
+    def __init__(self, *, host: str = "127.0.0.1", port: int = 9108, registry: MetricsRegistry = REGISTRY):
+        self.host = host
+        self.port = int(port)
+        self.registry = registry
+        self._runner = None
+
+    async def start(self) -> None:
+        from aiohttp import web
+
+        async def metrics(_request: web.Request) -> web.Response:
+            return web.Response(
+                body=self.registry.render().encode("utf-8"),
+                headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+            )
+
+        app = web.Application()
+        app.router.add_get("/metrics", metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info("metrics endpoint listening", extra={"host": self.host, "port": self.port})
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
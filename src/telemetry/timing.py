@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import contextvars
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+import discord
+from discord import app_commands
+
+from src.telemetry.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# interactions are answered within 3 s; slower first responses fail for the user
+SLOW_DEFER_SECONDS = 2.5
+
+
+@dataclass
+class CommandTiming:
+    command: str
+    started: float = field(default_factory=time.perf_counter)
+    dispatch_seconds: float = 0.0  # Discord created the interaction -> our handler ran
+    defer_seconds: float | None = None  # handler start -> first interaction response sent
+    store_seconds: float = 0.0
+    store_calls: int = 0
+    api_seconds: float = 0.0
+    api_calls: int = 0
+
+
+# the command being handled in this task (store/API timings are added to it)
+_current: contextvars.ContextVar[CommandTiming | None] = contextvars.ContextVar("command_timing", default=None)
+
+
+def _rows(result) -> int:
+    if result is None:
+        return 0
+    if isinstance(result, bool):
+        return int(result)
+    if isinstance(result, int):
+        return result  # rowcount
+    if isinstance(result, (str, bytes)):
+        return 1
+    items = getattr(result, "items", None)
+    if isinstance(items, list):
+        return len(items)  # Page
+    try:
+        return len(result)
+    except TypeError:
+        return 1
+
+
+def record_store(method: str, seconds: float, result=None, *, ok: bool = True) -> None:
+    labels = {"method": method}
+    REGISTRY.observe("dcbot_store_seconds", seconds, labels)
+    REGISTRY.inc("dcbot_store_calls_total", labels={"method": method, "status": "ok" if ok else "error"})
+    if ok:
+        REGISTRY.inc("dcbot_store_rows_total", _rows(result), labels)
+
+    timing = _current.get()
+    if timing is not None:
+        timing.store_seconds += seconds
+        timing.store_calls += 1
+
+
+def record_api(kind: str, seconds: float, *, first_response: bool = False) -> None:
+    REGISTRY.observe("dcbot_discord_api_seconds", seconds, {"kind": kind})
+    timing = _current.get()
+    if timing is not None:
+        timing.api_seconds += seconds
+        timing.api_calls += 1
+        if first_response and timing.defer_seconds is None:
+            timing.defer_seconds = time.perf_counter() - timing.started
+
+
+@contextmanager
+def loop_tick(loop: str):
+    """
+    Time one unit of background work (an expiry batch, a reminder run, a digest send).
+    """
+    t0 = time.perf_counter()
+    status = "ok"
+    try:
+        yield
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        elapsed = time.perf_counter() - t0
+        REGISTRY.observe("dcbot_loop_tick_seconds", elapsed, {"loop": loop})
+        REGISTRY.inc("dcbot_loop_ticks_total", labels={"loop": loop, "status": status})
+        logger.debug("loop tick", extra={"loop": loop, "status": status, "ms": round(elapsed * 1000, 3)})
+
+
+class InstrumentedCommandTree(app_commands.CommandTree):
+    """
+    CommandTree that times every slash command: dispatch delay, time to the
+    first response (defer), store and Discord API time, and total. One JSON log
+    line per command; a warning when the first response came too late.
+    """
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.type == discord.InteractionType.application_command:
+            timing = CommandTiming(command=interaction.command.qualified_name if interaction.command else "?")
+            created = getattr(interaction, "created_at", None)
+            if created is not None:
+                timing.dispatch_seconds = max(0.0, (datetime.now(timezone.utc) - created).total_seconds())
+            _current.set(timing)
+            interaction.extras["timing"] = timing
+        return True
+
+    async def on_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError) -> None:
+        # failed checks are an expected outcome (the check already answered)
+        status = "rejected" if isinstance(error, app_commands.CheckFailure) else "error"
+        finish_command(interaction, status)
+        if status == "error":
+            await super().on_error(interaction, error)
+
+
+def finish_command(interaction: discord.Interaction, status: str = "ok") -> None:
+    timing: CommandTiming | None = interaction.extras.pop("timing", None)
+    if timing is None:
+        return
+    total = time.perf_counter() - timing.started
+    labels = {"command": timing.command}
+
+    REGISTRY.inc("dcbot_commands_total", labels={"command": timing.command, "status": status})
+    REGISTRY.observe("dcbot_command_seconds", total, {**labels, "phase": "total"})
+    REGISTRY.observe("dcbot_command_seconds", timing.dispatch_seconds, {**labels, "phase": "dispatch"})
+    REGISTRY.observe("dcbot_command_seconds", timing.store_seconds, {**labels, "phase": "store"})
+    REGISTRY.observe("dcbot_command_seconds", timing.api_seconds, {**labels, "phase": "api"})
+    if timing.defer_seconds is not None:
+        REGISTRY.observe("dcbot_command_seconds", timing.defer_seconds, {**labels, "phase": "defer"})
+
+    slow = timing.dispatch_seconds + (timing.defer_seconds if timing.defer_seconds is not None else total)
+    logger.log(
+        logging.WARNING if slow >= SLOW_DEFER_SECONDS else logging.INFO,
+        "command",
+        extra={
+            "command": timing.command,
+            "status": status,
+            "guild_id": interaction.guild_id,
+            "total_ms": round(total * 1000, 3),
+            "dispatch_ms": round(timing.dispatch_seconds * 1000, 3),
+            "defer_ms": None if timing.defer_seconds is None else round(timing.defer_seconds * 1000, 3),
+            "store_ms": round(timing.store_seconds * 1000, 3),
+            "store_calls": timing.store_calls,
+            "api_ms": round(timing.api_seconds * 1000, 3),
+            "api_calls": timing.api_calls,
+        },
+    )
+
+
+def install_http_timing(client: discord.Client) -> None:
+    """
+    Time Discord HTTP calls: bot REST requests (client.http) and interaction
+    responses/followups (sent through the webhook adapter).
+
+    Must run in the task that later connects to the gateway (setup_hook), so the
+    adapter set here is inherited by the event handler tasks.
+    """
+    http_request = client.http.request
+
+    async def timed_request(route, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return await http_request(route, **kwargs)
+        finally:
+            record_api("rest", time.perf_counter() - t0)
+
+    client.http.request = timed_request
+
+    try:
+        from discord.webhook.async_ import AsyncWebhookAdapter, async_context
+    except ImportError:
+        logger.info("interaction response timing unavailable in this discord.py version")
+        return
+
+    class TimedWebhookAdapter(AsyncWebhookAdapter):
+        async def request(self, route, *args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return await super().request(route, *args, **kwargs)
+            finally:
+                # POST /interactions/{id}/{token}/callback is the initial response (or defer)
+                first = getattr(route, "method", "") == "POST" and getattr(route, "path", "").endswith("/callback")
+                record_api("interaction", time.perf_counter() - t0, first_response=first)
+
+    async_context.set(TimedWebhookAdapter())
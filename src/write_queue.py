@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from src.telemetry.timing import record_store
+
+if TYPE_CHECKING:
+    from src.async_store import AsyncEventStore
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WriteQueueMetrics:
+    writes: int = 0
+    failed: int = 0
+    batches: int = 0
+    max_batch: int = 0
+    full_waits: int = 0  # submitters that waited for room in the queue
+
+    def as_dict(self) -> dict:
+        return {
+            "writes": self.writes,
+            "failed": self.failed,
+            "batches": self.batches,
+            "avg_batch": round(self.writes / self.batches, 2) if self.batches else 0.0,
+            "max_batch": self.max_batch,
+            "full_waits": self.full_waits,
+        }
+
+
+class GroupCommitQueue:
+    """
+    Write-behind queue for the small EventStore writes in EventStore.GROUP_COMMIT
+    (/multimedia watch, category options, reminded flags).
+
+    Writes arriving within `window_seconds` of each other are committed together
+    by EventStore.group_commit: one transaction and one writer-lock handoff for
+    the whole batch instead of one per call. Every submit() resolves only after
+    its batch committed, so a command that confirms a write still means it is on
+    disk. At most `max_pending` writes wait at once; further submitters block
+    until a batch is done (back-pressure).
+    """
+
+    def __init__(
+        self,
+        store: "AsyncEventStore",
+        *,
+        window_seconds: float = 0.005,
+        max_batch: int = 256,
+        max_pending: int = 1024,
+    ):
+        self.store = store
+        self.window_seconds = max(0.0, float(window_seconds))
+        self.max_batch = max(1, int(max_batch))
+        self.max_pending = max(1, int(max_pending))
+        self.metrics = WriteQueueMetrics()
+
+        self._pending: list[tuple[str, dict, asyncio.Future]] = []
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._closing = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._closing
+
+    def start(self) -> None:
+        # started from setup_hook, so the flusher task carries no command's context
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """
+        Stop taking writes and commit everything still queued.
+        """
+        self._closing = True
+        self._wake.set()
+        if self._task is not None:
+            await self._task
+
+    async def submit(self, method: str, **kwargs):
+        """
+        Queue one write; returns what the EventStore method returns once committed.
+        """
+        if self._closing:
+            raise RuntimeError("write queue is closed")
+        t0 = time.perf_counter()
+        if self._slots.locked():
+            self.metrics.full_waits += 1
+        await self._slots.acquire()
+
+        fut = asyncio.get_running_loop().create_future()
+        self._pending.append((method, kwargs, fut))
+        self._wake.set()
+        try:
+            # shield: a cancelled command does not take its write out of the batch
+            result = await asyncio.shield(fut)
+        except BaseException:
+            record_store(method, time.perf_counter() - t0, ok=False)
+            raise
+        record_store(method, time.perf_counter() - t0, result)
+        return result
+
+    async def _run(self) -> None:
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            # let concurrent writers join the batch
+            if not self._closing and len(self._pending) < self.max_batch and self.window_seconds:
+                await asyncio.sleep(self.window_seconds)
+            while self._pending:
+                batch = self._pending[: self.max_batch]
+                del self._pending[: self.max_batch]
+                await self._flush(batch)
+            if self._closing:
+                return
+
+    async def _flush(self, batch: list[tuple[str, dict, asyncio.Future]]) -> None:
+        m = self.metrics
+        m.batches += 1
+        m.max_batch = max(m.max_batch, len(batch))
+        try:
+            results = await self.store.run(self.store.sync.group_commit, [(name, kw) for name, kw, _ in batch])
+        except Exception as e:
+            # the transaction itself failed (e.g. disk I/O): nothing in it committed
+            logger.exception("group commit of %d writes failed", len(batch))
+            results = [e] * len(batch)
+
+        for (_, _, fut), result in zip(batch, results):
+            m.writes += 1
+            if isinstance(result, Exception):
+                m.failed += 1
+                fut.set_exception(result)
+            else:
+                fut.set_result(result)
+            self._slots.release()
@@ -0,0 +1,10 @@
+from src.query_plan import check_query_plans
+
+
+def test_store_queries_use_indexes():
+    results = check_query_plans()
+    # the trace callback captured the store's statements at all
+    assert len(results) > 50
+
+    bad = {" ".join(r.sql.split()): r.full_scans for r in results if r.full_scans}
+    assert not bad, "\n".join(f"{sql}\n    {scans}" for sql, scans in bad.items())